@@ -0,0 +1,29 @@
+"""
+미리 구워둔 애니메이션 프레임
+크기별로 프레임 시퀀스를 한 번만 그려 두고 모든 애니메이션이 같이 쓴다.
+프레임 전환 시각은 scheduler.Scheduler 이벤트로 예약한다.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import pygame
+
+
+# (크기, 색상들) -> 프레임 목록
+_circle_frames: Dict[Tuple[int, Tuple], List[pygame.Surface]] = {}
+
+
+def circle_frames(size: int, colors: Sequence[Tuple[int, int, int]]) -> List[pygame.Surface]:
+    """색상마다 원 하나씩 그린 프레임 시퀀스 (크기별로 한 번만 생성)"""
+    key = (size, tuple(colors))
+    frames = _circle_frames.get(key)
+    if frames is None:
+        frames = []
+        for color in colors:
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(image, color, (size // 2, size // 2), size // 2)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            frames.append(image)
+        _circle_frames[key] = frames
+    return frames
@@ -0,0 +1,176 @@
+"""
+에셋 로더
+- 경로는 게임 폴더의 assets/ (또는 --asset-dir / SHOOTER_ASSET_DIR) 기준으로 찾음
+- 사운드/이미지 디코딩은 백그라운드 스레드에서 병렬로 진행하고
+  메인 스레드는 로딩 화면을 그림
+- 파일이 없거나 깨졌으면 대체 에셋도 워커 스레드에서 만들어 사용
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = os.environ.get("SHOOTER_ASSET_DIR", os.path.join(HERE, "assets"))
+WORKERS = 4
+
+
+def resolve(path: str, base_dir: Optional[str] = None) -> str:
+    """상대 경로를 에셋 폴더 기준 절대 경로로"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(base_dir or ASSET_DIR, path)
+
+
+def placeholder_sound(preset: str) -> pygame.mixer.Sound:
+    """대체 효과음 (합성 가능하면 합성음, 아니면 무음)"""
+    try:
+        import synth
+    except ImportError:
+        return pygame.mixer.Sound(buffer=bytes(4096))
+    return synth.make_sound(synth.PRESETS[preset])
+
+
+def placeholder_image(size=(32, 32)) -> pygame.Surface:
+    """대체 이미지 (눈에 띄는 분홍/검정 체크 무늬)"""
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill((255, 0, 255))
+    half_w, half_h = size[0] // 2, size[1] // 2
+    image.fill((0, 0, 0), (0, 0, half_w, half_h))
+    image.fill((0, 0, 0), (half_w, half_h, size[0] - half_w, size[1] - half_h))
+    return image
+
+
+def _load_sound(path: str) -> pygame.mixer.Sound:
+    return pygame.mixer.Sound(path)
+
+
+def _load_image(path: str) -> pygame.Surface:
+    return pygame.image.load(path)
+
+
+def _check_file(path: str) -> str:
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    return path
+
+
+def _run_job(loader: Callable, path: str, fallback: Optional[Callable]) -> tuple:
+    """워커 스레드에서 에셋 읽기 (실패하면 대체 에셋도 여기서 만듦) -> (결과, 대체 여부)"""
+    try:
+        return loader(path), False
+    except (OSError, pygame.error):
+        if fallback is None:
+            raise
+        return fallback(), True
+
+
+class AssetLoader:
+    """백그라운드 에셋 로더
+
+    필수(required) 에셋만 로딩 화면에서 기다리고, 나머지는 게임 중에
+    get()을 처음 호출할 때까지 계속 뒤에서 읽는다.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None, workers: int = WORKERS):
+        self.base_dir = base_dir or ASSET_DIR
+        self.workers = workers
+        self._jobs: Dict[str, dict] = {}
+        self._results: Dict[str, object] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.missing: List[str] = []  # 대체 에셋을 쓴 항목
+
+    def _add(self, name: str, loader: Callable, filename: str,
+             fallback: Optional[Callable], required: bool):
+        self._jobs[name] = {"loader": loader, "path": resolve(filename, self.base_dir),
+                            "fallback": fallback, "required": required, "future": None}
+
+    def add_sound(self, name: str, filename: str, fallback: Optional[Callable] = None,
+                  required: bool = True):
+        """효과음 등록 (fallback: 실패 시 대체 Sound를 만드는 함수)"""
+        self._add(name, _load_sound, filename, fallback, required)
+
+    def add_image(self, name: str, filename: str, fallback: Optional[Callable] = None,
+                  required: bool = True):
+        """이미지 등록 (화면이 있으면 get() 때 convert_alpha)"""
+        self._add(name, _load_image, filename, fallback or placeholder_image, required)
+
+    def add_file(self, name: str, filename: str, required: bool = False):
+        """존재 여부만 확인할 파일 (예: 스트리밍 재생할 음악), 없으면 None"""
+        self._add(name, _check_file, filename, lambda: None, required)
+
+    def start(self):
+        """모든 에셋을 백그라운드에서 읽기 시작"""
+        self._executor = ThreadPoolExecutor(max_workers=max(1, self.workers),
+                                            thread_name_prefix="assets")
+        for job in self._jobs.values():
+            job["future"] = self._executor.submit(_run_job, job["loader"], job["path"],
+                                                  job["fallback"])
+
+    def _required(self) -> List[Future]:
+        return [job["future"] for job in self._jobs.values() if job["required"]]
+
+    def progress(self) -> float:
+        """필수 에셋 로딩 진행률 (0~1)"""
+        futures = self._required()
+        if not futures:
+            return 1.0
+        return sum(future.done() for future in futures) / len(futures)
+
+    def ready(self) -> bool:
+        """필수 에셋이 모두 끝났는지"""
+        return all(future.done() for future in self._required())
+
+    def get(self, name: str):
+        """에셋 반환 (아직 읽는 중이면 기다림, 실패했으면 워커가 만들어 둔 대체 에셋)"""
+        if name in self._results:
+            return self._results[name]
+        job = self._jobs[name]
+        if job["future"] is None:
+            raise RuntimeError("start()를 먼저 호출해야 합니다")
+        try:
+            result, replaced = job["future"].result()
+        except (OSError, pygame.error):
+            self.missing.append(job["path"])
+            raise
+        if replaced:
+            self.missing.append(job["path"])
+        # 디스플레이 포맷 변환은 메인 스레드에서
+        if isinstance(result, pygame.Surface) and pygame.display.get_surface() is not None:
+            result = result.convert_alpha()
+        self._results[name] = result
+        return result
+
+    def shutdown(self):
+        """로더 스레드 정리"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def show_loading(screen: Optional[pygame.Surface], loader: AssetLoader, fps: int = 60):
+    """필수 에셋이 끝날 때까지 진행 막대를 그림 (screen이 None이면 그냥 기다림)"""
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 24) if screen is not None else None
+    while not loader.ready():
+        if screen is None:
+            clock.tick(1000)
+            continue
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                loader.shutdown()
+                pygame.quit()
+                raise SystemExit
+        width, height = screen.get_size()
+        bar = pygame.Rect(width // 6, height // 2, width * 2 // 3, 16)
+        screen.fill((0, 0, 0))
+        pygame.draw.rect(screen, (255, 255, 255), bar, 1)
+        fill = bar.inflate(-4, -4)
+        fill.width = int(fill.width * loader.progress())
+        pygame.draw.rect(screen, (255, 255, 255), fill)
+        text = font.render("Loading... %d%%" % (loader.progress() * 100), True, (255, 255, 255))
+        screen.blit(text, text.get_rect(midbottom=(width // 2, bar.top - 8)))
+        pygame.display.flip()
+        clock.tick(fps)
@@ -0,0 +1,113 @@
+"""
+패럴랙스 스크롤 배경
+바다, 물결 반짝임, 구름 층을 각각 세로로 이어지는 타일 하나로 미리 그려 두고
+매 프레임에는 층마다 위치만 바꿔 두 번씩 blit한다 (아래로 밀려난 부분을 위에 이어 붙임).
+프레임마다 Surface를 만들거나 점 하나하나를 그리지 않으므로
+층을 아무리 자세히 그려도 프레임당 그리기 비용은 같다.
+"""
+
+import random
+from typing import Callable, List, Sequence, Tuple
+
+import pygame
+
+SEED = 1945  # 배경 배치용 시드 (게임 난수와 별개라 결과에 영향 없음)
+COLORKEY = (255, 0, 255)  # 투명 층의 빈 부분
+
+SEA_TOP = (10, 40, 90)
+SEA_BOTTOM = (20, 70, 130)
+WAVE = (40, 100, 160)
+SPARKLE = (170, 210, 240)
+CLOUD = (235, 240, 245)
+CLOUD_ALPHA = 110
+
+
+def _wrapped(y: int, height: int) -> Tuple[int, ...]:
+    """타일 경계에 걸친 모양도 이어지도록 위/아래에 한 번 더 그릴 y 좌표들"""
+    return (y, y - height, y + height)
+
+
+def sea_tile(size: Tuple[int, int], rng: random.Random) -> pygame.Surface:
+    """바다: 세로 그라데이션 + 짧은 물결선 (불투명)"""
+    width, height = size
+    tile = pygame.Surface(size)
+    # 위아래가 같은 색이 되도록 가운데가 가장 밝은 그라데이션
+    for y in range(height):
+        t = 1.0 - abs(2.0 * y / height - 1.0)
+        color = [int(a + (b - a) * t) for a, b in zip(SEA_TOP, SEA_BOTTOM)]
+        tile.fill(color, (0, y, width, 1))
+    for _ in range(width * height // 1500):
+        x, y = rng.randrange(width), rng.randrange(height)
+        length = rng.randrange(8, 24)
+        for wy in _wrapped(y, height):
+            pygame.draw.arc(tile, WAVE, (x, wy, length, 6), 0.3, 2.8, 1)
+    return tile
+
+
+def sparkle_tile(size: Tuple[int, int], rng: random.Random) -> pygame.Surface:
+    """물결 반짝임: 흩어진 작은 점들 (컬러키 투명)"""
+    width, height = size
+    tile = pygame.Surface(size)
+    tile.fill(COLORKEY)
+    for _ in range(width * height // 1200):
+        x, y = rng.randrange(width), rng.randrange(height)
+        radius = rng.choice((1, 1, 1, 2))
+        for wy in _wrapped(y, height):
+            pygame.draw.circle(tile, SPARKLE, (x, wy), radius)
+    tile.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return tile
+
+
+def cloud_tile(size: Tuple[int, int], rng: random.Random) -> pygame.Surface:
+    """구름: 타원 뭉치 (컬러키 + 반투명)"""
+    width, height = size
+    tile = pygame.Surface(size)
+    tile.fill(COLORKEY)
+    for _ in range(max(1, height // 90)):
+        cx, cy = rng.randrange(width), rng.randrange(height)
+        for _ in range(rng.randrange(4, 8)):
+            w, h = rng.randrange(40, 110), rng.randrange(20, 45)
+            x = cx + rng.randrange(-50, 50) - w // 2
+            y = cy + rng.randrange(-20, 20) - h // 2
+            for wy in _wrapped(y, height):
+                pygame.draw.ellipse(tile, CLOUD, (x, wy, w, h))
+    tile.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    tile.set_alpha(CLOUD_ALPHA, pygame.RLEACCEL)
+    return tile
+
+
+# 층 목록 (아래층부터): (타일을 그리는 함수, 스크롤 속도 px/초)
+LAYERS: List[Tuple[Callable[[Tuple[int, int], random.Random], pygame.Surface], float]] = [
+    (sea_tile, 30.0),
+    (sparkle_tile, 45.0),
+    (cloud_tile, 120.0),
+]
+
+
+class ParallaxBackground:
+    """미리 그린 층 타일을 시간에 따라 세로로 감아 그리는 배경"""
+
+    def __init__(self, size: Tuple[int, int], layers: Sequence[tuple] = LAYERS,
+                 seed: int = SEED):
+        rng = random.Random(seed)
+        has_display = pygame.display.get_surface() is not None
+        self.layers: List[Tuple[pygame.Surface, float, int]] = []
+        for build, speed in layers:
+            tile = build(size, rng)
+            if has_display:
+                # 화면 포맷으로 변환 후 컬러키/알파를 RLE 가속으로 다시 설정
+                colorkey, alpha = tile.get_colorkey(), tile.get_alpha()
+                tile = tile.convert()
+                if colorkey is not None:
+                    tile.set_colorkey(colorkey, pygame.RLEACCEL)
+                if alpha is not None:
+                    tile.set_alpha(alpha, pygame.RLEACCEL)
+            self.layers.append((tile, speed, tile.get_height()))
+
+    def draw(self, surface: pygame.Surface, time_ms: float):
+        """time_ms 시점의 배경을 그림 (첫 층이 불투명하면 fill 필요 없음)"""
+        for tile, speed, height in self.layers:
+            y = int(time_ms * speed / 1000.0) % height
+            surface.blit(tile, (0, y))
+            if y:
+                surface.blit(tile, (0, y - height))
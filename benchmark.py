@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+슈팅 게임 스트레스 벤치마크
+각 게임 버전을 헤드리스 모드로 별도 프로세스에서 실행해 시나리오별
+FPS, 프레임 시간 p50/p95/p99, 최대 메모리를 측정하고 저장된 기준값과 비교한다.
+기준값은 측정한 컴퓨터에 따라 다르므로 저장소에 넣지 않는다. 처음 한 번(또는 컴퓨터를
+바꾼 뒤) --save-baseline으로 benchmark_baseline.json을 만든 다음부터 비교할 수 있다.
+
+    python benchmark.py --save-baseline    # 처음 한 번: 결과를 기준값으로 저장
+    python benchmark.py                    # 전체 실행 후 기준값과 비교
+    python benchmark.py --variants simplified --scenarios bullets_5000
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict, Optional
+
+import profiler
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(HERE, "benchmark_baseline.json")
+FRAMES = 600
+REGRESSION_THRESHOLD = 0.10  # 기준값보다 10% 이상 나빠지면 회귀로 표시
+
+# 이름 -> (모듈, 추가 실행 옵션)
+VARIANTS = {
+    "game": ("game", []),
+    "improved": ("game_improved", []),
+    "with_sound": ("game_with_sound", []),
+    "simplified": ("game_with_sound_simplified", []),
+    "simplified_engine": ("game_with_sound_simplified", ["--bullet-engine"]),
+}
+
+SCENARIOS = ("idle", "enemies_200", "bullets_5000", "explosion_volley", "boss_hell")
+
+
+class ScenarioSkipped(Exception):
+    """이 버전에는 해당 시나리오가 없음 (측정하지 않고 건너뜀)"""
+
+
+# ----- 시나리오 (자식 프로세스에서 게임 상태를 직접 조작) -----
+# state는 World 객체가 있는 버전이면 그 월드, 아니면 게임 모듈 자체 (전역 상태)
+
+def _add(state, sprite, *groups):
+    state.all_sprites.add(sprite)
+    for group in groups:
+        group.add(sprite)
+
+
+def _spawn_enemy_bullet(game, state, x, y, bullet_type):
+    """버전에 맞는 방식(총알 엔진 / 풀 / 생성자)으로 적 총알 추가"""
+    engine = getattr(state, "enemy_shots", None)
+    if engine is not None:
+        engine.spawn(x - 5, y, 0, state.rng.randrange(3, 6), bullet_type)
+        return
+    pool = getattr(state, "enemy_bullet_pool", None)
+    bullet = pool.acquire(x, y, bullet_type) if pool else game.EnemyBullet(x, y, bullet_type)
+    _add(state, bullet, state.enemy_bullets)
+
+
+def _enemy_bullet_count(state) -> int:
+    engine = getattr(state, "enemy_shots", None)
+    return len(state.enemy_bullets) + (len(engine) if engine is not None else 0)
+
+
+def setup_scenario(game, scenario: str):
+    """시나리오 초기 상태 구성, 매 프레임 호출할 함수 반환 (없으면 None)"""
+    state = getattr(game, "world", game)
+    # 플레이어는 화면 밖에 두어 죽지 않게 함 (측정 대상은 월드 비용)
+    state.player.rect.topleft = (-1000, -1000)
+    rng = random.Random(1945)
+
+    if scenario == "idle":
+        return None
+
+    if scenario == "enemies_200":
+        for _ in range(192):
+            if hasattr(state, "spawn_enemy"):
+                state.spawn_enemy()
+            else:
+                _add(state, game.Enemy(), state.enemies)
+        for enemy in state.enemies:
+            if hasattr(enemy, "shoot_delay"):
+                enemy.shoot_delay = 200
+                if hasattr(enemy, "schedule_shot"):
+                    enemy.schedule_shot()
+        return None
+
+    if scenario == "bullets_5000":
+        if not hasattr(state, "enemy_bullets"):
+            raise ScenarioSkipped("적 총알이 없는 버전")
+
+        def top_up(frame):
+            for _ in range(5000 - _enemy_bullet_count(state)):
+                _spawn_enemy_bullet(game, state, rng.randrange(game.WIDTH),
+                                    rng.randrange(-10, game.HEIGHT), rng.randint(0, 3))
+        top_up(0)
+        return top_up
+
+    if scenario == "explosion_volley":
+        pool = getattr(state, "explosion_pool", None)
+        if pool is None and not hasattr(game, "Explosion"):
+            raise ScenarioSkipped("폭발 효과가 없는 버전")
+
+        def volley(frame):
+            # 0.5초마다 적 200기가 한꺼번에 격추된 만큼 폭발 생성
+            if frame % 30 == 0:
+                for _ in range(200):
+                    center = (rng.randrange(game.WIDTH), rng.randrange(game.HEIGHT))
+                    _add(state, pool.acquire(center, 30) if pool else game.Explosion(center, 30))
+        return volley
+
+    if scenario == "boss_hell":
+        if not hasattr(state, "spawn_boss"):
+            raise ScenarioSkipped("보스가 없는 버전")
+        # 마지막 단계 보스 4기가 등장 위치에서 바로 탄막 발사 (화면에 수천 발 유지)
+        for x in (60, 180, 300, 420):
+            boss = state.spawn_boss("battleship", x)
+            boss.rect.centery = boss.spec["y"]
+            while boss.phase + 1 < len(boss.spec["phases"]):
+                boss.next_phase()
+        return None
+
+    raise ValueError("알 수 없는 시나리오: %s" % scenario)
+
+
+def run_child(variant: str, scenario: str, frames: int) -> Dict:
+    """자식 프로세스: 게임 모듈을 헤드리스로 불러와 시나리오 측정"""
+    module, extra = VARIANTS[variant]
+    sys.argv = [module + ".py", "--headless", "--seed", "0", *extra]
+    game = importlib.import_module(module)
+    per_frame = setup_scenario(game, scenario)
+
+    times = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        game.clock.tick()
+        if per_frame is not None:
+            per_frame(frame)
+        # 게임 오버 여부와 상관없이 계속 진행
+        game.step(0)
+        game.draw()
+        times.append((time.perf_counter() - start) * 1000.0)
+
+    times.sort()
+    total = sum(times)
+    return {
+        "fps": frames * 1000.0 / total if total > 0 else 0.0,
+        "p50": profiler.percentile(times, 50),
+        "p95": profiler.percentile(times, 95),
+        "p99": profiler.percentile(times, 99),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+# ----- 부모 프로세스 -----
+
+def run_case(variant: str, scenario: str, frames: int) -> Dict:
+    """한 (버전, 시나리오)를 별도 프로세스로 실행"""
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child",
+                           variant, scenario, str(frames)],
+                          cwd=HERE, capture_output=True, text=True)
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        error = (proc.stderr.strip().splitlines() or ["error"])[-1]
+        return {"error": error}
+    return json.loads(lines[-1])
+
+
+def load_baseline(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(result: Dict, base: Optional[Dict]) -> str:
+    """기준값 대비 변화율 (fps는 낮아지면, 시간/메모리는 높아지면 회귀)"""
+    if not base or "error" in base or "error" in result:
+        return ""
+    notes = []
+    for key, higher_is_better in (("fps", True), ("p99", False), ("peak_rss_kb", False)):
+        if not base.get(key):
+            continue
+        change = (result[key] - base[key]) / base[key]
+        worse = -change if higher_is_better else change
+        mark = " REGRESSION" if worse > REGRESSION_THRESHOLD else ""
+        notes.append("%s %+.1f%%%s" % (key, change * 100, mark))
+    return "  ".join(notes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="슈팅 게임 스트레스 벤치마크")
+    parser.add_argument("--variants", nargs="*", default=list(VARIANTS), choices=list(VARIANTS))
+    parser.add_argument("--scenarios", nargs="*", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="기준값 파일 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="회귀가 있으면 종료 코드 1")
+    parser.add_argument("--child", nargs=3, metavar=("VARIANT", "SCENARIO", "FRAMES"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        variant, scenario, frames = args.child
+        try:
+            result = run_child(variant, scenario, int(frames))
+        except ScenarioSkipped as e:
+            result = {"skipped": str(e)}
+        print(json.dumps(result))
+        return
+
+    baseline = load_baseline(args.baseline)
+    if not baseline and not args.save_baseline:
+        print("기준값 파일이 없어 비교하지 않음: %s (먼저 --save-baseline으로 저장)" % args.baseline)
+    results: Dict[str, Dict] = {}
+    regressions = 0
+    print("%-18s %-17s %8s %8s %8s %8s %10s" % ("variant", "scenario", "fps",
+                                                "p50 ms", "p95 ms", "p99 ms", "peak MB"))
+    for variant in args.variants:
+        for scenario in args.scenarios:
+            key = "%s/%s" % (variant, scenario)
+            result = run_case(variant, scenario, args.frames)
+            results[key] = result
+            if "error" in result or "skipped" in result:
+                print("%-18s %-17s %s" % (variant, scenario,
+                                          result.get("skipped") or "error: " + result["error"]))
+                continue
+            note = compare(result, baseline.get(key))
+            regressions += note.count("REGRESSION")
+            print("%-18s %-17s %8.0f %8.3f %8.3f %8.3f %10.1f  %s" % (
+                variant, scenario, result["fps"], result["p50"], result["p95"],
+                result["p99"], result["peak_rss_kb"] / 1024.0, note))
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+        print("기준값 저장: %s" % args.baseline)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
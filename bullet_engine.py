@@ -0,0 +1,239 @@
+"""
+NumPy 구조체 배열(SoA) 총알 엔진
+총알마다 스프라이트를 만드는 대신 위치/속도/종류를 배열로 보관하고
+이동, 화면 밖 제거, 충돌 검사를 벡터 연산으로 한 번에 처리한다.
+그리기는 캐시된 모양 이미지로 Surface.blits 한 번에 끝낸다.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+import collision
+
+
+class BulletEngine:
+    """같은 편 총알 전체를 배열로 관리"""
+
+    def __init__(self, images: Sequence[pygame.Surface], bounds: pygame.Rect,
+                 capacity: int = 1024):
+        # 종류별 이미지와 크기
+        self.images = np.empty(len(images), dtype=object)
+        self.images[:] = list(images)
+        self.widths = np.array([image.get_width() for image in images], dtype=np.float64)
+        self.heights = np.array([image.get_height() for image in images], dtype=np.float64)
+        self.masks = [collision.mask_for(image) for image in images]  # 종류별 마스크 (캐시 공유)
+        self.bounds = pygame.Rect(bounds)
+
+        self.count = 0
+        self.x = np.zeros(capacity)   # 왼쪽
+        self.y = np.zeros(capacity)   # 위쪽
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, extra: int):
+        """배열이 모자라면 두 배씩 늘림"""
+        needed = self.count + extra
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("x", "y", "vx", "vy", "kind"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, kind: int = 0):
+        """총알 하나 추가 (x, y: 왼쪽 위 좌표)"""
+        self._reserve(1)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.kind[i] = kind
+        self.count = i + 1
+
+    def spawn_many(self, x, y, vx, vy, kind):
+        """여러 발을 배열 단위로 한 번에 추가"""
+        x = np.asarray(x, dtype=np.float64)
+        n = x.size
+        if n == 0:
+            return
+        self._reserve(n)
+        start, end = self.count, self.count + n
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.kind[start:end] = kind
+        self.count = end
+
+    def _keep(self, mask: np.ndarray):
+        """mask가 True인 총알만 순서대로 남김"""
+        n = int(mask.sum())
+        if n == self.count:
+            return
+        for name in ("x", "y", "vx", "vy", "kind"):
+            array = getattr(self, name)
+            array[:n] = array[:self.count][mask]
+        self.count = n
+
+    def clear(self):
+        """모든 총알 제거"""
+        self.count = 0
+
+    def update(self):
+        """이동 후 화면 밖으로 완전히 나간 총알 제거"""
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        kind = self.kind[:n]
+        bounds = self.bounds
+        inside = ((y + self.heights[kind] >= bounds.top) & (y <= bounds.bottom) &
+                  (x + self.widths[kind] >= bounds.left) & (x <= bounds.right))
+        self._keep(inside)
+
+    def _overlap(self, left, top, right, bottom) -> np.ndarray:
+        """사각형(들)과 겹치는지 (pygame.Rect.colliderect와 같은 기준)"""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        kind = self.kind[:n]
+        if np.ndim(left):
+            x, y, kind = x[:, None], y[:, None], kind[:, None]
+        return ((x < right) & (x + self.widths[kind] > left) &
+                (y < bottom) & (y + self.heights[kind] > top))
+
+    def collide_rect(self, rect: pygame.Rect, dokill: bool) -> int:
+        """rect와 겹치는 총알 수 (dokill이면 제거)"""
+        if self.count == 0:
+            return 0
+        hits = self._overlap(rect.left, rect.top, rect.right, rect.bottom)
+        count = int(hits.sum())
+        if count and dokill:
+            self._keep(~hits)
+        return count
+
+    def collide_mask(self, rect: pygame.Rect, mask: pygame.mask.Mask, dokill: bool) -> int:
+        """rect 위치의 mask와 픽셀이 겹치는 총알 수 (사각형으로 후보를 고른 뒤 마스크 확인)"""
+        if self.count == 0:
+            return 0
+        hits = self._overlap(rect.left, rect.top, rect.right, rect.bottom)
+        for i in np.flatnonzero(hits):
+            # 그릴 때와 같이 정수 좌표로 잘라서 비교
+            offset = (int(self.x[i]) - rect.x, int(self.y[i]) - rect.y)
+            if mask.overlap(self.masks[self.kind[i]], offset) is None:
+                hits[i] = False
+        count = int(hits.sum())
+        if count and dokill:
+            self._keep(~hits)
+        return count
+
+    def collide_group(self, group, dokill: bool = True) -> List[Tuple[Tuple[int, int], list]]:
+        """그룹 스프라이트와 충돌 검사 (groupcollide(bullets, group, True, dokill)와 동일한 순서)
+
+        (맞은 총알 중심 좌표, 맞은 스프라이트 목록) 목록을 반환한다.
+        """
+        sprites = group.sprites()
+        if self.count == 0 or not sprites:
+            return []
+        rects = np.array([tuple(sprite.rect) for sprite in sprites], dtype=np.float64)
+        left, top = rects[:, 0], rects[:, 1]
+        right, bottom = left + rects[:, 2], top + rects[:, 3]
+        matrix = self._overlap(left, top, right, bottom)
+
+        rows = np.flatnonzero(matrix.any(axis=1))
+        if rows.size == 0:
+            return []
+        dead = np.zeros(len(sprites), dtype=bool)
+        keep = np.ones(self.count, dtype=bool)
+        crashed = []
+        for i in rows:
+            # 앞선 총알에 이미 제거된 스프라이트는 제외 (dokill이 아니면 겹친 총알마다 맞음)
+            cols = np.flatnonzero(matrix[i] & ~dead)
+            if cols.size == 0:
+                continue
+            if dokill:
+                dead[cols] = True
+            keep[i] = False
+            kind = self.kind[i]
+            center = (int(self.x[i] + self.widths[kind] // 2),
+                      int(self.y[i] + self.heights[kind] // 2))
+            hit = [sprites[c] for c in cols]
+            if dokill:
+                for sprite in hit:
+                    sprite.kill()
+            crashed.append((center, hit))
+        self._keep(keep)
+        return crashed
+
+    def blit_list(self, alpha: float = 1.0) -> List[tuple]:
+        """Surface.blits에 넘길 (이미지, 위치) 목록
+
+        alpha < 1이면 직전 스텝 위치와 현재 위치 사이로 보간한다.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        return list(self._blit_pairs(alpha))
+
+    def _blit_pairs(self, alpha: float = 1.0):
+        """(이미지, (x, y)) 쌍 이터레이터 (파이썬 반복 없이 배열에서 바로 만듦)"""
+        n = self.count
+        images = self.images[self.kind[:n]].tolist()
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            x = x - self.vx[:n] * (1.0 - alpha)
+            y = y - self.vy[:n] * (1.0 - alpha)
+        xs = x.astype(np.int32).tolist()
+        ys = y.astype(np.int32).tolist()
+        return zip(images, zip(xs, ys))
+
+    def draw(self, surface: pygame.Surface):
+        """모든 총알을 한 번의 blits 호출로 그림"""
+        if self.count:
+            surface.blits(self._blit_pairs(), doreturn=False)
+
+
+def selftest() -> bool:
+    """보스에 여러 발이 겹쳤을 때 스프라이트 총알과 결과(보스 체력, 남은 총알)가 같은지 확인"""
+    import patterns
+    import world as game
+
+    results = []
+    for use_engine in (False, True):
+        world = game.World(seed=0, bullet_engine=use_engine, level=game.waves.Level([]))
+        boss = world.spawn_boss(sorted(patterns.BOSSES)[0])
+        boss.rect.center = (game.WIDTH // 2, 150)
+        for _ in range(5):
+            # 보스 한가운데에 겹친 총알 5발
+            if use_engine:
+                world.player_shots.spawn(boss.rect.centerx - 2, boss.rect.centery - 5, 0, -10)
+            else:
+                bullet = world.bullet_pool.acquire(boss.rect.centerx, boss.rect.centery + 5)
+                world.all_sprites.add(bullet)
+                world.bullets.add(bullet)
+        world.shoot_bosses()
+        results.append((boss.hp, world.entity_counts()["bullets"]))
+        print("%-8s boss hp %d, bullets left %d"
+              % ("engine" if use_engine else "sprites", *results[-1]))
+    return results[0] == results[1] and results[0][1] == 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    import headless
+    headless.use_dummy_drivers()
+    pygame.init()
+    sys.exit(0 if selftest() else 1)
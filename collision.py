@@ -0,0 +1,203 @@
+"""
+공간 해시(균일 격자) 기반 충돌 검사
+pygame.sprite.groupcollide / spritecollide 와 같은 결과(순서, kill 처리)를
+내면서 총알 수 x 적 수 만큼의 사각형 비교를 피한다.
+
+픽셀 단위 판정이 필요하면 사각형으로 후보를 고른 뒤 마스크로 다시 확인한다.
+마스크는 이미지(Surface)마다 한 번만 만들어 캐시한다.
+"""
+
+import weakref
+from typing import Dict, List
+
+import pygame
+
+CELL_SIZE = 64  # 격자 한 칸 크기 (적 30px, 플레이어 50px 기준)
+
+
+class SpatialHash:
+    """매 프레임 다시 채우는 균일 격자"""
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[tuple, list] = {}
+
+    def clear(self):
+        """격자 비우기"""
+        self.cells.clear()
+
+    def insert(self, sprite: pygame.sprite.Sprite, order: int):
+        """스프라이트가 걸치는 모든 칸에 등록 (order: 그룹 내 순서)"""
+        cs = self.cell_size
+        rect = sprite.rect
+        entry = (order, sprite)
+        cells = self.cells
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def build(self, sprites: List[pygame.sprite.Sprite]):
+        """스프라이트 목록으로 격자 재구성"""
+        self.clear()
+        for order, sprite in enumerate(sprites):
+            self.insert(sprite, order)
+
+    def query(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """rect와 겹치는 스프라이트를 그룹 순서대로 반환"""
+        cs = self.cell_size
+        cells = self.cells
+        found = {}
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for order, sprite in bucket:
+                        if order not in found and rect.colliderect(sprite.rect):
+                            found[order] = sprite
+        return [found[order] for order in sorted(found)]
+
+
+def groupcollide(groupa, groupb, dokilla: bool, dokillb: bool,
+                 cell_size: int = CELL_SIZE) -> Dict:
+    """pygame.sprite.groupcollide 대체 (groupb를 격자에 넣고 groupa로 조회)"""
+    crashed = {}
+    if not groupa or not groupb:
+        return crashed
+    grid = SpatialHash(cell_size)
+    grid.build(groupb.sprites())
+    for sprite in groupa.sprites():
+        # 앞선 총알에 이미 제거된 적은 제외 (groupcollide와 동일)
+        hits = [other for other in grid.query(sprite.rect) if other in groupb]
+        if hits:
+            if dokillb:
+                for other in hits:
+                    other.kill()
+            crashed[sprite] = hits
+            if dokilla:
+                sprite.kill()
+    return crashed
+
+
+# 이미지 -> 마스크 (이미지가 사라지면 마스크도 같이 사라짐)
+_masks: "weakref.WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]" = weakref.WeakKeyDictionary()
+
+
+def mask_for(image: pygame.Surface) -> pygame.mask.Mask:
+    """이미지의 충돌 마스크 (처음 요청할 때 한 번만 생성)"""
+    mask = _masks.get(image)
+    if mask is None:
+        mask = _masks[image] = pygame.mask.from_surface(image)
+    return mask
+
+
+def sprite_mask(sprite) -> pygame.mask.Mask:
+    """스프라이트 마스크 (mask 속성이 있으면 그것, 없으면 이미지로 캐시된 마스크)"""
+    mask = getattr(sprite, "mask", None)
+    return mask if mask is not None else mask_for(sprite.image)
+
+
+def collide_mask(a, b) -> bool:
+    """두 스프라이트의 불투명 픽셀이 겹치는지 (사각형은 이미 겹친다고 가정)"""
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    return sprite_mask(a).overlap(sprite_mask(b), offset) is not None
+
+
+def spritecollide(sprite, group, dokill: bool, masks: bool = False) -> List:
+    """pygame.sprite.spritecollide 대체
+
+    스프라이트 하나만 검사할 때는 격자를 만드는 비용이 이득보다 크므로
+    Rect.collidelistall(C 구현)로 한 번에 검사한다.
+    masks가 True면 사각형이 겹친 후보만 마스크로 다시 확인한다.
+    """
+    sprites = group.sprites()
+    if not sprites:
+        return []
+    hits = [sprites[i] for i in sprite.rect.collidelistall([s.rect for s in sprites])]
+    if masks and hits:
+        hits = [other for other in hits if collide_mask(sprite, other)]
+    if dokill:
+        for other in hits:
+            other.kill()
+    return hits
+
+
+def selftest(trials: int = 2000, seed: int = 0) -> bool:
+    """무작위 배치에서 마스크 판정이 pygame.sprite.collide_mask와 같은지 확인
+
+    spritecollide(masks=True)와 (numpy가 있으면) BulletEngine.collide_mask 둘 다 비교한다.
+    """
+    import random
+
+    import world as game
+
+    rng = random.Random(seed)
+    player = pygame.sprite.Sprite()
+    player.image = game.images.get("player")
+    player.rect = player.image.get_rect()
+    images = ([game.images.get(("enemy", color)) for color in game.ENEMY_COLORS]
+              + [game.images.get(("enemy_bullet", bullet_type)) for bullet_type in range(4)])
+    bullet_images = images[len(game.ENEMY_COLORS):]
+    try:
+        import bullet_engine
+    except ImportError:
+        engine = None
+    else:
+        engine = bullet_engine.BulletEngine(bullet_images, pygame.Rect(-100, -100, 300, 300))
+
+    mismatches = checked = 0
+    for _ in range(trials):
+        # 플레이어 주변 (사각형이 겹치거나 살짝 비껴가는 위치)에 스프라이트 배치
+        group = pygame.sprite.Group()
+        others = []
+        for _ in range(rng.randint(1, 8)):
+            other = pygame.sprite.Sprite()
+            other.image = rng.choice(images)
+            other.rect = other.image.get_rect(topleft=(rng.randint(-30, 55), rng.randint(-30, 45)))
+            group.add(other)
+            others.append(other)
+        expected = pygame.sprite.spritecollide(player, group, False, pygame.sprite.collide_mask)
+        if spritecollide(player, group, False, masks=True) != expected:
+            mismatches += 1
+        checked += 1
+
+        if engine is not None:
+            engine.clear()
+            bullets = [other for other in others if other.image in bullet_images]
+            for other in bullets:
+                engine.spawn(other.rect.x, other.rect.y, 0, 0, bullet_images.index(other.image))
+            expected = sum(1 for other in bullets
+                           if pygame.sprite.collide_mask(player, other) is not None)
+            if engine.collide_mask(player.rect, sprite_mask(player), False) != expected:
+                mismatches += 1
+            checked += 1
+    print("mask narrowphase: %d checks, %d mismatches%s"
+          % (checked, mismatches, "" if engine is not None else " (numpy 없음: 총알 엔진 제외)"))
+    return mismatches == 0
+
+
+def main():
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="충돌 검사 확인")
+    parser.add_argument("--selftest", action="store_true",
+                        help="마스크 판정이 pygame.sprite.collide_mask와 같은지 무작위로 확인")
+    parser.add_argument("--trials", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not args.selftest:
+        parser.print_help()
+        return
+
+    import headless
+    headless.use_dummy_drivers()
+    pygame.init()
+    sys.exit(0 if selftest(args.trials, args.seed) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+더티 사각형 렌더링
+전체 화면을 지우고 flip 하는 대신, 지난 프레임에 그렸던 영역만 배경색으로
+지우고 이번 프레임에 그린 영역과 함께 display.update(rects)로 내보낸다.
+"""
+
+from typing import Iterable, List, Sequence
+
+import pygame
+
+MAX_DIRTY_RECTS = 400  # 이보다 많으면 전체 화면 갱신이 더 싸다
+
+
+class DirtyRenderer:
+    """화면 밖 스프라이트는 그리지 않는 더티 사각형 렌더러"""
+
+    def __init__(self, screen: pygame.Surface, background=(0, 0, 0)):
+        self.screen = screen
+        self.background = background
+        self.bounds = screen.get_rect()
+        self.prev_rects: List[pygame.Rect] = []
+        self.dirty: List[pygame.Rect] = []
+        self.full_redraw = True  # 첫 프레임은 전체 화면 갱신
+
+    def draw(self, sprites: Iterable[pygame.sprite.Sprite],
+             extra: Sequence[tuple] = (), present: bool = True) -> List[pygame.Rect]:
+        """스프라이트를 그리고 화면에 반영, 갱신한 영역 반환
+
+        extra: 스프라이트가 아닌 추가 (이미지, 위치) 목록 (예: 총알 엔진)
+        present: False면 그리기만 하고 화면 반영은 present()에 맡김
+        """
+        screen = self.screen
+        background = self.background
+        if self.full_redraw:
+            screen.fill(background)
+        else:
+            # 지난 프레임에 그린 자리만 지움
+            for rect in self.prev_rects:
+                screen.fill(background, rect)
+
+        # 화면과 겹치는 스프라이트만 그림 (위쪽에 대기 중인 적 등은 제외)
+        bounds = self.bounds
+        drawn = screen.blits([(sprite.image, sprite.rect) for sprite in sprites
+                              if bounds.colliderect(sprite.rect)])
+        if extra:
+            drawn += screen.blits(extra)
+
+        dirty = self.prev_rects + drawn
+        self.prev_rects = drawn
+        self.dirty = dirty
+        if present:
+            self.present()
+        return dirty
+
+    def present(self):
+        """마지막 draw()에서 바뀐 영역을 화면에 반영"""
+        if self.full_redraw or len(self.dirty) > MAX_DIRTY_RECTS:
+            self.full_redraw = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.dirty)
+
+    def invalidate(self):
+        """다음 프레임을 전체 화면으로 다시 그리도록 표시"""
+        self.full_redraw = True
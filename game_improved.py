@@ -1,7 +1,12 @@
 import pygame
 import sys
 import random
-import os
+import time
+
+import headless
+
+# 실행 옵션 (--headless, --seed, --frames)
+options = headless.parse_args()
 
 # 파이게임 초기화
 pygame.init()
@@ -20,6 +25,10 @@ GREEN = (0, 255, 0)
 YELLOW = (255, 255, 0)
 PURPLE = (128, 0, 128)
 
+# 난수 생성기 / 게임 시계 (헤드리스 모드에서 결정론적)
+rng = random.Random(options.seed)
+clock = headless.SimClock(options.headless)
+
 # 게임 클래스 및 함수
 class Player(pygame.sprite.Sprite):
     def __init__(self):
@@ -40,16 +49,17 @@ class Player(pygame.sprite.Sprite):
         self.rect.centerx = WIDTH // 2
         self.rect.bottom = HEIGHT - 10
         self.speed = 5
+        self.keys = 0  # 입력 비트마스크
         
     def update(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
+        keys = self.keys
+        if keys & headless.INPUT_LEFT and self.rect.left > 0:
             self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT] and self.rect.right < WIDTH:
+        if keys & headless.INPUT_RIGHT and self.rect.right < WIDTH:
             self.rect.x += self.speed
-        if keys[pygame.K_UP] and self.rect.top > 0:
+        if keys & headless.INPUT_UP and self.rect.top > 0:
             self.rect.y -= self.speed
-        if keys[pygame.K_DOWN] and self.rect.bottom < HEIGHT:
+        if keys & headless.INPUT_DOWN and self.rect.bottom < HEIGHT:
             self.rect.y += self.speed
             
     def shoot(self):
@@ -61,7 +71,7 @@ class Enemy(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
         self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
-        self.color = random.choice([RED, GREEN, YELLOW, PURPLE])
+        self.color = rng.choice([RED, GREEN, YELLOW, PURPLE])
         pygame.draw.rect(self.image, self.color, (0, 0, 30, 30))
         
         # 적 비행기 디테일 추가
@@ -69,27 +79,27 @@ class Enemy(pygame.sprite.Sprite):
         pygame.draw.rect(self.image, BLACK, (13, 5, 4, 20))
         
         self.rect = self.image.get_rect()
-        self.rect.x = random.randrange(WIDTH - self.rect.width)
-        self.rect.y = random.randrange(-100, -40)
-        self.speedy = random.randrange(1, 4)
-        self.shoot_delay = random.randrange(1000, 3000)
-        self.last_shot = pygame.time.get_ticks()
+        self.rect.x = rng.randrange(WIDTH - self.rect.width)
+        self.rect.y = rng.randrange(-100, -40)
+        self.speedy = rng.randrange(1, 4)
+        self.shoot_delay = rng.randrange(1000, 3000)
+        self.last_shot = clock.get_ticks()
         
     def update(self):
         self.rect.y += self.speedy
         if self.rect.top > HEIGHT:
-            self.rect.x = random.randrange(WIDTH - self.rect.width)
-            self.rect.y = random.randrange(-100, -40)
-            self.speedy = random.randrange(1, 4)
+            self.rect.x = rng.randrange(WIDTH - self.rect.width)
+            self.rect.y = rng.randrange(-100, -40)
+            self.speedy = rng.randrange(1, 4)
             
         # 적 총알 발사
-        now = pygame.time.get_ticks()
+        now = clock.get_ticks()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
             self.shoot()
             
     def shoot(self):
-        bullet_type = random.randint(0, 3)  # 0: 원형, 1: 삼각형, 2: 사각형, 3: 다이아몬드
+        bullet_type = rng.randint(0, 3)  # 0: 원형, 1: 삼각형, 2: 사각형, 3: 다이아몬드
         enemy_bullet = EnemyBullet(self.rect.centerx, self.rect.bottom, bullet_type)
         all_sprites.add(enemy_bullet)
         enemy_bullets.add(enemy_bullet)
@@ -127,7 +137,7 @@ class EnemyBullet(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.top = y
-        self.speedy = random.randrange(3, 6)
+        self.speedy = rng.randrange(3, 6)
         
     def update(self):
         self.rect.y += self.speedy
@@ -150,21 +160,12 @@ for i in range(8):
     all_sprites.add(enemy)
     enemies.add(enemy)
 
-# 게임 루프
-clock = pygame.time.Clock()
-running = True
-
-while running:
-    # 프레임 설정
-    clock.tick(60)
-    
-    # 이벤트 처리
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                player.shoot()
+# 한 프레임 진행 (keys: 입력 비트마스크), 게임 오버면 False 반환
+def step(keys):
+    alive = True
+    if keys & headless.INPUT_FIRE:
+        player.shoot()
+    player.keys = keys
     
     # 업데이트
     all_sprites.update()
@@ -179,20 +180,59 @@ while running:
     # 충돌 체크 (플레이어와 적)
     hits = pygame.sprite.spritecollide(player, enemies, False)
     if hits:
-        running = False
+        alive = False
         
     # 충돌 체크 (플레이어와 적 총알)
     hits = pygame.sprite.spritecollide(player, enemy_bullets, True)
     if hits:
-        running = False
+        alive = False
     
-    # 화면 그리기
+    return alive
+
+# 화면 그리기
+def draw():
     screen.fill(BLACK)
     all_sprites.draw(screen)
     
     # 화면 업데이트
     pygame.display.flip()
 
-# 게임 종료
-pygame.quit()
-sys.exit()
+# 게임 루프
+def main():
+    # 헤드리스 모드: 프레임 제한 없이 최대한 빠르게 진행
+    if options.headless:
+        start = time.perf_counter()
+        frames = headless.run_headless(step, clock, options.frames or 3600, render=draw)
+        elapsed = time.perf_counter() - start
+        print(f"frames={frames} seed={options.seed} "
+              f"fps={frames / max(elapsed, 1e-9):.0f} "
+              f"digest={headless.state_digest(all_sprites)}")
+        return
+    
+    running = True
+    while running:
+        # 프레임 설정
+        clock.tick()
+        
+        # 이벤트 처리
+        keys = headless.read_keys()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    keys |= headless.INPUT_FIRE
+        
+        if not step(keys):
+            running = False
+        draw()
+        
+        if options.frames and clock.frame >= options.frames:
+            running = False
+
+if __name__ == "__main__":
+    main()
+    
+    # 게임 종료
+    pygame.quit()
+    sys.exit()
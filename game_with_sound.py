@@ -1,7 +1,16 @@
 import pygame
 import sys
 import random
-import os
+import time
+
+import animation
+import assets
+import headless
+import scheduler
+import timestep
+
+# 실행 옵션 (--headless, --seed, --frames, --asset-dir)
+options = headless.parse_args()
 
 # 파이게임 초기화
 pygame.init()
@@ -21,11 +30,26 @@ GREEN = (0, 255, 0)
 YELLOW = (255, 255, 0)
 PURPLE = (128, 0, 128)
 
+# 난수 생성기 / 게임 시계 (헤드리스 모드에서 결정론적)
+rng = random.Random(options.seed)
+clock = headless.SimClock(options.headless)
+sim_clock = timestep.FixedTimestep()  # 게임 로직은 이 시계의 시뮬레이션 시간 사용
+events = scheduler.Scheduler()  # 폭발 프레임 전환 등 시간 이벤트
+
+# 에셋 로딩 (assets/ 폴더 기준, 백그라운드 스레드에서 디코딩하는 동안 로딩 화면 표시)
+loader = assets.AssetLoader(options.asset_dir)
+for name in ("shoot", "explosion", "enemy_shoot", "game_over"):
+    # 파일이 없으면 합성한 효과음으로 대체
+    loader.add_sound(name, name + ".wav", fallback=lambda name=name: assets.placeholder_sound(name))
+loader.add_file("music", "shoot.wav")  # 임시로 shoot.wav를 배경 음악으로 사용
+loader.start()
+assets.show_loading(None if options.headless else screen, loader)
+
 # 사운드 효과 생성
-shoot_sound = pygame.mixer.Sound('/Users/mjs/game_assets/shoot.wav')
-explosion_sound = pygame.mixer.Sound('/Users/mjs/game_assets/explosion.wav')
-enemy_shoot_sound = pygame.mixer.Sound('/Users/mjs/game_assets/enemy_shoot.wav')
-game_over_sound = pygame.mixer.Sound('/Users/mjs/game_assets/game_over.wav')
+shoot_sound = loader.get("shoot")
+explosion_sound = loader.get("explosion")
+enemy_shoot_sound = loader.get("enemy_shoot")
+game_over_sound = loader.get("game_over")
 
 # 사운드 효과 볼륨 설정
 shoot_sound.set_volume(0.3)
@@ -53,16 +77,17 @@ class Player(pygame.sprite.Sprite):
         self.rect.centerx = WIDTH // 2
         self.rect.bottom = HEIGHT - 10
         self.speed = 5
+        self.keys = 0  # 입력 비트마스크
         
     def update(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
+        keys = self.keys
+        if keys & headless.INPUT_LEFT and self.rect.left > 0:
             self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT] and self.rect.right < WIDTH:
+        if keys & headless.INPUT_RIGHT and self.rect.right < WIDTH:
             self.rect.x += self.speed
-        if keys[pygame.K_UP] and self.rect.top > 0:
+        if keys & headless.INPUT_UP and self.rect.top > 0:
             self.rect.y -= self.speed
-        if keys[pygame.K_DOWN] and self.rect.bottom < HEIGHT:
+        if keys & headless.INPUT_DOWN and self.rect.bottom < HEIGHT:
             self.rect.y += self.speed
             
     def shoot(self):
@@ -75,7 +100,7 @@ class Enemy(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
         self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
-        self.color = random.choice([RED, GREEN, YELLOW, PURPLE])
+        self.color = rng.choice([RED, GREEN, YELLOW, PURPLE])
         pygame.draw.rect(self.image, self.color, (0, 0, 30, 30))
         
         # 적 비행기 디테일 추가
@@ -83,27 +108,27 @@ class Enemy(pygame.sprite.Sprite):
         pygame.draw.rect(self.image, BLACK, (13, 5, 4, 20))
         
         self.rect = self.image.get_rect()
-        self.rect.x = random.randrange(WIDTH - self.rect.width)
-        self.rect.y = random.randrange(-100, -40)
-        self.speedy = random.randrange(1, 4)
-        self.shoot_delay = random.randrange(1000, 3000)
-        self.last_shot = pygame.time.get_ticks()
+        self.rect.x = rng.randrange(WIDTH - self.rect.width)
+        self.rect.y = rng.randrange(-100, -40)
+        self.speedy = rng.randrange(1, 4)
+        self.shoot_delay = rng.randrange(1000, 3000)
+        self.last_shot = sim_clock.get_ticks()
         
     def update(self):
         self.rect.y += self.speedy
         if self.rect.top > HEIGHT:
-            self.rect.x = random.randrange(WIDTH - self.rect.width)
-            self.rect.y = random.randrange(-100, -40)
-            self.speedy = random.randrange(1, 4)
+            self.rect.x = rng.randrange(WIDTH - self.rect.width)
+            self.rect.y = rng.randrange(-100, -40)
+            self.speedy = rng.randrange(1, 4)
             
         # 적 총알 발사
-        now = pygame.time.get_ticks()
+        now = sim_clock.get_ticks()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
             self.shoot()
             
     def shoot(self):
-        bullet_type = random.randint(0, 3)  # 0: 원형, 1: 삼각형, 2: 사각형, 3: 다이아몬드
+        bullet_type = rng.randint(0, 3)  # 0: 원형, 1: 삼각형, 2: 사각형, 3: 다이아몬드
         enemy_bullet = EnemyBullet(self.rect.centerx, self.rect.bottom, bullet_type)
         all_sprites.add(enemy_bullet)
         enemy_bullets.add(enemy_bullet)
@@ -142,7 +167,7 @@ class EnemyBullet(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.top = y
-        self.speedy = random.randrange(3, 6)
+        self.speedy = rng.randrange(3, 6)
         
     def update(self):
         self.rect.y += self.speedy
@@ -150,70 +175,33 @@ class EnemyBullet(pygame.sprite.Sprite):
             self.kill()
 
 # 폭발 효과 클래스
+EXPLOSION_COLORS = [RED, YELLOW, (255, 165, 0), WHITE]  # 빨강 -> 노랑 -> 주황 -> 흰색
+
 class Explosion(pygame.sprite.Sprite):
     def __init__(self, center, size):
         super().__init__()
         self.size = size
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, RED, (size//2, size//2), size//2)
+        # 크기별로 한 번만 그려둔 프레임 공유
+        self.frames = animation.circle_frames(size, EXPLOSION_COLORS)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = center
         self.frame = 0
-        self.last_update = pygame.time.get_ticks()
+        self.start = sim_clock.get_ticks()
         self.frame_rate = 50  # 프레임 속도 조절
+        self.schedule_frame()
         
-    def update(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.frame_rate:
-            self.last_update = now
-            self.frame += 1
-            if self.frame == 1:
-                # 두 번째 프레임: 노란색 원
-                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                pygame.draw.circle(self.image, YELLOW, (self.size//2, self.size//2), self.size//2)
-            elif self.frame == 2:
-                # 세 번째 프레임: 주황색 원
-                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                pygame.draw.circle(self.image, (255, 165, 0), (self.size//2, self.size//2), self.size//2)
-            elif self.frame == 3:
-                # 네 번째 프레임: 흰색 원
-                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                pygame.draw.circle(self.image, WHITE, (self.size//2, self.size//2), self.size//2)
-            elif self.frame > 3:
-                self.kill()  # 애니메이션 종료
-
-# 사운드 파일 생성 함수
-def create_sound_files():
-    # 사운드 파일이 없으면 생성
-    if not os.path.exists('/Users/mjs/game_assets'):
-        os.makedirs('/Users/mjs/game_assets')
-    
-    # 총알 발사 소리 (shoot.wav)
-    if not os.path.exists('/Users/mjs/game_assets/shoot.wav'):
-        # 간단한 비프음 생성
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytes([128] * 1000)))
-        pygame.mixer.Sound.stop(pygame.mixer.Sound(buffer=bytes([128] * 1000)))
-    
-    # 폭발 소리 (explosion.wav)
-    if not os.path.exists('/Users/mjs/game_assets/explosion.wav'):
-        # 간단한 비프음 생성
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytes([128] * 2000)))
-        pygame.mixer.Sound.stop(pygame.mixer.Sound(buffer=bytes([128] * 2000)))
-    
-    # 적 총알 발사 소리 (enemy_shoot.wav)
-    if not os.path.exists('/Users/mjs/game_assets/enemy_shoot.wav'):
-        # 간단한 비프음 생성
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytes([128] * 800)))
-        pygame.mixer.Sound.stop(pygame.mixer.Sound(buffer=bytes([128] * 800)))
-    
-    # 게임 오버 소리 (game_over.wav)
-    if not os.path.exists('/Users/mjs/game_assets/game_over.wav'):
-        # 간단한 비프음 생성
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytes([128] * 3000)))
-        pygame.mixer.Sound.stop(pygame.mixer.Sound(buffer=bytes([128] * 3000)))
-
-# 사운드 파일 생성
-create_sound_files()
+    # 다음 프레임 전환 예약 (시작 시각 기준이라 오차가 쌓이지 않음)
+    def schedule_frame(self):
+        events.schedule(self.start + (self.frame + 1) * self.frame_rate, self.next_frame)
+        
+    def next_frame(self):
+        self.frame += 1
+        if self.frame >= len(self.frames):
+            self.kill()  # 애니메이션 종료
+            return
+        self.image = self.frames[self.frame]
+        self.schedule_frame()
 
 # 스프라이트 그룹 생성
 all_sprites = pygame.sprite.Group()
@@ -232,28 +220,37 @@ for i in range(8):
     enemies.add(enemy)
 
 # 배경 음악 재생
-pygame.mixer.music.load('/Users/mjs/game_assets/shoot.wav')  # 임시로 shoot.wav를 배경 음악으로 사용
-pygame.mixer.music.set_volume(0.2)
-pygame.mixer.music.play(-1)  # -1은 무한 반복
+music_path = loader.get("music")
+if music_path is not None:
+    pygame.mixer.music.load(music_path)
+    pygame.mixer.music.set_volume(0.2)
+    pygame.mixer.music.play(-1)  # -1은 무한 반복
 
-# 게임 루프
-clock = pygame.time.Clock()
-running = True
+# 게임 오버 상태 (게임 오버된 시뮬레이션 시각, 진행 중이면 None)
+GAME_OVER_DELAY = 1000  # 게임 오버 후 종료까지 시간(ms) - 그동안 폭발 애니메이션 계속 진행
+game_over_at = None
 
-while running:
-    # 프레임 설정
-    clock.tick(60)
-    
-    # 이벤트 처리
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                player.shoot()
+# 플레이어 사망 처리
+def player_died():
+    global game_over_at
+    game_over_sound.play()  # 게임 오버 소리 재생
+    # 폭발 효과 생성
+    expl = Explosion(player.rect.center, 50)
+    all_sprites.add(expl)
+    player.kill()
+    game_over_at = sim_clock.get_ticks()
+
+# 시뮬레이션 한 스텝 진행 (keys: 입력 비트마스크), 게임 오버 후 종료 시점이면 False 반환
+def step(keys):
+    sim_clock.tick()
+    if game_over_at is None:
+        if keys & headless.INPUT_FIRE:
+            player.shoot()
+        player.keys = keys
     
-    # 업데이트
+    # 업데이트 후 시각이 된 이벤트 실행 (폭발 프레임 전환)
     all_sprites.update()
+    events.run_due(sim_clock.get_ticks())
     
     # 충돌 체크 (총알과 적)
     hits = pygame.sprite.groupcollide(bullets, enemies, True, True)
@@ -267,34 +264,77 @@ while running:
         all_sprites.add(enemy)
         enemies.add(enemy)
     
+    # 게임 오버 후에는 화면만 계속 진행
+    if game_over_at is not None:
+        return sim_clock.get_ticks() - game_over_at < GAME_OVER_DELAY
+    
     # 충돌 체크 (플레이어와 적)
     hits = pygame.sprite.spritecollide(player, enemies, False)
-    if hits:
-        game_over_sound.play()  # 게임 오버 소리 재생
-        # 폭발 효과 생성
-        expl = Explosion(player.rect.center, 50)
-        all_sprites.add(expl)
-        pygame.time.delay(1000)  # 1초 대기
-        running = False
-        
+    
     # 충돌 체크 (플레이어와 적 총알)
-    hits = pygame.sprite.spritecollide(player, enemy_bullets, True)
+    hits = pygame.sprite.spritecollide(player, enemy_bullets, True) or hits
     if hits:
-        game_over_sound.play()  # 게임 오버 소리 재생
-        # 폭발 효과 생성
-        expl = Explosion(player.rect.center, 50)
-        all_sprites.add(expl)
-        pygame.time.delay(1000)  # 1초 대기
-        running = False
+        player_died()
     
-    # 화면 그리기
+    return True
+
+# 화면 그리기
+interpolator = timestep.Interpolator()
+
+# alpha: 직전 스텝과 현재 스텝 사이 보간 비율 (None이면 보간 없음)
+def draw(alpha=None):
     screen.fill(BLACK)
-    all_sprites.draw(screen)
+    if alpha is None:
+        all_sprites.draw(screen)
+    else:
+        screen.blits(interpolator.blit_list(all_sprites, alpha, screen.get_rect()), doreturn=False)
     
     # 화면 업데이트
     pygame.display.flip()
 
-# 게임 종료
-pygame.mixer.music.stop()  # 배경 음악 정지
-pygame.quit()
-sys.exit()
+# 게임 루프
+def main():
+    # 헤드리스 모드: 프레임 제한 없이 최대한 빠르게 진행
+    if options.headless:
+        start = time.perf_counter()
+        frames = headless.run_headless(step, clock, options.frames or 3600, render=draw)
+        elapsed = time.perf_counter() - start
+        print(f"frames={frames} seed={options.seed} "
+              f"fps={frames / max(elapsed, 1e-9):.0f} "
+              f"digest={headless.state_digest(all_sprites)}")
+        return
+    
+    running = True
+    fire = 0  # 스텝이 돌기 전까지 발사 입력 유지
+    while running:
+        # 프레임 설정 (실제 경과 시간)
+        elapsed = clock.tick()
+        
+        # 이벤트 처리
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    fire = headless.INPUT_FIRE
+        keys = headless.read_keys()
+        
+        # 고정 간격으로 필요한 만큼 시뮬레이션 진행
+        for _ in range(sim_clock.advance(elapsed)):
+            interpolator.snapshot(all_sprites)
+            if not step(keys | fire):
+                running = False
+                break
+            fire = 0
+        draw(sim_clock.alpha)
+        
+        if options.frames and sim_clock.steps >= options.frames:
+            running = False
+
+if __name__ == "__main__":
+    main()
+    
+    # 게임 종료
+    pygame.mixer.music.stop()  # 배경 음악 정지
+    pygame.quit()
+    sys.exit()
@@ -1,261 +1,273 @@
 import pygame
 import sys
 import random
-import os
+import time
+
+import background
+import dirty_render
+import headless
+import hud
+import profiler
+import replay
+import rewind
+import sound_manager
+import timestep
+import waves
+from world import BLACK, HEIGHT, WIDTH, World, images
+
+# 실행 옵션 (--headless, --seed, --frames)
+options = headless.parse_args()
+
+# 리플레이 재생이면 기록된 시드/설정 사용, 아니면 기록할 수 있도록 시드를 정해 둠
+replay_log = replay.Replay.load(options.replay) if options.replay else None
+if replay_log is not None:
+    options.seed = replay_log.seed
+    options.bullet_engine = replay_log.bullet_engine
+    options.level = replay_log.level or None
+elif options.seed is None:
+    options.seed = random.SystemRandom().randrange(2 ** 31)
 
 # 파이게임 초기화
 pygame.init()
 pygame.mixer.init()  # 사운드 시스템 초기화
 
 # 화면 설정
-WIDTH, HEIGHT = 480, 600
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("1945 슈팅 게임")
 
-# 색상 정의
-BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-GREEN = (0, 255, 0)
-YELLOW = (255, 255, 0)
-PURPLE = (128, 0, 128)
+# 실제 프레임 시계 (헤드리스 모드에서는 가상 시간)
+clock = headless.SimClock(options.headless)
 
-# 사운드 효과 생성 (내장 사운드 사용)
-shoot_sound = pygame.mixer.Sound(buffer=bytes([128] * 1000))
-explosion_sound = pygame.mixer.Sound(buffer=bytes([200] * 2000))
-enemy_shoot_sound = pygame.mixer.Sound(buffer=bytes([100] * 800))
-game_over_sound = pygame.mixer.Sound(buffer=bytes([220] * 3000))
+# 사운드 효과 생성 (절차적 합성, 한 번 만든 파형은 .cache 폴더에서 바로 불러옴)
+try:
+    import synth
+except ImportError:
+    # numpy가 없으면 내장 버퍼 사용 (소리는 나지 않음)
+    shoot_sound = pygame.mixer.Sound(buffer=bytes([128] * 1000))
+    explosion_sound = pygame.mixer.Sound(buffer=bytes([200] * 2000))
+    enemy_shoot_sound = pygame.mixer.Sound(buffer=bytes([100] * 800))
+    game_over_sound = pygame.mixer.Sound(buffer=bytes([220] * 3000))
+else:
+    sound_bank = synth.load_bank()
+    shoot_sound = sound_bank["shoot"]
+    explosion_sound = sound_bank["explosion"]
+    enemy_shoot_sound = sound_bank["enemy_shoot"]
+    game_over_sound = sound_bank["game_over"]
 
-# 사운드 효과 볼륨 설정
-shoot_sound.set_volume(0.3)
-explosion_sound.set_volume(0.5)
-enemy_shoot_sound.set_volume(0.2)
-game_over_sound.set_volume(0.7)
+# 효과음 관리자 (프레임마다 요청을 모아 재생, 볼륨/우선순위/동시 재생 수 설정)
+sounds = sound_manager.SoundManager()
+sounds.register("shoot", shoot_sound, volume=0.3, priority=1, max_voices=2)
+sounds.register("explosion", explosion_sound, volume=0.5, priority=2, max_voices=4)
+sounds.register("enemy_shoot", enemy_shoot_sound, volume=0.2, priority=0, max_voices=3)
+sounds.register("game_over", game_over_sound, volume=0.7, priority=3, max_voices=1)
 
-# 게임 클래스 및 함수
-class Player(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        # 비행기 모양 그리기
-        self.image = pygame.Surface((50, 40), pygame.SRCALPHA)
-        # 비행기 몸체
-        pygame.draw.rect(self.image, BLUE, (10, 10, 30, 20))
-        # 비행기 날개
-        pygame.draw.polygon(self.image, BLUE, [(0, 20), (10, 20), (10, 10), (20, 10)])
-        pygame.draw.polygon(self.image, BLUE, [(40, 10), (40, 20), (50, 20), (40, 10)])
-        # 비행기 꼬리
-        pygame.draw.polygon(self.image, BLUE, [(20, 0), (30, 0), (25, 10)])
-        # 비행기 엔진 불꽃
-        pygame.draw.polygon(self.image, RED, [(20, 30), (30, 30), (25, 40)])
-        
-        self.rect = self.image.get_rect()
-        self.rect.centerx = WIDTH // 2
-        self.rect.bottom = HEIGHT - 10
-        self.speed = 5
-        
-    def update(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
-            self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT] and self.rect.right < WIDTH:
-            self.rect.x += self.speed
-        if keys[pygame.K_UP] and self.rect.top > 0:
-            self.rect.y -= self.speed
-        if keys[pygame.K_DOWN] and self.rect.bottom < HEIGHT:
-            self.rect.y += self.speed
-            
-    def shoot(self):
-        bullet = Bullet(self.rect.centerx, self.rect.top)
-        all_sprites.add(bullet)
-        bullets.add(bullet)
-        shoot_sound.play()  # 총알 발사 소리 재생
+# 스프라이트 이미지를 디스플레이 포맷으로 미리 변환
+images.preload()
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
-        self.color = random.choice([RED, GREEN, YELLOW, PURPLE])
-        pygame.draw.rect(self.image, self.color, (0, 0, 30, 30))
-        
-        # 적 비행기 디테일 추가
-        pygame.draw.rect(self.image, BLACK, (5, 15, 20, 5))
-        pygame.draw.rect(self.image, BLACK, (13, 5, 4, 20))
-        
-        self.rect = self.image.get_rect()
-        self.rect.x = random.randrange(WIDTH - self.rect.width)
-        self.rect.y = random.randrange(-100, -40)
-        self.speedy = random.randrange(1, 4)
-        self.shoot_delay = random.randrange(1000, 3000)
-        self.last_shot = pygame.time.get_ticks()
-        
-    def update(self):
-        self.rect.y += self.speedy
-        if self.rect.top > HEIGHT:
-            self.rect.x = random.randrange(WIDTH - self.rect.width)
-            self.rect.y = random.randrange(-100, -40)
-            self.speedy = random.randrange(1, 4)
-            
-        # 적 총알 발사
-        now = pygame.time.get_ticks()
-        if now - self.last_shot > self.shoot_delay:
-            self.last_shot = now
-            self.shoot()
-            
-    def shoot(self):
-        bullet_type = random.randint(0, 3)  # 0: 원형, 1: 삼각형, 2: 사각형, 3: 다이아몬드
-        enemy_bullet = EnemyBullet(self.rect.centerx, self.rect.bottom, bullet_type)
-        all_sprites.add(enemy_bullet)
-        enemy_bullets.add(enemy_bullet)
-        enemy_shoot_sound.play()  # 적 총알 발사 소리 재생
+# 프레임 단계별 시간 측정 / 오버레이 (F3)
+frame_profiler = profiler.FrameProfiler()
+overlay = profiler.ProfilerOverlay(frame_profiler)
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((5, 10), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, WHITE, (0, 0, 5, 10))
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y
-        self.speedy = -10
-        
-    def update(self):
-        self.rect.y += self.speedy
-        if self.rect.bottom < 0:
-            self.kill()
+# 점수 / 남은 기체 / FPS (값이 바뀔 때만 다시 합성)
+status = None if options.no_hud else hud.Hud((WIDTH, HEIGHT))
 
-class EnemyBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, bullet_type):
-        super().__init__()
-        self.image = pygame.Surface((10, 10), pygame.SRCALPHA)
-        self.bullet_type = bullet_type
-        
-        if bullet_type == 0:  # 원형
-            pygame.draw.circle(self.image, YELLOW, (5, 5), 5)
-        elif bullet_type == 1:  # 삼각형
-            pygame.draw.polygon(self.image, GREEN, [(5, 0), (0, 10), (10, 10)])
-        elif bullet_type == 2:  # 사각형
-            pygame.draw.rect(self.image, RED, (0, 0, 10, 10))
-        else:  # 다이아몬드
-            pygame.draw.polygon(self.image, PURPLE, [(5, 0), (10, 5), (5, 10), (0, 5)])
-            
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.top = y
-        self.speedy = random.randrange(3, 6)
-        
-    def update(self):
-        self.rect.y += self.speedy
-        if self.rect.top > HEIGHT:
-            self.kill()
+# 게임 월드 (그룹, 난수, 시뮬레이션 시계를 모두 가짐)
+level = waves.load(options.level) if options.level else None
+world = World(seed=options.seed, bullet_engine=options.bullet_engine,
+              pool_size=options.pool_size, sounds=sounds, profiler=frame_profiler,
+              level=level)
+step = world.step
 
-# 폭발 효과 클래스
-class Explosion(pygame.sprite.Sprite):
-    def __init__(self, center, size):
-        super().__init__()
-        self.size = size
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, RED, (size//2, size//2), size//2)
-        self.rect = self.image.get_rect()
-        self.rect.center = center
-        self.frame = 0
-        self.last_update = pygame.time.get_ticks()
-        self.frame_rate = 50  # 프레임 속도 조절
-        
-    def update(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.frame_rate:
-            self.last_update = now
-            self.frame += 1
-            if self.frame == 1:
-                # 두 번째 프레임: 노란색 원
-                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                pygame.draw.circle(self.image, YELLOW, (self.size//2, self.size//2), self.size//2)
-            elif self.frame == 2:
-                # 세 번째 프레임: 주황색 원
-                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                pygame.draw.circle(self.image, (255, 165, 0), (self.size//2, self.size//2), self.size//2)
-            elif self.frame == 3:
-                # 네 번째 프레임: 흰색 원
-                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                pygame.draw.circle(self.image, WHITE, (self.size//2, self.size//2), self.size//2)
-            elif self.frame > 3:
-                self.kill()  # 애니메이션 종료
+# 되감기 기록 (Backspace를 누르고 있는 동안 스텝마다 REWIND_SPEED 스텝씩 뒤로)
+REWIND_SPEED = 2
+history = None
+if not options.headless and options.rewind > 0:
+    history = rewind.RewindBuffer(options.rewind, world.clock.hz)
+    history.push(rewind.save_state(world))
+
+# 화면 그리기
+renderer = dirty_render.DirtyRenderer(screen, BLACK) if options.dirty else None
+interpolator = timestep.Interpolator()
+# 스크롤 배경 (화면 전체가 매 프레임 바뀌므로 더티 렌더링과는 함께 쓰지 않음)
+scenery = None
+if renderer is None and not options.no_background:
+    scenery = background.ParallaxBackground((WIDTH, HEIGHT))
+
+# alpha: 직전 스텝과 현재 스텝 사이 보간 비율 (None이면 보간 없음)
+def draw(alpha=None):
+    # 이번 프레임에 쌓인 효과음 재생
+    sounds.flush()
+    
+    all_sprites = world.all_sprites
+    if alpha is None:
+        sprites = all_sprites
+        extra = []
+    else:
+        sprites = ()
+        extra = interpolator.blit_list(all_sprites, alpha, screen.get_rect())
+    # 총알 엔진 모드의 총알과 탄막 패턴 총알
+    for engine in world.bullet_engines():
+        extra += engine.blit_list() if alpha is None else engine.blit_list(alpha)
+    if status is not None:
+        extra += status.blit_list(world.score, world.lives, clock.get_fps(),
+                                  world.clock.get_ticks())
+    if overlay.visible:
+        extra += overlay.blit_list(world.clock.get_ticks(), world.entity_counts())
+    
+    # 변경된 영역만 갱신하는 렌더러
+    if renderer is not None:
+        renderer.draw(sprites, extra, present=False)
+        frame_profiler.mark("draw")
+        renderer.present()
+        frame_profiler.mark("present")
+        return
+    
+    if scenery is not None:
+        # 보간 중이면 다음 스텝까지 진행한 비율만큼 배경도 더 움직임
+        scenery.draw(screen, (world.clock.steps + (alpha or 0.0)) * world.clock.step_ms)
+    else:
+        screen.fill(BLACK)
+    if sprites:
+        all_sprites.draw(screen)
+    screen.blits(extra, doreturn=False)
+    frame_profiler.mark("draw")
+    
+    # 화면 업데이트
+    pygame.display.flip()
+    frame_profiler.mark("present")
 
-# 스프라이트 그룹 생성
-all_sprites = pygame.sprite.Group()
-enemies = pygame.sprite.Group()
-bullets = pygame.sprite.Group()
-enemy_bullets = pygame.sprite.Group()
+# 측정 결과 출력 / 저장
+def report_profile():
+    stats = frame_profiler.summary()
+    if stats:
+        print("frame ms: p50=%.3f p99=%.3f  " % (stats["p50"], stats["p99"]) +
+              "  ".join("%s=%.3f" % (name, stats[name]) for name in frame_profiler.phases))
+    if options.profile_out:
+        frame_profiler.dump(options.profile_out)
 
-# 플레이어 생성
-player = Player()
-all_sprites.add(player)
+# 리플레이 기록기 (재생 중이거나 --no-record면 None)
+def open_recorder():
+    if replay_log is not None or options.no_record:
+        return None
+    path = options.record
+    if path is None:
+        # 헤드리스 실행은 요청할 때만 기록
+        if options.headless:
+            return None
+        path = replay.DEFAULT_PATH
+    return replay.ReplayWriter(path, options.seed, options.bullet_engine, options.level or "")
 
-# 적 생성
-for i in range(8):
-    enemy = Enemy()
-    all_sprites.add(enemy)
-    enemies.add(enemy)
+# 되감기 한 번 (기록 중인 리플레이도 같은 스텝까지 되돌림)
+def rewind_world(recorder):
+    for _ in range(REWIND_SPEED):
+        if len(history) > 1:
+            history.pop()
+    rewind.load_state(world, history.latest())
+    if recorder is not None:
+        recorder.truncate(world.frame)
+    if renderer is not None:
+        renderer.invalidate()
 
 # 게임 루프
-clock = pygame.time.Clock()
-running = True
-
-while running:
-    # 프레임 설정
-    clock.tick(60)
-    
-    # 이벤트 처리
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                player.shoot()
+def main():
+    recorder = open_recorder()
     
-    # 업데이트
-    all_sprites.update()
+    # 헤드리스 모드: 프레임 제한 없이 최대한 빠르게 진행
+    if options.headless:
+        inputs = headless.autopilot
+        frames = options.frames or 3600
+        if replay_log is not None:
+            inputs = replay_log.keys
+            frames = min(frames, len(replay_log)) if options.frames else len(replay_log)
+        elif recorder is not None:
+            inputs = lambda frame: recorder.record(headless.autopilot(frame))
+        start = time.perf_counter()
+        frames = headless.run_headless(step, clock, frames, inputs=inputs, render=draw,
+                                       profiler=frame_profiler)
+        elapsed = time.perf_counter() - start
+        print(f"frames={frames} seed={options.seed} "
+              f"fps={frames / max(elapsed, 1e-9):.0f} "
+              f"digest={world.digest()}")
+        for name, stats in world.pool_stats().items():
+            print(f"pool {name}: {stats}")
+        print(f"sounds: {sounds.stats}")
+        if status is not None:
+            print(f"hud: {status.stats}")
+        report_profile()
+        if recorder is not None:
+            recorder.close()
+        return
     
-    # 충돌 체크 (총알과 적)
-    hits = pygame.sprite.groupcollide(bullets, enemies, True, True)
-    for hit in hits:
-        explosion_sound.play()  # 폭발 소리 재생
-        # 폭발 효과 생성
-        expl = Explosion(hit.rect.center, 30)
-        all_sprites.add(expl)
-        # 새로운 적 생성
-        enemy = Enemy()
-        all_sprites.add(enemy)
-        enemies.add(enemy)
+    # 리플레이는 배속만큼 시뮬레이션 시간을 빠르게 진행
+    speed = 1.0
+    if replay_log is not None:
+        speed = options.speed
+        world.clock.max_frame_ms *= speed
     
-    # 충돌 체크 (플레이어와 적)
-    hits = pygame.sprite.spritecollide(player, enemies, False)
-    if hits:
-        game_over_sound.play()  # 게임 오버 소리 재생
-        # 폭발 효과 생성
-        expl = Explosion(player.rect.center, 50)
-        all_sprites.add(expl)
-        pygame.time.delay(1000)  # 1초 대기
-        running = False
+    running = True
+    ended = False  # 연습 모드에서 게임이 끝나 멈춘 상태 (되감으면 이어서 진행)
+    fire = 0  # 스텝이 돌기 전까지 발사 입력 유지
+    while running:
+        # 프레임 설정 (실제 경과 시간)
+        elapsed = clock.tick()
+        frame_profiler.begin_frame()
         
-    # 충돌 체크 (플레이어와 적 총알)
-    hits = pygame.sprite.spritecollide(player, enemy_bullets, True)
-    if hits:
-        game_over_sound.play()  # 게임 오버 소리 재생
-        # 폭발 효과 생성
-        expl = Explosion(player.rect.center, 50)
-        all_sprites.add(expl)
-        pygame.time.delay(1000)  # 1초 대기
-        running = False
-    
-    # 화면 그리기
-    screen.fill(BLACK)
-    all_sprites.draw(screen)
+        # 이벤트 처리
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    fire = headless.INPUT_FIRE
+                elif event.key == pygame.K_F3:
+                    overlay.toggle()
+                    if renderer is not None:
+                        renderer.invalidate()
+        keys = headless.read_keys()
+        rewinding = history is not None and pygame.key.get_pressed()[pygame.K_BACKSPACE]
+        frame_profiler.mark("events")
+        
+        # 고정 간격으로 필요한 만큼 시뮬레이션 진행
+        for _ in range(world.clock.advance(elapsed * speed)):
+            interpolator.snapshot(world.all_sprites)
+            if rewinding:
+                rewind_world(recorder)
+                ended = False
+                continue
+            if ended:
+                break
+            if replay_log is not None:
+                if world.frame >= len(replay_log):
+                    running = False
+                    break
+                mask = replay_log.keys(world.frame + 1)
+            else:
+                mask = keys | fire
+                if recorder is not None:
+                    recorder.record(mask)
+            result = step(mask)
+            if history is not None:
+                history.push(rewind.save_state(world))
+            if not result:
+                if options.practice and history is not None:
+                    ended = True
+                else:
+                    running = False
+                break
+            fire = 0
+        draw(world.clock.alpha)
+        frame_profiler.end_frame()
+        
+        if options.frames and world.clock.steps >= options.frames:
+            running = False
     
-    # 화면 업데이트
-    pygame.display.flip()
+    if recorder is not None:
+        recorder.close()
+    report_profile()
 
-# 게임 종료
-pygame.quit()
-sys.exit()
+if __name__ == "__main__":
+    main()
+    
+    # 게임 종료
+    pygame.quit()
+    sys.exit()
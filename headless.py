@@ -0,0 +1,171 @@
+"""
+헤드리스 / 결정론적 시뮬레이션 지원 모듈
+- 더미 비디오/오디오 드라이버 설정
+- 프레임 제한 없는 시뮬레이션 시계
+- 방향키 + 스페이스바 입력 비트마스크
+"""
+
+import os
+import argparse
+import hashlib
+from typing import Callable, Iterable, List, Optional
+
+import pygame
+
+# 입력 비트마스크 (방향키 4개 + 스페이스바)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_UP = 4
+INPUT_DOWN = 8
+INPUT_FIRE = 16
+
+FPS = 60
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """실행 옵션 파싱 (알 수 없는 옵션은 무시)"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--headless", action="store_true",
+                        help="창/사운드 없이 프레임 제한 없이 실행")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="모든 난수에 사용할 시드")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="지정한 프레임 수만큼 진행 후 종료")
+    parser.add_argument("--level", default=None,
+                        help="레벨 파일 (예: levels/stage1.json), 없으면 무한 모드")
+    parser.add_argument("--pool-size", type=int, default=256,
+                        help="오브젝트 풀마다 보관할 최대 스프라이트 수")
+    parser.add_argument("--dirty", action="store_true",
+                        help="변경된 영역만 다시 그리는 렌더링 사용")
+    parser.add_argument("--no-background", action="store_true",
+                        help="스크롤 배경 대신 검은 화면 (--dirty는 항상 검은 화면)")
+    parser.add_argument("--bullet-engine", action="store_true",
+                        help="NumPy 배열 기반 총알 엔진 사용 (numpy 필요)")
+    parser.add_argument("--asset-dir", default=None,
+                        help="사운드/이미지 파일 폴더 (기본: 게임 폴더의 assets/)")
+    parser.add_argument("--profile-out", default=None,
+                        help="종료 시 프레임 단계별 시간을 저장할 파일 (.csv 또는 .json)")
+    parser.add_argument("--record", default=None,
+                        help="리플레이 기록 파일 (일반 실행은 기본으로 .cache/replays/last.rpl에 기록)")
+    parser.add_argument("--no-record", action="store_true",
+                        help="리플레이를 기록하지 않음")
+    parser.add_argument("--replay", default=None,
+                        help="리플레이 파일 재생 (--headless면 최대 속도로 재시뮬레이션)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="리플레이 재생 배속")
+    parser.add_argument("--no-hud", action="store_true",
+                        help="점수/남은 기체/FPS 표시 끄기")
+    parser.add_argument("--rewind", type=float, default=5.0,
+                        help="Backspace 되감기로 돌아갈 수 있는 시간(초), 0이면 끔")
+    parser.add_argument("--practice", action="store_true",
+                        help="연습 모드: 게임 오버 후 종료하지 않고 되감아서 이어 하기")
+    options, _ = parser.parse_known_args(argv)
+    if options.headless:
+        use_dummy_drivers()
+        # 헤드리스 실행은 항상 재현 가능해야 하므로 시드 고정
+        if options.seed is None:
+            options.seed = 0
+    return options
+
+
+def use_dummy_drivers():
+    """SDL 더미 드라이버 사용 (pygame.init() 전에 호출해야 함)"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+class SimClock:
+    """pygame.time.Clock 대체 시계
+
+    헤드리스 모드에서는 잠들지 않고 tick()마다 정확히 1프레임 분량의
+    가상 시간만 진행하므로 실행 속도와 무관하게 결과가 동일하다.
+    """
+
+    def __init__(self, headless: bool = False, fps: int = FPS):
+        self.headless = headless
+        self.fps = fps
+        self.frame = 0
+        self._clock = None if headless else pygame.time.Clock()
+
+    def tick(self) -> int:
+        """한 프레임 진행 후 경과 시간(ms) 반환"""
+        self.frame += 1
+        if self.headless:
+            return 1000 // self.fps
+        return self._clock.tick(self.fps)
+
+    def get_ticks(self) -> int:
+        """게임 시간(ms). 헤드리스 모드에서는 프레임 수로 계산"""
+        if self.headless:
+            return self.frame * 1000 // self.fps
+        return pygame.time.get_ticks()
+
+    def get_fps(self) -> float:
+        """최근 실제 FPS (헤드리스 모드에서는 설정값)"""
+        if self.headless:
+            return float(self.fps)
+        return self._clock.get_fps()
+
+    def delay(self, ms: int):
+        """실시간 모드에서만 대기"""
+        if not self.headless:
+            pygame.time.delay(ms)
+
+
+def read_keys() -> int:
+    """현재 눌린 방향키를 비트마스크로 변환"""
+    keys = pygame.key.get_pressed()
+    mask = 0
+    if keys[pygame.K_LEFT]:
+        mask |= INPUT_LEFT
+    if keys[pygame.K_RIGHT]:
+        mask |= INPUT_RIGHT
+    if keys[pygame.K_UP]:
+        mask |= INPUT_UP
+    if keys[pygame.K_DOWN]:
+        mask |= INPUT_DOWN
+    return mask
+
+
+def autopilot(frame: int) -> int:
+    """헤드리스 기본 입력: 좌우로 왕복하며 일정 간격으로 발사"""
+    mask = INPUT_LEFT if (frame // 90) % 2 == 0 else INPUT_RIGHT
+    if frame % 8 == 0:
+        mask |= INPUT_FIRE
+    return mask
+
+
+def state_digest(sprites: Iterable[pygame.sprite.Sprite], extra: Iterable[bytes] = ()) -> str:
+    """스프라이트 위치로 계산한 상태 해시 (회귀 비교용)
+
+    extra: 스프라이트가 아닌 상태 (점수, 난수 상태, 총알 배열 등)를 직렬화한 바이트열들
+    """
+    digest = hashlib.sha1()
+    for sprite in sprites:
+        digest.update(b"%s:%d,%d,%d,%d;" % (type(sprite).__name__.encode(),
+                                            *sprite.rect))
+    for part in extra:
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def run_headless(step: Callable[[int], bool], clock: SimClock, frames: int,
+                 inputs: Callable[[int], int] = autopilot,
+                 render: Optional[Callable[[], None]] = None,
+                 profiler=None) -> int:
+    """프레임 제한 없이 N 프레임 진행, 실제로 진행한 프레임 수 반환
+
+    profiler: begin_frame()/end_frame()을 가진 프레임 측정기 (선택)
+    """
+    for _ in range(frames):
+        clock.tick()
+        if profiler is not None:
+            profiler.begin_frame()
+        alive = step(inputs(clock.frame))
+        if alive and render is not None:
+            render()
+        if profiler is not None:
+            profiler.end_frame()
+        if not alive:
+            break
+    return clock.frame
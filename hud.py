@@ -0,0 +1,112 @@
+"""
+점수 / 남은 기체 / FPS 표시 (HUD)
+pygame.font 렌더링은 비싸므로 매 프레임 글자를 다시 그리지 않는다.
+- 라벨("SCORE" 등)은 처음 한 번만 font.render로 그린다.
+- 숫자는 0~9를 한 줄로 미리 그려 둔 글리프 스트립에서 잘라 붙인다.
+- 항목마다 합성한 Surface를 캐시해 두고 값이 바뀔 때만 다시 합성한다.
+점수가 매 프레임 올라도 font.render는 호출되지 않고 글리프 blit 몇 번만 일어난다.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+DIGITS = "0123456789"
+WHITE = (255, 255, 255)
+FONT_SIZE = 24
+MARGIN = 6
+FPS_REFRESH_MS = 500  # FPS는 이 간격으로만 갱신 (매 프레임 바뀌므로)
+
+
+class GlyphStrip:
+    """글리프를 같은 폭 칸으로 이어 그린 Surface 하나"""
+
+    def __init__(self, font: pygame.font.Font, color=WHITE, chars: str = DIGITS):
+        glyphs = [font.render(char, True, color) for char in chars]
+        self.advance = max(glyph.get_width() for glyph in glyphs)  # 칸 폭 (자릿수가 바뀌어도 안 흔들림)
+        self.height = max(glyph.get_height() for glyph in glyphs)
+        self.image = pygame.Surface((self.advance * len(chars), self.height), pygame.SRCALPHA)
+        self.areas: Dict[str, pygame.Rect] = {}
+        for i, (char, glyph) in enumerate(zip(chars, glyphs)):
+            left = i * self.advance
+            self.image.blit(glyph, (left + (self.advance - glyph.get_width()) // 2, 0))
+            self.areas[char] = pygame.Rect(left, 0, self.advance, self.height)
+
+    def width(self, text: str) -> int:
+        return self.advance * len(text)
+
+    def blit_list(self, text: str, pos: Tuple[int, int]) -> List[tuple]:
+        """Surface.blits에 넘길 (스트립, 위치, 잘라낼 영역) 목록"""
+        x, y = pos
+        image, areas, advance = self.image, self.areas, self.advance
+        return [(image, (x + i * advance, y), areas[char]) for i, char in enumerate(text)]
+
+
+class HudField:
+    """라벨 + 숫자 한 칸 (값이 바뀔 때만 다시 합성)
+
+    digits: 0으로 채울 자릿수 (0이면 필요한 만큼만)
+    """
+
+    def __init__(self, label: pygame.Surface, strip: GlyphStrip, digits: int = 0):
+        self.label = label
+        self.strip = strip
+        self.digits = digits
+        self.value: Optional[int] = None
+        self.image: Optional[pygame.Surface] = None
+        self.composes = 0  # 다시 합성한 횟수
+
+    def set(self, value: int) -> bool:
+        """값 설정, 다시 합성했으면 True"""
+        value = max(0, int(value))
+        if value == self.value:
+            return False
+        self.value = value
+        text = "%0*d" % (self.digits, value)
+        strip = self.strip
+        label_width = self.label.get_width() + MARGIN
+        size = (label_width + strip.width(text), max(self.label.get_height(), strip.height))
+        # 크기가 같으면 Surface를 새로 만들지 않고 지우고 다시 씀
+        if self.image is None or self.image.get_size() != size:
+            self.image = pygame.Surface(size, pygame.SRCALPHA)
+            self.image.blit(self.label, (0, (size[1] - self.label.get_height()) // 2))
+        else:
+            self.image.fill((0, 0, 0, 0), (label_width, 0, size[0] - label_width, size[1]))
+        self.image.blits(strip.blit_list(text, (label_width, (size[1] - strip.height) // 2)),
+                         doreturn=False)
+        self.composes += 1
+        return True
+
+
+class Hud:
+    """화면 오른쪽 위 점수/남은 기체, 오른쪽 아래 FPS"""
+
+    def __init__(self, size: Tuple[int, int], font_size: int = FONT_SIZE, color=WHITE):
+        self.size = size
+        font = pygame.font.Font(None, font_size)
+        strip = GlyphStrip(font, color)
+        self.score = HudField(font.render("SCORE", True, color), strip, digits=6)
+        self.lives = HudField(font.render("LIVES", True, color), strip)
+        self.fps = HudField(font.render("FPS", True, color), strip)
+        self.font_renders = len(DIGITS) + 3  # 만들 때 한 번씩만
+        self._fps_refresh = -FPS_REFRESH_MS
+
+    def blit_list(self, score: int, lives: int, fps: float, now: int) -> List[tuple]:
+        """HUD (이미지, 위치) 목록 (now: 게임 시간 ms - FPS 갱신 간격용)"""
+        self.score.set(score)
+        self.lives.set(lives)
+        if now - self._fps_refresh >= FPS_REFRESH_MS or now < self._fps_refresh:
+            self._fps_refresh = now
+            self.fps.set(round(fps))
+        width, height = self.size
+        score, lives, fps_image = self.score.image, self.lives.image, self.fps.image
+        return [(score, (width - MARGIN - score.get_width(), MARGIN)),
+                (lives, (width - MARGIN - lives.get_width(), MARGIN * 2 + score.get_height())),
+                (fps_image, (width - MARGIN - fps_image.get_width(),
+                             height - MARGIN - fps_image.get_height()))]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """font.render 호출 수와 항목별 재합성 수"""
+        return {"font_renders": self.font_renders, "score": self.score.composes,
+                "lives": self.lives.composes, "fps": self.fps.composes}
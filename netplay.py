@@ -0,0 +1,727 @@
+#!/usr/bin/env python3
+"""
+2인 협동 네트워크 플레이 (asyncio UDP)
+서버가 World(players=2)를 고정 틱으로 진행하는 유일한 시뮬레이션이고, 클라이언트는
+입력 비트마스크만 보내고 받은 스냅샷을 그린다.
+
+- 스냅샷은 클라이언트가 마지막으로 확인(ack)한 스냅샷과의 차이만 보낸다.
+  바뀌지 않은 엔티티는 생략하고, 위치가 조금 바뀌면 1바이트씩, 많이 바뀌면 2바이트씩 보낸다.
+  ack가 없거나 너무 오래됐으면 전체를 보낸다 (UDP라 유실돼도 다음 스냅샷으로 복구).
+- 스냅샷은 매 틱이 아니라 SNAPSHOT_RATE(기본 20Hz)로 보내고, 클라이언트는
+  INTERP_DELAY_MS만큼 늦게 두 스냅샷 사이를 보간해서 부드럽게 그린다.
+- 같은 기준 스냅샷을 가진 클라이언트끼리는 인코딩 결과를 공유하므로
+  클라이언트가 늘어도 서버 비용은 거의 늘지 않는다.
+- 발사는 누른 횟수 카운터로 보내서 입력 패킷이 유실되거나 겹쳐도 빠지거나 중복되지 않는다.
+- CHUNK_SIZE보다 큰 스냅샷(탄막이 많을 때의 전체 스냅샷 등)은 여러 조각으로 나눠 보내고
+  클라이언트는 조각이 모두 모이면 하나로 합쳐 처리한다 (하나라도 유실되면 그 스냅샷은 버림).
+- 클라이언트는 효과음을 재생하지 않는다.
+
+    python netplay.py serve --port 1945                # 서버 (두 명이 들어오면 시작)
+    python netplay.py join --host 127.0.0.1 --port 1945
+    python netplay.py selftest --sessions 8 --loss 0.1  # localhost에서 서버 + 봇 클라이언트 측정
+
+    패킷 형식 (리틀 엔디언, 첫 바이트가 종류)
+    J  클라이언트 -> 서버  참가 요청 (프로토콜 버전)
+    W  서버 -> 클라이언트  참가 수락 (플레이어 번호, 인원, 시드, 틱 속도, 스냅샷 간격)
+    R  서버 -> 클라이언트  참가 거절 (자리 없음 / 버전 다름)
+    I  클라이언트 -> 서버  입력 (플레이어 번호, 방향키 비트마스크, 발사 카운터, 받은 스냅샷 번호)
+    S  서버 -> 클라이언트  스냅샷 (SNAPSHOT 헤더 + 사라진 id + 엔티티 + 엔진 총알)
+    C  서버 -> 클라이언트  CHUNK_SIZE보다 큰 스냅샷의 조각 (CHUNK 헤더 + S 패킷 일부)
+"""
+
+import argparse
+import asyncio
+import random
+import struct
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+import headless
+import world as game
+from timestep import SIM_HZ, SNAP_DISTANCE
+
+PROTOCOL = 2
+SNAPSHOT_RATE = 20  # 초당 스냅샷 수
+INTERP_DELAY_MS = 100  # 클라이언트가 서버 시간보다 늦게 그리는 정도 (스냅샷 두 개 분량)
+HISTORY = 64  # 기준으로 쓸 수 있는 지난 스냅샷 수
+PEER_TIMEOUT = 5.0  # 이 시간(초) 동안 입력이 없으면 입력 없음으로 처리
+JOIN_RETRY = 0.5  # 참가 요청 재전송 간격(초)
+MAX_PENDING_FIRE = 4  # 밀린 발사 입력 최대 수
+FINAL_REPEAT = 3  # 게임 종료 스냅샷 재전송 횟수
+MAX_PENDING_CHUNKS = 8  # 조각을 모으는 중인 스냅샷 최대 수
+MAX_SNAPSHOT = 60000  # 스냅샷 하나의 엔진 총알 최대 크기 x 2 (넘는 총알은 잘라서 보냄)
+CHUNK_SIZE = 1200  # UDP 패킷 하나에 싣는 최대 크기 (IP 조각화 없이 보낼 수 있는 크기)
+
+JOIN = struct.Struct("<cH")
+WELCOME = struct.Struct("<cHBBqHB")
+REJECT = struct.Struct("<cH")
+INPUT = struct.Struct("<cBBBI")
+# 종류, 번호, 기준 번호(0: 전체), 서버 스텝, 격추 수, 생존 플레이어 비트, 플래그,
+# 사라진 id 수, 엔티티 수, 엔진 총알 수
+SNAPSHOT = struct.Struct("<cIIIHBBHHH")
+CHUNK = struct.Struct("<cIHH")  # 종류, 스냅샷 번호, 조각 번호, 조각 수
+NET_ID = struct.Struct("<H")
+ENTITY = struct.Struct("<HB")
+KIND = struct.Struct("<B")
+SMALL_MOVE = struct.Struct("<bb")
+POSITION = struct.Struct("<hh")
+
+# 엔티티 플래그
+F_KIND = 1  # 종류(이미지) 포함
+F_SMALL = 2  # 위치 변화량 1바이트씩
+F_POSITION = 4  # 위치 2바이트씩
+# 스냅샷 플래그
+S_GAME_OVER = 1
+
+# 엔티티 종류 코드 (서버와 클라이언트가 같은 목록을 씀, 보스는 BOSS_BASE부터 이름순)
+EXPLOSION_SIZES = (30, 50, 60)
+KINDS = ([("player", index) for index in range(len(game.PLAYER_COLORS))] + ["bullet"]
+         + [("enemy", index) for index in range(len(game.ENEMY_COLORS))]
+         + [("enemy_bullet", bullet_type) for bullet_type in range(4)]
+         + [("explosion", size, frame) for size in EXPLOSION_SIZES
+            for frame in range(len(game.EXPLOSION_COLORS))])
+KIND_CODES = {key: code for code, key in enumerate(KINDS)}
+BOSS_BASE = 200
+VELOCITY_SCALE = 8  # 엔진 총알 속도는 1/8 px 단위 1바이트
+
+
+def _boss_names() -> List[str]:
+    import patterns
+    return sorted(patterns.BOSSES)
+
+
+# 스프라이트 클래스별 종류 키
+_KEY_OF: Dict[type, Callable] = {
+    game.Player: lambda sprite: ("player", sprite.index),
+    game.Bullet: lambda sprite: "bullet",
+    game.Enemy: lambda sprite: ("enemy", game.ENEMY_COLORS.index(sprite.color)),
+    game.EnemyBullet: lambda sprite: ("enemy_bullet", sprite.bullet_type),
+    game.Explosion: lambda sprite: ("explosion", sprite.size, sprite.frame),
+}
+
+
+def kind_code(sprite) -> Optional[int]:
+    """스프라이트의 종류 코드 (보낼 수 없는 스프라이트면 None)"""
+    if isinstance(sprite, game.Boss):
+        return BOSS_BASE + _boss_names().index(sprite.name)
+    key_of = _KEY_OF.get(type(sprite))
+    return KIND_CODES.get(key_of(sprite)) if key_of is not None else None
+
+
+_kind_images: Dict[int, pygame.Surface] = {}
+
+
+def kind_image(code: int) -> pygame.Surface:
+    """종류 코드의 이미지 (서버 월드와 같은 스프라이트 캐시 사용)"""
+    image = _kind_images.get(code)
+    if image is None:
+        if code >= BOSS_BASE:
+            image = game.boss_image(_boss_names()[code - BOSS_BASE])
+        else:
+            key = KINDS[code]
+            if key == "bullet":
+                image = game.images.get("bullet")
+            elif key[0] == "player":
+                image = game.images.get("player" if key[1] == 0 else key)
+            elif key[0] == "enemy":
+                image = game.images.get(("enemy", game.ENEMY_COLORS[key[1]]))
+            elif key[0] == "enemy_bullet":
+                image = game.images.get(key)
+            else:
+                import animation
+                image = animation.circle_frames(key[1], game.EXPLOSION_COLORS)[key[2]]
+        _kind_images[code] = image
+    return image
+
+
+# ----- 스냅샷 인코딩 -----
+
+def encode_entities(table: Dict[int, tuple], base: Dict[int, tuple]) -> Tuple[list, list]:
+    """base와 달라진 부분만 -> (사라진 id 목록, 엔티티 레코드 bytes 목록)"""
+    removed = [net_id for net_id in base if net_id not in table]
+    records = []
+    for net_id, entity in table.items():
+        old = base.get(net_id)
+        if old == entity:
+            continue
+        code, x, y = entity
+        flags = 0
+        parts = []
+        if old is None or old[0] != code:
+            flags |= F_KIND
+            parts.append(KIND.pack(code))
+        if old is None:
+            flags |= F_POSITION
+            parts.append(POSITION.pack(x, y))
+        elif old[1] != x or old[2] != y:
+            dx, dy = x - old[1], y - old[2]
+            if -128 <= dx <= 127 and -128 <= dy <= 127:
+                flags |= F_SMALL
+                parts.append(SMALL_MOVE.pack(dx, dy))
+            else:
+                flags |= F_POSITION
+                parts.append(POSITION.pack(x, y))
+        records.append(ENTITY.pack(net_id, flags) + b"".join(parts))
+    return removed, records
+
+
+def decode_entities(data: bytes, offset: int, base: Dict[int, tuple], removed: int,
+                    count: int) -> Tuple[Dict[int, tuple], int]:
+    """encode_entities의 반대 -> (새 엔티티 표, 다음 읽을 위치)"""
+    table = dict(base)
+    for _ in range(removed):
+        table.pop(NET_ID.unpack_from(data, offset)[0], None)
+        offset += NET_ID.size
+    for _ in range(count):
+        net_id, flags = ENTITY.unpack_from(data, offset)
+        offset += ENTITY.size
+        code, x, y = table.get(net_id, (0, 0, 0))
+        if flags & F_KIND:
+            code = KIND.unpack_from(data, offset)[0]
+            offset += KIND.size
+        if flags & F_POSITION:
+            x, y = POSITION.unpack_from(data, offset)
+            offset += POSITION.size
+        elif flags & F_SMALL:
+            dx, dy = SMALL_MOVE.unpack_from(data, offset)
+            x, y = x + dx, y + dy
+            offset += SMALL_MOVE.size
+        table[net_id] = (code, x, y)
+    return table, offset
+
+
+def _bullet_dtype():
+    import numpy as np
+    return np.dtype([("x", "<i2"), ("y", "<i2"), ("vx", "i1"), ("vy", "i1"), ("code", "u1")])
+
+
+def encode_engines(engines: list, limit: int) -> Tuple[bytes, int]:
+    """엔진 총알 전체 (x, y, 속도, 종류 코드) - 개별 id가 없으므로 매번 전부 보냄"""
+    import numpy as np
+    total = sum(engine.count for engine in engines)
+    if total == 0:
+        return b"", 0
+    dtype = _bullet_dtype()
+    out = np.empty(min(total, limit // dtype.itemsize), dtype=dtype)
+    start = 0
+    for engine in engines:
+        n = min(engine.count, len(out) - start)
+        if n <= 0:
+            break
+        # 엔진의 총알 종류 -> 엔티티 종류 코드
+        if len(engine.images) == 1:
+            codes = np.array([KIND_CODES["bullet"]], dtype=np.uint8)
+        else:
+            codes = np.array([KIND_CODES[("enemy_bullet", kind)]
+                              for kind in range(len(engine.images))], dtype=np.uint8)
+        part = out[start:start + n]
+        part["x"] = engine.x[:n]
+        part["y"] = engine.y[:n]
+        part["vx"] = np.clip(engine.vx[:n] * VELOCITY_SCALE, -127, 127)
+        part["vy"] = np.clip(engine.vy[:n] * VELOCITY_SCALE, -127, 127)
+        part["code"] = codes[engine.kind[:n]]
+        start += n
+    return out.tobytes(), len(out)
+
+
+def split_snapshot(seq: int, packet: bytes, size: int = CHUNK_SIZE) -> List[bytes]:
+    """스냅샷 패킷 -> 보낼 UDP 패킷 목록 (size 이하면 그대로, 넘으면 C 조각들)"""
+    if len(packet) <= size:
+        return [packet]
+    step = size - CHUNK.size
+    count = (len(packet) + step - 1) // step
+    if count > 0xFFFF:
+        raise ValueError("스냅샷이 너무 큽니다: %d바이트" % len(packet))
+    return [CHUNK.pack(b"C", seq, index, count) + packet[index * step:(index + 1) * step]
+            for index in range(count)]
+
+
+# ----- 서버 -----
+
+class Peer:
+    """서버가 보는 클라이언트 한 명"""
+
+    def __init__(self, addr, index: int):
+        self.addr = addr
+        self.index = index
+        self.keys = 0  # 방향키 비트마스크
+        self.fire_count = 0  # 클라이언트가 보낸 발사 카운터
+        self.fired = 0  # 서버가 처리한 발사 카운터
+        self.ack = 0  # 클라이언트가 받은 마지막 스냅샷 번호
+        self.last_seen = time.monotonic()
+        self.bytes_sent = 0
+        self.snapshots = 0
+
+    def keys_for_step(self) -> int:
+        """이번 스텝 입력 (밀린 발사는 스텝마다 한 발씩)"""
+        if time.monotonic() - self.last_seen > PEER_TIMEOUT:
+            self.keys = 0
+        keys = self.keys
+        pending = (self.fire_count - self.fired) % 256
+        if pending:
+            if pending > MAX_PENDING_FIRE:
+                self.fired = (self.fire_count - MAX_PENDING_FIRE) % 256
+            self.fired = (self.fired + 1) % 256
+            keys |= headless.INPUT_FIRE
+        return keys
+
+
+class CoopServer(asyncio.DatagramProtocol):
+    """권위 있는 시뮬레이션 서버 (게임 한 판)"""
+
+    def __init__(self, seed: int = 0, players: int = 2, level=None, bullet_engine: bool = False,
+                 tick_rate: int = SIM_HZ, snapshot_rate: int = SNAPSHOT_RATE):
+        self.seed = seed
+        self.players = players
+        self.world = game.World(seed=seed, players=players, level=level,
+                                bullet_engine=bullet_engine)
+        self.tick_rate = tick_rate
+        self.snapshot_every = max(1, tick_rate // snapshot_rate)
+        self.transport = None
+        self.peers: List[Peer] = []
+        self.ready = asyncio.Event()  # 모두 참가하면 시작
+        self.seq = 0
+        self.history: Dict[int, Dict[int, tuple]] = {}  # 스냅샷 번호 -> 엔티티 표
+        self.last_id = 0
+        self.live_ids: set = set()  # 직전 엔티티 표의 id (한 바퀴 돈 뒤 새 id가 겹치지 않도록)
+        self.cpu_time = 0.0  # 스텝 + 스냅샷에 쓴 시간(초)
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr):
+        kind = data[:1]
+        if kind == b"I" and len(data) == INPUT.size:
+            _, index, keys, fire_count, ack = INPUT.unpack(data)
+            if index < len(self.peers) and self.peers[index].addr == addr:
+                peer = self.peers[index]
+                peer.keys = keys & ~headless.INPUT_FIRE
+                peer.fire_count = fire_count
+                peer.ack = max(peer.ack, ack) if ack <= self.seq else peer.ack
+                peer.last_seen = time.monotonic()
+        elif kind == b"J" and len(data) == JOIN.size:
+            self._join(JOIN.unpack(data)[1], addr)
+
+    def _join(self, version: int, addr):
+        peer = next((peer for peer in self.peers if peer.addr == addr), None)
+        if peer is None:
+            if version != PROTOCOL or len(self.peers) >= self.players:
+                self.transport.sendto(REJECT.pack(b"R", PROTOCOL), addr)
+                return
+            peer = Peer(addr, len(self.peers))
+            self.peers.append(peer)
+        # 수락 응답이 유실됐을 수 있으므로 같은 주소면 다시 보냄
+        self.transport.sendto(WELCOME.pack(b"W", PROTOCOL, peer.index, self.players, self.seed,
+                                           self.tick_rate, self.snapshot_every), addr)
+        if len(self.peers) == self.players:
+            self.ready.set()
+
+    async def run(self, frames: Optional[int] = None) -> int:
+        """모두 참가하면 게임이 끝날 때까지 (또는 frames 스텝) 진행, 진행한 스텝 수 반환"""
+        await self.ready.wait()
+        loop = asyncio.get_running_loop()
+        world = self.world
+        step_s = 1.0 / self.tick_rate
+        next_time = loop.time()
+        running = True
+        while running:
+            start = time.perf_counter()
+            running = world.step([peer.keys_for_step() for peer in self.peers])
+            if frames is not None and world.frame >= frames:
+                running = False
+            if not running:
+                for _ in range(FINAL_REPEAT):
+                    self.broadcast(final=True)
+            elif world.frame % self.snapshot_every == 0:
+                self.broadcast()
+            self.cpu_time += time.perf_counter() - start
+            next_time += step_s
+            delay = next_time - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -0.25:
+                next_time = loop.time()  # 많이 밀렸으면 따라잡지 않고 다시 맞춤
+        return world.frame
+
+    def entity_table(self) -> Dict[int, tuple]:
+        """지금 월드의 스프라이트 -> {네트워크 id: (종류 코드, x, y)}
+
+        id는 스프라이트의 net_id에 기록해 살아 있는 동안 유지한다. 풀에서 재사용된
+        스프라이트는 net_id가 지워지므로 (pools.SpritePool.acquire) 새 id를 받는다.
+        """
+        table = {}
+        for sprite in self.world.all_sprites:
+            code = kind_code(sprite)
+            if code is None:
+                continue
+            net_id = getattr(sprite, "net_id", None)
+            if net_id is None:
+                net_id = sprite.net_id = self._new_id(table)
+            table[net_id] = (code, sprite.rect.x, sprite.rect.y)
+        self.live_ids = set(table)
+        return table
+
+    def _new_id(self, table: Dict[int, tuple]) -> int:
+        """다음 네트워크 id (1~0xFFFF를 돌아가며 쓰고, 살아 있는 스프라이트가 가진 id는 건너뜀)"""
+        for _ in range(0xFFFF):
+            self.last_id = self.last_id % 0xFFFF + 1
+            if self.last_id not in self.live_ids and self.last_id not in table:
+                return self.last_id
+        raise RuntimeError("네트워크 id가 모자랍니다 (엔티티 %d개)" % len(table))
+
+    def broadcast(self, final: bool = False):
+        """스냅샷을 만들어 클라이언트마다 ack 기준 차이로 전송"""
+        world = self.world
+        self.seq += 1
+        table = self.entity_table()
+        self.history[self.seq] = table
+        self.history.pop(self.seq - HISTORY, None)
+        engines = world.bullet_engines()
+        bullets, bullet_count = encode_engines(engines, MAX_SNAPSHOT // 2) if engines else (b"", 0)
+        alive = sum(1 << player.index for player in world.players if player.alive())
+        flags = S_GAME_OVER if final else 0
+        encoded: Dict[int, List[bytes]] = {}  # 기준 스냅샷 번호 -> 패킷들 (같은 기준이면 공유)
+        for peer in self.peers:
+            base = peer.ack if peer.ack in self.history else 0
+            datagrams = encoded.get(base)
+            if datagrams is None:
+                removed, records = encode_entities(table, self.history[base] if base else {})
+                packet = b"".join([
+                    SNAPSHOT.pack(b"S", self.seq, base, world.frame, world.kills & 0xFFFF, alive,
+                                  flags, len(removed), len(records), bullet_count),
+                    b"".join(NET_ID.pack(net_id) for net_id in removed),
+                    b"".join(records), bullets])
+                datagrams = encoded[base] = split_snapshot(self.seq, packet)
+            for datagram in datagrams:
+                self.transport.sendto(datagram, peer.addr)
+                peer.bytes_sent += len(datagram)
+            peer.snapshots += 1
+
+
+# ----- 클라이언트 -----
+
+class CoopClient(asyncio.DatagramProtocol):
+    """입력을 보내고 스냅샷을 받아 보간하는 클라이언트
+
+    loss: 받은 스냅샷을 이 확률로 버림 (유실 테스트용)
+    """
+
+    def __init__(self, interp_delay_ms: float = INTERP_DELAY_MS, loss: float = 0.0,
+                 loss_seed: int = 0):
+        self.interp_delay_ms = interp_delay_ms
+        self.loss = loss
+        self.loss_rng = random.Random(loss_seed)
+        self.transport = None
+        self.joined = asyncio.Event()
+        self.rejected = False
+        self.index: Optional[int] = None
+        self.players = 0
+        self.seed = 0
+        self.step_ms = 1000.0 / SIM_HZ
+        self.states: Dict[int, Dict[int, tuple]] = {}  # 스냅샷 번호 -> 엔티티 표 (차이 기준)
+        self.chunks: Dict[int, list] = {}  # 조각으로 받는 중인 스냅샷 번호 -> 조각 목록
+        self.buffer: List[dict] = []  # 보간용 스냅샷 (서버 스텝 순)
+        self.ack = 0
+        self.offset: Optional[float] = None  # 서버 시간(ms) - 로컬 시간(ms) 추정
+        self.fire_count = 0
+        self.finished = False
+        self.bytes_received = 0
+        self.snapshots = 0
+        self.dropped = 0  # 기준 스냅샷이 없어 버린 수
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr):
+        kind = data[:1]
+        if kind in b"SC" and self.loss and self.loss_rng.random() < self.loss:
+            return
+        if kind == b"S" and len(data) >= SNAPSHOT.size:
+            self.bytes_received += len(data)
+            self._snapshot(data)
+        elif kind == b"C" and len(data) > CHUNK.size:
+            self.bytes_received += len(data)
+            self._chunk(data)
+        elif kind == b"W" and len(data) == WELCOME.size:
+            _, _, index, players, seed, tick_rate, _ = WELCOME.unpack(data)
+            self.index, self.players, self.seed = index, players, seed
+            self.step_ms = 1000.0 / tick_rate
+            self.joined.set()
+        elif kind == b"R":
+            self.rejected = True
+            self.joined.set()
+
+    def _chunk(self, data: bytes):
+        """스냅샷 조각 모으기 (모두 모이면 스냅샷으로 처리)"""
+        _, seq, index, count = CHUNK.unpack_from(data)
+        if seq <= self.ack or index >= count:
+            return
+        parts = self.chunks.get(seq)
+        if parts is None:
+            # 모이지 않은 스냅샷이 너무 많으면 가장 오래된 것부터 버림
+            while len(self.chunks) >= MAX_PENDING_CHUNKS:
+                del self.chunks[min(self.chunks)]
+            parts = self.chunks[seq] = [None] * count
+        if len(parts) != count:
+            return
+        parts[index] = data[CHUNK.size:]
+        if None in parts:
+            return
+        del self.chunks[seq]
+        packet = b"".join(parts)
+        if len(packet) >= SNAPSHOT.size and packet[:1] == b"S":
+            self._snapshot(packet)
+
+    def _snapshot(self, data: bytes):
+        (_, seq, base, tick, kills, alive, flags, removed, count,
+         bullet_count) = SNAPSHOT.unpack_from(data)
+        if seq <= self.ack:
+            return  # 늦게 도착했거나 중복
+        if base and base not in self.states:
+            self.dropped += 1
+            return
+        table, offset = decode_entities(data, SNAPSHOT.size, self.states.get(base, {}),
+                                        removed, count)
+        self.states[seq] = table
+        for old in [old for old in self.states if old <= seq - HISTORY]:
+            del self.states[old]
+        self.ack = seq
+        # 적용한 스냅샷보다 오래된, 받다 만 조각은 버림
+        for old in [old for old in self.chunks if old <= seq]:
+            del self.chunks[old]
+        self.snapshots += 1
+        bullets = None
+        if bullet_count:
+            import numpy as np
+            bullets = np.frombuffer(data, _bullet_dtype(), bullet_count, offset)
+        self.buffer.append({"tick": tick, "entities": table, "bullets": bullets,
+                            "kills": kills, "alive": alive})
+        if flags & S_GAME_OVER:
+            self.finished = True
+        # 가장 빨리 도착한 패킷 기준으로 서버 시계 추정 (늦게 온 패킷 쪽으로는 천천히)
+        offset_ms = tick * self.step_ms - time.monotonic() * 1000.0
+        if self.offset is None or offset_ms > self.offset:
+            self.offset = offset_ms
+        else:
+            self.offset += (offset_ms - self.offset) * 0.02
+
+    async def join(self, timeout: float = 10.0) -> bool:
+        """참가 요청 (수락될 때까지 재전송), 수락되면 True"""
+        deadline = time.monotonic() + timeout
+        while not self.joined.is_set() and time.monotonic() < deadline:
+            self.transport.sendto(JOIN.pack(b"J", PROTOCOL))
+            try:
+                await asyncio.wait_for(self.joined.wait(), JOIN_RETRY)
+            except asyncio.TimeoutError:
+                pass
+        return self.joined.is_set() and not self.rejected
+
+    def send_input(self, keys: int):
+        """입력 전송 (INPUT_FIRE는 누른 횟수로 바꿔 보냄)"""
+        if keys & headless.INPUT_FIRE:
+            self.fire_count = (self.fire_count + 1) % 256
+        self.transport.sendto(INPUT.pack(b"I", self.index, keys & ~headless.INPUT_FIRE & 0xFF,
+                                         self.fire_count, self.ack))
+
+    def view(self) -> Tuple[list, Optional[dict]]:
+        """지금 그릴 (종류 코드, x, y) 목록과 기준 스냅샷 (서버 시간보다 interp_delay_ms 늦게)"""
+        buffer = self.buffer
+        if not buffer:
+            return [], None
+        now = time.monotonic() * 1000.0 + self.offset - self.interp_delay_ms
+        t = now / self.step_ms  # 서버 스텝 단위
+        # t를 사이에 둔 두 스냅샷 (지난 것은 버림)
+        while len(buffer) > 2 and buffer[1]["tick"] <= t:
+            buffer.pop(0)
+        s0 = buffer[0]
+        s1 = buffer[1] if len(buffer) > 1 else s0
+        span = s1["tick"] - s0["tick"]
+        alpha = min(max((t - s0["tick"]) / span, 0.0), 1.0) if span else 0.0
+        next_entities = s1["entities"]
+        items = []
+        for net_id, (code, x, y) in s0["entities"].items():
+            target = next_entities.get(net_id)
+            if (target is not None and target[0] == code
+                    and abs(target[1] - x) + abs(target[2] - y) < SNAP_DISTANCE):
+                x += (target[1] - x) * alpha
+                y += (target[2] - y) * alpha
+            items.append((code, x, y))
+        bullets = s0["bullets"]
+        if bullets is not None:
+            # 엔진 총알은 id가 없으므로 속도로 외삽
+            elapsed = min(max(t - s0["tick"], 0.0), span or 0.0) / VELOCITY_SCALE
+            xs = bullets["x"] + bullets["vx"] * elapsed
+            ys = bullets["y"] + bullets["vy"] * elapsed
+            items.extend(zip(bullets["code"].tolist(), xs.tolist(), ys.tolist()))
+        return items, s0
+
+    @staticmethod
+    def draw(surface: pygame.Surface, items: list):
+        """view()로 얻은 목록 그리기"""
+        surface.blits([(kind_image(code), (int(x), int(y))) for code, x, y in items],
+                      doreturn=False)
+
+    async def play(self, inputs: Callable[[int], int], frames: Optional[int] = None,
+                   render: Optional[Callable[["CoopClient"], bool]] = None) -> int:
+        """초당 SIM_HZ번 inputs(프레임)을 보내고 render(클라이언트)로 그림
+
+        게임이 끝나거나 frames 프레임이 지나거나 render가 False를 반환하면 끝, 보낸 입력 수 반환
+        """
+        loop = asyncio.get_running_loop()
+        frame = 0
+        next_time = loop.time()
+        while not self.finished and (frames is None or frame < frames):
+            frame += 1
+            self.send_input(inputs(frame))
+            if render is not None and not render(self):
+                break
+            next_time += 1.0 / SIM_HZ
+            await asyncio.sleep(max(0.0, next_time - loop.time()))
+        return frame
+
+
+# ----- 실행 -----
+
+async def serve(options):
+    level = None
+    if options.level:
+        import waves
+        level = waves.load(options.level)
+    server = CoopServer(seed=options.seed, players=options.players, level=level,
+                        bullet_engine=options.bullet_engine)
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: server, local_addr=(options.host, options.port))
+    print("서버 %s:%d - %d명 대기 중 (시드 %d)" % (options.host, options.port, options.players,
+                                             options.seed))
+    frames = await server.run()
+    transport.close()
+    print("종료: %d스텝, 격추 %d, 스텝당 서버 시간 %.3fms" % (
+        frames, server.world.kills, 1000.0 * server.cpu_time / max(frames, 1)))
+
+
+async def join(options):
+    client = CoopClient()
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: client, remote_addr=(options.host, options.port))
+    if not await client.join():
+        print("참가 실패 (서버가 없거나 자리가 없음)")
+        transport.close()
+        return
+
+    if options.bot:
+        offset = 45 * client.index
+        frames = await client.play(lambda frame: headless.autopilot(frame + offset))
+    else:
+        pygame.init()
+        screen = pygame.display.set_mode((game.WIDTH, game.HEIGHT))
+        pygame.display.set_caption("1945 협동 - %dP" % (client.index + 1))
+        game.images.preload()
+        import background
+        scenery = background.ParallaxBackground((game.WIDTH, game.HEIGHT))
+        state = {"fire": 0, "running": True}
+
+        def inputs(frame):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    state["running"] = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    state["fire"] = headless.INPUT_FIRE
+            keys = headless.read_keys() | state["fire"]
+            state["fire"] = 0
+            return keys
+
+        def render(client):
+            items, snapshot = client.view()
+            tick = snapshot["tick"] if snapshot else 0
+            scenery.draw(screen, tick * client.step_ms)
+            client.draw(screen, items)
+            pygame.display.flip()
+            if snapshot:
+                pygame.display.set_caption("1945 협동 - %dP  격추 %d" % (client.index + 1,
+                                                                       snapshot["kills"]))
+            return state["running"]
+
+        frames = await client.play(inputs, render=render)
+        pygame.quit()
+    transport.close()
+    print("종료: %d프레임, 받은 스냅샷 %d개, 평균 %.1fkB/s" % (
+        frames, client.snapshots, client.bytes_received / 1024.0 / max(frames / SIM_HZ, 1e-9)))
+
+
+async def selftest(options):
+    """localhost에서 서버 여러 개와 봇 클라이언트를 함께 돌려 대역폭/서버 비용/복원 확인"""
+    loop = asyncio.get_running_loop()
+    frames = options.seconds * SIM_HZ
+    sessions = []
+    for session in range(options.sessions):
+        server = CoopServer(seed=session, players=2, bullet_engine=options.bullet_engine)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda server=server: server, local_addr=("127.0.0.1", 0))
+        port = transport.get_extra_info("sockname")[1]
+        clients = []
+        for index in range(2):
+            client = CoopClient(loss=options.loss, loss_seed=session * 2 + index)
+            await loop.create_datagram_endpoint(lambda client=client: client,
+                                                remote_addr=("127.0.0.1", port))
+            clients.append(client)
+        sessions.append((server, clients))
+
+    async def bot(client, offset):
+        if await client.join():
+            await client.play(lambda frame: headless.autopilot(frame + offset))
+
+    start = time.perf_counter()
+    await asyncio.gather(*[server.run(frames) for server, _ in sessions],
+                         *[bot(client, 45 * index) for _, clients in sessions
+                           for index, client in enumerate(clients)])
+    elapsed = time.perf_counter() - start
+
+    print("session  steps  kills  server ms/step  snapshot B  client kB/s  dropped  state")
+    for session, (server, clients) in enumerate(sessions):
+        steps = server.world.frame
+        sent = sum(peer.bytes_sent for peer in server.peers)
+        snapshots = sum(peer.snapshots for peer in server.peers)
+        seconds = steps / SIM_HZ
+        # 클라이언트가 복원한 마지막 상태가 서버가 보낸 상태와 같은지
+        same = all(client.states.get(client.ack) == server.history.get(client.ack)
+                   for client in clients)
+        print("%7d  %5d  %5d  %14.3f  %10.0f  %11.2f  %7d  %s" % (
+            session, steps, server.world.kills, 1000.0 * server.cpu_time / max(steps, 1),
+            sent / max(snapshots, 1), sent / 1024.0 / len(clients) / max(seconds, 1e-9),
+            sum(client.dropped for client in clients), "ok" if same else "MISMATCH"))
+    print("%d sessions in %.1fs" % (len(sessions), elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="2인 협동 네트워크 플레이")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="서버 실행")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=1945)
+    serve_parser.add_argument("--seed", type=int, default=0)
+    serve_parser.add_argument("--players", type=int, default=2)
+    serve_parser.add_argument("--level", help="레벨 파일 (없으면 무한 모드)")
+    serve_parser.add_argument("--bullet-engine", action="store_true")
+    join_parser = commands.add_parser("join", help="서버에 참가")
+    join_parser.add_argument("--host", default="127.0.0.1")
+    join_parser.add_argument("--port", type=int, default=1945)
+    join_parser.add_argument("--bot", action="store_true", help="창 없이 자동 입력")
+    test_parser = commands.add_parser("selftest", help="localhost 측정")
+    test_parser.add_argument("--sessions", type=int, default=4)
+    test_parser.add_argument("--seconds", type=int, default=10)
+    test_parser.add_argument("--loss", type=float, default=0.0, help="스냅샷 유실 확률")
+    test_parser.add_argument("--bullet-engine", action="store_true")
+    options = parser.parse_args()
+
+    if options.command != "join" or options.bot:
+        headless.use_dummy_drivers()
+    command = {"serve": serve, "join": join, "selftest": selftest}[options.command]
+    asyncio.run(command(options))
+
+
+if __name__ == "__main__":
+    main()
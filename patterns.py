@@ -0,0 +1,107 @@
+"""
+보스 / 정예 적 탄막 패턴
+패턴은 데이터(PATTERNS)로 정의하고, Emitter가 발사 시각마다 패턴의 총알 전체를
+NumPy 배열로 계산해 BulletEngine.spawn_many()로 한 번에 넣는다.
+총알 하나마다 파이썬 객체를 만들지 않으므로 화면에 수천 발이 있어도 된다.
+난수를 쓰지 않고 시각만으로 계산하므로 결과는 항상 같다.
+
+패턴 필드
+- shape: "radial" (원형 전방위), "spiral" (발사마다 turn만큼 회전하는 원형),
+         "fan" (부채꼴), "wave" (부채꼴 방향이 사인파로 흔들림)
+- count: 한 번에 쏘는 총알 수, speed: 속도(px/스텝), interval: 발사 간격(ms)
+- kind: 총알 모양 (0 원형, 1 삼각형, 2 사각형, 3 다이아몬드)
+- turn: 발사마다 회전 각도(도), spread: 부채꼴 전체 각도(도)
+- aim: True면 부채꼴 중심을 플레이어 쪽으로
+- amplitude / frequency: wave의 흔들림 각도(도) / 초당 횟수
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DOWN = 90.0  # 화면 아래 방향 각도 (y축이 아래로 증가)
+
+PATTERNS: Dict[str, dict] = {
+    "radial_16": {"shape": "radial", "count": 16, "speed": 2.5, "interval": 1000, "kind": 0},
+    "radial_32": {"shape": "radial", "count": 32, "speed": 2.0, "interval": 700, "kind": 2},
+    "spiral_3": {"shape": "spiral", "count": 3, "speed": 2.5, "interval": 70, "turn": 13,
+                 "kind": 0},
+    "spiral_6": {"shape": "spiral", "count": 6, "speed": 3.0, "interval": 50, "turn": -9,
+                 "kind": 3},
+    "fan_5": {"shape": "fan", "count": 5, "speed": 3.5, "interval": 800, "spread": 50,
+              "aim": True, "kind": 1},
+    "fan_9": {"shape": "fan", "count": 9, "speed": 4.0, "interval": 500, "spread": 80,
+              "aim": True, "kind": 1},
+    "wave_8": {"shape": "wave", "count": 8, "speed": 3.0, "interval": 120, "spread": 70,
+               "amplitude": 30, "frequency": 0.5, "kind": 3},
+}
+
+# 보스 정의: hp 비율이 until 이하로 떨어지면 다음 단계 패턴으로
+BOSSES: Dict[str, dict] = {
+    "battleship": {
+        "hp": 150, "size": (140, 60), "y": 90, "enter_speed": 1, "period": 6000,
+        "phases": [
+            {"until": 0.66, "patterns": ["spiral_3", "fan_5"]},
+            {"until": 0.33, "patterns": ["radial_16", "wave_8"]},
+            {"until": 0.0, "patterns": ["spiral_6", "fan_9", "radial_32"]},
+        ],
+    },
+}
+
+
+class Emitter:
+    """패턴 하나를 정해진 간격으로 쏘는 발사기"""
+
+    def __init__(self, spec: dict, start: int = 0):
+        self.spec = spec
+        self.shape = spec["shape"]
+        self.count = spec.get("count", 1)
+        self.speed = spec.get("speed", 3.0)
+        self.interval = spec.get("interval", 1000)
+        self.kind = spec.get("kind", 0)
+        self.next_fire = start
+        self.shots = 0
+        # 부채꼴 안에서 각 총알의 상대 각도 (발사마다 바뀌지 않으므로 미리 계산)
+        spread = spec.get("spread", 0.0)
+        if self.shape in ("fan", "wave") and self.count > 1:
+            self.offsets = np.radians(np.linspace(-spread / 2.0, spread / 2.0, self.count))
+        else:
+            self.offsets = 2.0 * math.pi * np.arange(self.count) / self.count
+
+    def angles(self, now: int, origin: Tuple[float, float],
+               target: Optional[Tuple[float, float]]) -> np.ndarray:
+        """이번 발사의 총알 방향들 (라디안)"""
+        spec = self.spec
+        if self.shape in ("radial", "spiral"):
+            base = math.radians(spec.get("turn", 0.0) * self.shots)
+        else:
+            center = DOWN
+            if spec.get("aim") and target is not None:
+                center = math.degrees(math.atan2(target[1] - origin[1], target[0] - origin[0]))
+            if self.shape == "wave":
+                center += spec.get("amplitude", 0.0) * math.sin(
+                    2.0 * math.pi * spec.get("frequency", 1.0) * now / 1000.0)
+            base = math.radians(center)
+        return base + self.offsets
+
+    def update(self, engine, now: int, origin: Tuple[float, float],
+               target: Optional[Tuple[float, float]] = None) -> int:
+        """발사 시각이 됐으면 한 번 발사, 쏜 총알 수 반환 (origin: 발사 위치 중심)"""
+        if now < self.next_fire:
+            return 0
+        self.next_fire = now + self.interval
+        angles = self.angles(now, origin, target)
+        self.shots += 1
+        # 엔진 좌표는 총알 왼쪽 위 기준
+        half_w = engine.widths[self.kind] / 2.0
+        half_h = engine.heights[self.kind] / 2.0
+        engine.spawn_many(np.full(angles.size, origin[0] - half_w),
+                          np.full(angles.size, origin[1] - half_h),
+                          self.speed * np.cos(angles), self.speed * np.sin(angles), self.kind)
+        return int(angles.size)
+
+
+def emitters(names: List[str], start: int = 0) -> List[Emitter]:
+    """패턴 이름 목록으로 발사기 생성"""
+    return [Emitter(PATTERNS[name], start) for name in names]
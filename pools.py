@@ -0,0 +1,77 @@
+"""
+스프라이트 오브젝트 풀
+kill()된 총알/적/폭발을 버리지 않고 보관했다가 reset()으로 재사용한다.
+"""
+
+import abc
+from typing import Callable, Dict, List
+
+import pygame
+
+DEFAULT_POOL_SIZE = 256  # 풀마다 보관할 최대 오브젝트 수
+
+
+class PooledSprite(pygame.sprite.Sprite, metaclass=abc.ABCMeta):
+    """kill() 시 자신을 풀에 반납하는 스프라이트
+
+    하위 클래스는 reset(*args)에서 모든 상태를 다시 설정해야 한다.
+    """
+
+    pool = None  # SpritePool이 만들 때 설정
+    net_id = None  # 네트워크 플레이에서 받은 id (재사용될 때 지워져 새 id를 받음)
+
+    @abc.abstractmethod
+    def reset(self, *args):
+        """풀에서 다시 꺼낼 때 acquire()에 넘긴 인자로 모든 상태를 다시 설정"""
+
+    def kill(self):
+        # 이미 반납된 스프라이트를 두 번 반납하지 않도록 확인
+        if self.alive():
+            super().kill()
+            if self.pool is not None:
+                self.pool.release(self)
+
+
+class SpritePool:
+    """PooledSprite 하위 클래스 하나를 위한 풀
+
+    factory는 클래스 또는 생성 함수 (예: functools.partial(Enemy, world)).
+    풀은 만든 스프라이트마다 따로 연결되므로 같은 클래스의 풀이 여러 개 있어도 된다.
+    """
+
+    def __init__(self, factory: Callable[..., PooledSprite], size: int = DEFAULT_POOL_SIZE):
+        self.factory = factory
+        self.size = size
+        self.free: List[PooledSprite] = []
+        self.hits = 0    # 재사용 횟수
+        self.misses = 0  # 새로 생성한 횟수
+
+    def _create(self, *args) -> PooledSprite:
+        sprite = self.factory(*args)
+        sprite.pool = self
+        return sprite
+
+    def acquire(self, *args) -> PooledSprite:
+        """풀에서 꺼내 reset, 비어 있으면 새로 생성"""
+        if self.free:
+            self.hits += 1
+            sprite = self.free.pop()
+            sprite.net_id = None  # 다른 엔티티가 되므로 예전 네트워크 id를 이어 쓰지 않음
+            sprite.reset(*args)
+            return sprite
+        self.misses += 1
+        return self._create(*args)
+
+    def release(self, sprite: PooledSprite):
+        """kill()된 스프라이트 보관 (최대 크기 초과분은 버림)"""
+        if len(self.free) < self.size:
+            self.free.append(sprite)
+
+    def prefill(self, count: int, *args):
+        """미리 count개를 만들어 둠 (args는 생성자 인자)"""
+        for _ in range(min(count, self.size) - len(self.free)):
+            self.free.append(self._create(*args))
+
+    def stats(self) -> Dict[str, int]:
+        """재사용/생성 횟수와 보관 중인 수"""
+        return {"hits": self.hits, "misses": self.misses, "free": len(self.free)}
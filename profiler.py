@@ -0,0 +1,162 @@
+"""
+프레임 단계별 시간 측정
+메인 루프의 각 단계(이벤트, 업데이트, 충돌, 그리기, 화면 반영) 소요 시간을
+링 버퍼에 기록하고, 화면 오버레이와 CSV/JSON 파일로 보여준다.
+"""
+
+import csv
+import json
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+import pygame
+
+PHASES = ("events", "update", "collide", "draw", "present")
+HISTORY = 600  # 보관할 프레임 수 (60 FPS 기준 10초)
+
+
+class FrameProfiler:
+    """단계별 시간(ms)을 프레임 단위로 링 버퍼에 기록"""
+
+    def __init__(self, phases: Sequence[str] = PHASES, size: int = HISTORY):
+        self.phases = tuple(phases)
+        self.index = {name: i for i, name in enumerate(self.phases)}
+        self.size = size
+        self.width = len(self.phases) + 1  # 단계들 + 전체
+        self.samples = array("d", [0.0]) * (size * self.width)
+        self.frames = 0  # 지금까지 기록한 프레임 수
+        self._current = [0.0] * len(self.phases)
+        self._frame_start = 0.0
+        self._last = 0.0
+
+    def begin_frame(self):
+        """프레임 시작"""
+        now = time.perf_counter()
+        self._frame_start = self._last = now
+        current = self._current
+        for i in range(len(current)):
+            current[i] = 0.0
+
+    def mark(self, phase: str):
+        """직전 mark 이후 시간을 phase에 더함 (한 프레임에 여러 번 가능)"""
+        now = time.perf_counter()
+        self._current[self.index[phase]] += (now - self._last) * 1000.0
+        self._last = now
+
+    def skip(self):
+        """측정하지 않을 구간 건너뛰기"""
+        self._last = time.perf_counter()
+
+    def end_frame(self):
+        """현재 프레임 기록을 링 버퍼에 저장"""
+        total = (time.perf_counter() - self._frame_start) * 1000.0
+        base = (self.frames % self.size) * self.width
+        samples = self.samples
+        for i, value in enumerate(self._current):
+            samples[base + i] = value
+        samples[base + self.width - 1] = total
+        self.frames += 1
+
+    def _rows(self) -> List[List[float]]:
+        """보관 중인 프레임 기록을 오래된 순서로"""
+        count = min(self.frames, self.size)
+        first = self.frames - count
+        rows = []
+        for frame in range(first, self.frames):
+            base = (frame % self.size) * self.width
+            rows.append(list(self.samples[base:base + self.width]))
+        return rows
+
+    def frame_times(self) -> List[float]:
+        """보관 중인 프레임 전체 시간(ms)"""
+        return [row[-1] for row in self._rows()]
+
+    def summary(self) -> Dict[str, float]:
+        """FPS, p50/p99 프레임 시간과 단계별 평균"""
+        rows = self._rows()
+        if not rows:
+            return {}
+        totals = sorted(row[-1] for row in rows)
+        mean = sum(totals) / len(totals)
+        result = {
+            "frames": len(rows),
+            "fps": 1000.0 / mean if mean > 0 else 0.0,
+            "p50": percentile(totals, 50),
+            "p99": percentile(totals, 99),
+        }
+        for i, name in enumerate(self.phases):
+            result[name] = sum(row[i] for row in rows) / len(rows)
+        return result
+
+    def dump(self, path: str):
+        """기록을 파일로 저장 (.json이면 JSON, 그 외에는 CSV)"""
+        rows = self._rows()
+        first = self.frames - len(rows)
+        header = ["frame", *self.phases, "total"]
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"summary": self.summary(),
+                           "frames": [dict(zip(header, [first + i, *row]))
+                                      for i, row in enumerate(rows)]}, f, indent=1)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                for i, row in enumerate(rows):
+                    writer.writerow([first + i, *("%.4f" % value for value in row)])
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """정렬된 값의 p 백분위수 (최근접 순위)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(p / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class ProfilerOverlay:
+    """FPS / 프레임 시간 / 엔티티 수를 보여주는 오버레이 (F3로 켜고 끔)"""
+
+    REFRESH_MS = 250  # 글자는 이 간격으로만 다시 렌더링
+
+    def __init__(self, profiler: FrameProfiler):
+        self.profiler = profiler
+        self.visible = False
+        self.font: Optional[pygame.font.Font] = None
+        self.image: Optional[pygame.Surface] = None
+        self._last_refresh = -self.REFRESH_MS
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.image = None
+
+    def blit_list(self, now: int, counts: Dict[str, int]) -> List[tuple]:
+        """오버레이 (이미지, 위치) 목록, 꺼져 있으면 빈 목록"""
+        if not self.visible:
+            return []
+        if self.image is None or now - self._last_refresh >= self.REFRESH_MS:
+            self._last_refresh = now
+            self.image = self._render(counts)
+        return [(self.image, (4, 4))]
+
+    def _render(self, counts: Dict[str, int]) -> pygame.Surface:
+        if self.font is None:
+            self.font = pygame.font.Font(None, 18)
+        stats = self.profiler.summary()
+        lines = ["FPS %.0f  p50 %.2fms  p99 %.2fms" % (stats.get("fps", 0.0),
+                                                     stats.get("p50", 0.0),
+                                                     stats.get("p99", 0.0)),
+                 "  ".join("%s %.2f" % (name, stats.get(name, 0.0))
+                           for name in self.profiler.phases),
+                 "  ".join("%s %d" % (name, count) for name, count in counts.items())]
+        rendered = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(image.get_width() for image in rendered) + 8
+        height = sum(image.get_height() for image in rendered) + 8
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        image.fill((0, 0, 0, 160))
+        y = 4
+        for line in rendered:
+            image.blit(line, (4, y))
+            y += line.get_height()
+        return image
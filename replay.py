@@ -0,0 +1,137 @@
+"""
+리플레이 기록 / 재생
+게임은 시드와 스텝별 입력만으로 완전히 재현되므로(world.World 참고)
+헤더(시드, 옵션) 뒤에 시뮬레이션 스텝마다 입력 비트마스크 1바이트만 저장한다.
+기록은 메모리 버퍼에 모았다가 CHUNK 단위로 파일에 쓰므로 항상 켜 두어도 부담이 없고,
+중간에 비정상 종료돼도 마지막으로 쓴 부분까지는 재생할 수 있다.
+
+    파일 형식 (리틀 엔디언)
+    magic   4바이트  b"1945"
+    version 1바이트
+    flags   1바이트  (bit 0: 총알 엔진)
+    seed    8바이트  부호 있는 정수
+    level   2바이트 길이 + UTF-8 레벨 파일 경로 (무한 모드면 길이 0)
+    inputs  스텝당 1바이트 (headless.INPUT_* 비트마스크)
+"""
+
+import os
+import struct
+from typing import Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(HERE, ".cache", "replays", "last.rpl")
+
+MAGIC = b"1945"
+VERSION = 3  # 같은 입력으로 결과가 달라지는 규칙 변경(예: 충돌 판정)이 있으면 올림
+FLAG_BULLET_ENGINE = 1
+HEADER = struct.Struct("<4sBBq")
+LEVEL_LENGTH = struct.Struct("<H")
+CHUNK = 4096  # 이만큼 모이면 파일에 씀 (60 FPS 기준 약 68초)
+
+
+class ReplayWriter:
+    """스텝별 입력을 버퍼에 모아 파일에 기록"""
+
+    def __init__(self, path: str, seed: int, bullet_engine: bool = False, level: str = ""):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.file = open(path, "wb")
+        flags = FLAG_BULLET_ENGINE if bullet_engine else 0
+        self.file.write(HEADER.pack(MAGIC, VERSION, flags, seed))
+        level_bytes = level.encode("utf-8")
+        self.file.write(LEVEL_LENGTH.pack(len(level_bytes)) + level_bytes)
+        self.inputs_start = self.file.tell()
+        self.buffer = bytearray()
+        self.frames = 0
+
+    def record(self, keys: int) -> int:
+        """이번 스텝 입력 기록 (그대로 반환하므로 step() 인자에 바로 감쌀 수 있음)"""
+        self.buffer.append(keys & 0xFF)
+        self.frames += 1
+        if len(self.buffer) >= CHUNK:
+            self.flush()
+        return keys
+
+    def flush(self):
+        """버퍼에 모인 입력을 파일에 씀"""
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+        self.file.flush()
+
+    def truncate(self, frames: int):
+        """frames 스텝 이후 기록을 버림 (되감기 후 이어서 기록할 때)"""
+        if frames >= self.frames:
+            return
+        kept = frames - (self.frames - len(self.buffer))  # 버퍼에 남길 입력 수
+        if kept >= 0:
+            del self.buffer[kept:]
+        else:
+            self.buffer.clear()
+            self.file.truncate(self.inputs_start + frames)
+            self.file.seek(0, os.SEEK_END)
+        self.frames = frames
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Replay:
+    """불러온 리플레이 (시드, 옵션, 스텝별 입력)"""
+
+    def __init__(self, seed: int, inputs: bytes, bullet_engine: bool = False, level: str = ""):
+        self.seed = seed
+        self.level = level
+        self.inputs = inputs
+        self.bullet_engine = bullet_engine
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size + LEVEL_LENGTH.size:
+            raise ValueError("리플레이 파일이 너무 짧습니다: %s" % path)
+        magic, version, flags, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("지원하지 않는 리플레이 파일: %s" % path)
+        start = HEADER.size + LEVEL_LENGTH.size
+        end = start + LEVEL_LENGTH.unpack_from(data, HEADER.size)[0]
+        level = data[start:end].decode("utf-8")
+        return cls(seed, data[end:], bool(flags & FLAG_BULLET_ENGINE), level)
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def keys(self, frame: int) -> int:
+        """frame번째 스텝 입력 (1부터, 기록이 끝난 뒤는 0) - headless.run_headless의 inputs"""
+        if 0 < frame <= len(self.inputs):
+            return self.inputs[frame - 1]
+        return 0
+
+    def world(self, **kwargs):
+        """기록할 때와 같은 설정의 새 월드"""
+        from world import World
+        if self.level and "level" not in kwargs:
+            import waves
+            kwargs["level"] = waves.load(self.level)
+        return World(seed=self.seed, bullet_engine=self.bullet_engine, **kwargs)
+
+    def play(self, world=None, frames: Optional[int] = None):
+        """헤드리스로 최대 속도 재생 후 월드 반환 (frames: 재생할 최대 스텝 수)"""
+        if world is None:
+            world = self.world()
+        for keys in self.inputs[:frames]:
+            if not world.step(keys):
+                break
+        return world
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+월드 상태 저장 / 되감기
+월드 전체(플레이어, 적, 총알, 폭발, 보스, 총알 엔진 배열, 예약된 이벤트 순서, 난수 상태)를
+스프라이트마다 고정 길이 struct 레코드로 이어 붙인 바이트열 하나로 저장하고 되살린다.
+스프라이트는 all_sprites에 들어간 순서대로 저장하므로 되살린 월드는 같은 입력이면
+저장하지 않았을 때와 완전히 같은 결과(digest)를 낸다.
+
+RewindBuffer는 미리 잡아 둔 바이트 버퍼 하나에 스냅샷을 돌려 쓰는 링 버퍼로,
+프레임마다 저장해도 메모리 할당이 늘지 않는다 (스냅샷이 커져서 요청한 시간만큼
+담을 수 없을 때만 버퍼를 두 배로 늘림).
+
+    history = RewindBuffer(seconds=5)
+    history.push(save_state(world))      # 스텝마다
+    history.pop(); load_state(world, history.latest())   # 한 스텝 되감기
+
+    python rewind.py --frames 3600       # 저장/복원 비용 측정과 재현성 확인
+"""
+
+import argparse
+import random
+import struct
+import time
+from array import array
+from typing import Optional
+
+import world as game
+
+MAGIC = b"RW"
+HEADER = struct.Struct("<2sIIIIIiiQIB")  # magic, frame, steps, kills, score, cursor, 게임 오버, 클리어, 이벤트 순서, 스프라이트 수, 난수 gauss 여부
+RNG_STATE = struct.Struct("<625I")
+GAUSS = struct.Struct("<d")
+ENGINE_COUNT = struct.Struct("<I")
+
+# 스프라이트 레코드 (첫 바이트가 종류)
+PLAYER = struct.Struct("<BhhB")  # 번호, x, y, 입력
+ENEMY = struct.Struct("<hhBhiiiiqiii")  # x, y, 색, 속도, 발사 간격, 마지막 발사, 레벨 항목, 출현 시각, 이벤트 순서, 이벤트 시각, 패턴 다음 발사, 패턴 발사 수
+BULLET = struct.Struct("<hh")
+ENEMY_BULLET = struct.Struct("<hhBhh")  # x, y, 모양, 세로 속도, 가로 속도
+EXPLOSION = struct.Struct("<hhBBiqi")  # x, y, 크기, 프레임, 시작 시각, 이벤트 순서, 이벤트 시각
+BOSS = struct.Struct("<BhhhhBiB")  # 이름 번호, x, y, 기준 x, 체력, 단계, 도착 시각, 발사기 수
+EMITTER = struct.Struct("<ii")  # 다음 발사 시각, 발사 수
+T_PLAYER, T_ENEMY, T_BULLET, T_ENEMY_BULLET, T_EXPLOSION, T_BOSS = b"PEBbXS"
+
+NO_EVENT = -1
+RECORD_BYTES = 4 * 1024  # 링 버퍼 처음 크기 계산용 스냅샷 크기 (난수 상태만 2.5KB, 보통 2.7~3.1KB)
+MAX_BYTES = 64 * 1024 * 1024  # 링 버퍼 최대 크기 (넘으면 요청한 시간보다 짧게 보관)
+
+
+def _boss_names():
+    import patterns
+    return sorted(patterns.BOSSES)
+
+
+def _event(entry) -> tuple:
+    """예약 핸들 -> (등록 순서, 시각) (예약이 없거나 취소됐으면 NO_EVENT)"""
+    if entry is None or entry[2] is None:
+        return NO_EVENT, 0
+    return entry[1], entry[0]
+
+
+def save_state(world) -> bytes:
+    """월드 전체 상태를 바이트열로"""
+    parts = []
+    append = parts.append
+    level_index = world.level.index_of if world.level is not None else {}
+    for sprite in world.all_sprites:
+        kind = type(sprite)
+        rect = sprite.rect
+        if kind is game.Enemy:
+            seq, due = _event(sprite.shot_event)
+            emitter = sprite.emitters[0] if sprite.emitters else None
+            spec_index = level_index.get(id(sprite.spec), -1)
+            append(bytes((T_ENEMY,)) + ENEMY.pack(
+                rect.x, rect.y, game.ENEMY_COLORS.index(sprite.color), sprite.speedy,
+                sprite.shoot_delay, sprite.last_shot, spec_index,
+                getattr(sprite, "spawned_at", 0), seq, due,
+                emitter.next_fire if emitter else 0, emitter.shots if emitter else 0))
+        elif kind is game.EnemyBullet:
+            append(bytes((T_ENEMY_BULLET,)) + ENEMY_BULLET.pack(
+                rect.x, rect.y, sprite.bullet_type, sprite.speedy, sprite.speedx))
+        elif kind is game.Bullet:
+            append(bytes((T_BULLET,)) + BULLET.pack(rect.x, rect.y))
+        elif kind is game.Explosion:
+            seq, due = _event(sprite.frame_event)
+            append(bytes((T_EXPLOSION,)) + EXPLOSION.pack(
+                rect.x, rect.y, sprite.size, sprite.frame, sprite.start, seq, due))
+        elif kind is game.Player:
+            append(bytes((T_PLAYER,)) + PLAYER.pack(sprite.index, rect.x, rect.y, sprite.keys))
+        elif kind is game.Boss:
+            append(bytes((T_BOSS,)) + BOSS.pack(
+                _boss_names().index(sprite.name), rect.x, rect.y, sprite.home_x, sprite.hp,
+                sprite.phase, -1 if sprite.arrived_at is None else sprite.arrived_at,
+                len(sprite.emitters)))
+            parts.extend(EMITTER.pack(emitter.next_fire, emitter.shots)
+                         for emitter in sprite.emitters)
+
+    _, internal, gauss = world.rng.getstate()
+    head = HEADER.pack(MAGIC, world.frame, world.clock.steps, world.kills, world.score,
+                       world.level_cursor,
+                       -1 if world.game_over_at is None else world.game_over_at,
+                       -1 if world.cleared_at is None else world.cleared_at,
+                       world.events.seq, len(world.all_sprites), gauss is not None)
+    tail = [RNG_STATE.pack(*internal), GAUSS.pack(gauss or 0.0)]
+    # 총알 엔진 (플레이어, 적, 탄막 패턴 순서 - 없으면 0발)
+    for engine in (world.player_shots, world.enemy_shots, world.pattern_shots):
+        n = engine.count if engine is not None else 0
+        tail.append(ENGINE_COUNT.pack(n))
+        if n:
+            tail.extend(getattr(engine, name)[:n].tobytes()
+                        for name in ("x", "y", "vx", "vy", "kind"))
+    return b"".join([head, *parts, *tail])
+
+
+def load_state(world, data) -> None:
+    """save_state로 저장한 상태로 월드를 되돌림 (같은 설정으로 만든 월드여야 함)"""
+    (magic, frame, steps, kills, score, cursor, game_over_at, cleared_at, seq, count,
+     has_gauss) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("월드 상태 데이터가 아닙니다")
+
+    # 지금 있는 스프라이트는 모두 풀에 반납 (예약도 같이 취소됨)
+    for sprite in world.all_sprites.sprites():
+        sprite.kill()
+    all_sprites = world.all_sprites
+    events = world.events
+    spawns = world.level.spawns if world.level is not None else []
+    # 풀에서 꺼낼 때 reset이 쓰는 난수/예약은 아래에서 모두 덮어씀
+    restored_events = []
+    offset = HEADER.size
+    for _ in range(count):
+        kind = data[offset]
+        offset += 1
+        if kind == T_ENEMY:
+            (x, y, color, speedy, shoot_delay, last_shot, spec_index, spawned_at, event_seq,
+             due, next_fire, shots) = ENEMY.unpack_from(data, offset)
+            offset += ENEMY.size
+            enemy = world.enemy_pool.acquire()
+            enemy.color = game.ENEMY_COLORS[color]
+            enemy.image = game.images.get(("enemy", enemy.color))
+            enemy.rect.topleft = (x, y)
+            enemy.speedy = speedy
+            enemy.shoot_delay = shoot_delay
+            enemy.last_shot = last_shot
+            enemy.spawned_at = spawned_at
+            enemy.emitters = []
+            if spec_index >= 0:
+                spec = enemy.spec = spawns[spec_index]
+                enemy.move = game.waves.MOVES[spec["move"]]
+                enemy.fire_pattern = spec["fire"]
+                if spec.get("pattern"):
+                    import patterns
+                    enemy.emitters = patterns.emitters([spec["pattern"]])
+                    enemy.emitters[0].next_fire = next_fire
+                    enemy.emitters[0].shots = shots
+            restored_events.append((enemy, "shot_event", event_seq, due, enemy.fire))
+            all_sprites.add(enemy)
+            world.enemies.add(enemy)
+        elif kind == T_ENEMY_BULLET:
+            x, y, bullet_type, speedy, speedx = ENEMY_BULLET.unpack_from(data, offset)
+            offset += ENEMY_BULLET.size
+            bullet = world.enemy_bullet_pool.acquire(0, 0, bullet_type, speedy, speedx)
+            bullet.rect.topleft = (x, y)
+            all_sprites.add(bullet)
+            world.enemy_bullets.add(bullet)
+        elif kind == T_BULLET:
+            x, y = BULLET.unpack_from(data, offset)
+            offset += BULLET.size
+            bullet = world.bullet_pool.acquire(0, 0)
+            bullet.rect.topleft = (x, y)
+            all_sprites.add(bullet)
+            world.bullets.add(bullet)
+        elif kind == T_EXPLOSION:
+            x, y, size, frame_index, start, event_seq, due = EXPLOSION.unpack_from(data, offset)
+            offset += EXPLOSION.size
+            explosion = world.explosion_pool.acquire((0, 0), size)
+            explosion.rect.topleft = (x, y)
+            explosion.frame = frame_index
+            explosion.image = explosion.frames[frame_index]
+            explosion.start = start
+            restored_events.append((explosion, "frame_event", event_seq, due,
+                                    explosion.next_frame))
+            all_sprites.add(explosion)
+        elif kind == T_PLAYER:
+            index, x, y, keys = PLAYER.unpack_from(data, offset)
+            offset += PLAYER.size
+            player = world.players[index]
+            player.rect.topleft = (x, y)
+            player.keys = keys
+            all_sprites.add(player)
+        elif kind == T_BOSS:
+            (name, x, y, home_x, hp, phase, arrived_at,
+             emitter_count) = BOSS.unpack_from(data, offset)
+            offset += BOSS.size
+            boss = game.Boss(world, _boss_names()[name], home_x)
+            boss.rect.topleft = (x, y)
+            boss.hp = hp
+            while boss.phase < phase:
+                boss.next_phase()
+            boss.arrived_at = None if arrived_at < 0 else arrived_at
+            for emitter in boss.emitters[:emitter_count]:
+                emitter.next_fire, emitter.shots = EMITTER.unpack_from(data, offset)
+                offset += EMITTER.size
+            all_sprites.add(boss)
+            world.bosses.add(boss)
+        else:
+            raise ValueError("알 수 없는 스프라이트 레코드: %r" % kind)
+
+    # 예약은 저장할 때의 등록 순서 그대로 다시 넣음 (같은 시각 이벤트의 실행 순서 유지)
+    events.clear(seq)
+    for sprite, attribute, event_seq, due, callback in restored_events:
+        entry = None
+        if event_seq != NO_EVENT:
+            entry = events.schedule_at(due, event_seq, callback)
+        setattr(sprite, attribute, entry)
+
+    internal = RNG_STATE.unpack_from(data, offset)
+    offset += RNG_STATE.size
+    gauss = GAUSS.unpack_from(data, offset)[0] if has_gauss else None
+    offset += GAUSS.size
+    world.rng.setstate((random.Random.VERSION, internal, gauss))
+
+    for name in ("player_shots", "enemy_shots", "pattern_shots"):
+        n = ENGINE_COUNT.unpack_from(data, offset)[0]
+        offset += ENGINE_COUNT.size
+        engine = getattr(world, name)
+        if engine is None:
+            if not n:
+                continue
+            engine = world.pattern_engine()  # 탄막 패턴 엔진은 처음 쓸 때 생성
+        engine.count = 0
+        if n:
+            import numpy as np
+            engine._reserve(n)
+            for field in ("x", "y", "vx", "vy", "kind"):
+                values = getattr(engine, field)
+                values[:n] = np.frombuffer(data, values.dtype, n, offset)
+                offset += n * values.itemsize
+            engine.count = n
+
+    world.frame = frame
+    world.clock.steps = steps
+    world.kills = kills
+    world.score = score
+    world.level_cursor = cursor
+    world.game_over_at = None if game_over_at < 0 else game_over_at
+    world.cleared_at = None if cleared_at < 0 else cleared_at
+
+
+class RewindBuffer:
+    """최근 스냅샷을 보관하는 링 버퍼
+
+    길이가 다른 스냅샷을 미리 잡아 둔 bytearray 하나에 이어서 쓰고, 끝에 닿으면
+    처음으로 돌아가 가장 오래된 스냅샷부터 덮어쓴다. 보관 수는 최대 frames개.
+    frames개를 담기 전에 자리가 모자라면 max_capacity까지 버퍼를 두 배씩 늘린다.
+    """
+
+    def __init__(self, seconds: float = 5.0, hz: int = 60, capacity: Optional[int] = None,
+                 max_capacity: int = MAX_BYTES):
+        self.frames = max(1, int(seconds * hz))
+        capacity = capacity or self.frames * RECORD_BYTES
+        self.max_capacity = max(max_capacity, capacity)
+        self.data = bytearray(capacity)
+        self.view = memoryview(self.data)
+        # 슬롯별 (시작 위치, 길이)
+        self.starts = array("q", bytes(8 * self.frames))
+        self.lengths = array("q", bytes(8 * self.frames))
+        self.first = 0  # 가장 오래된 슬롯
+        self.count = 0
+        self.write_pos = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(self, record: bytes):
+        """스냅샷 추가 (가득 찼으면 가장 오래된 것을 버림)"""
+        n = len(record)
+        if n > len(self.data) and not self._grow(n):
+            raise ValueError("스냅샷(%d바이트)이 버퍼(%d바이트)보다 큽니다" % (n, len(self.data)))
+        wrap = self.write_pos + n > len(self.data)
+        pos = 0 if wrap else self.write_pos
+        # 오래된 것부터 차례로 제거: 보관 수가 다 찼거나, 처음으로 돌아갈 때 끝에 남은
+        # 지난 바퀴 스냅샷이거나, 쓸 자리 [pos, pos + n)과 겹치는 동안
+        while self.count:
+            start = self.starts[self.first]
+            full = self.count >= self.frames
+            if (not full and not (wrap and start >= self.write_pos)
+                    and not (start < pos + n and pos < start + self.lengths[self.first])):
+                break
+            # 자리가 모자라서 보관 시간 안의 스냅샷을 버려야 하면 먼저 버퍼를 늘려 봄
+            if not full and self._grow(n):
+                wrap = False
+                pos = self.write_pos
+                continue
+            self.first = (self.first + 1) % self.frames
+            self.count -= 1
+        self.view[pos:pos + n] = record
+        slot = (self.first + self.count) % self.frames
+        self.starts[slot] = pos
+        self.lengths[slot] = n
+        self.count += 1
+        self.write_pos = pos + n
+
+    def _grow(self, n: int) -> bool:
+        """버퍼를 두 배로 늘리고 보관 중인 스냅샷을 순서대로 앞에서부터 다시 채움
+
+        n바이트를 더 쓸 자리를 만들 수 없으면 (max_capacity) 늘리지 않고 False
+        """
+        records = [bytes(self._record(i)) for i in range(self.count)]
+        used = sum(map(len, records))
+        size = len(self.data)
+        while size < used + n:
+            size *= 2
+        size = min(max(size, len(self.data) * 2), self.max_capacity)
+        if size <= len(self.data) or size < used + n:
+            return False
+        self.data = bytearray(size)
+        self.view = memoryview(self.data)
+        self.first = 0
+        pos = 0
+        for slot, record in enumerate(records):
+            self.view[pos:pos + len(record)] = record
+            self.starts[slot] = pos
+            self.lengths[slot] = len(record)
+            pos += len(record)
+        self.write_pos = pos
+        return True
+
+    def _record(self, index: int) -> memoryview:
+        """오래된 것부터 index번째 스냅샷"""
+        slot = (self.first + index) % self.frames
+        start = self.starts[slot]
+        return self.view[start:start + self.lengths[slot]]
+
+    def latest(self) -> Optional[memoryview]:
+        """가장 최근 스냅샷 (다음 push 전까지만 유효)"""
+        if not self.count:
+            return None
+        return self._record(self.count - 1)
+
+    def pop(self) -> Optional[memoryview]:
+        """가장 최근 스냅샷을 꺼냄 (그 자리는 다음 push가 다시 씀)"""
+        record = self.latest()
+        if record is not None:
+            self.count -= 1
+            self.write_pos = self.starts[(self.first + self.count) % self.frames]
+        return record
+
+    def clear(self):
+        self.first = self.count = self.write_pos = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="월드 상태 저장/복원 비용 측정")
+    parser.add_argument("--frames", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--level", default=None)
+    parser.add_argument("--bullet-engine", action="store_true")
+    args = parser.parse_args()
+
+    import headless
+    headless.use_dummy_drivers()
+    level = None
+    if args.level:
+        import waves
+        level = waves.load(args.level)
+
+    def new_world():
+        return game.World(seed=args.seed, level=level, bullet_engine=args.bullet_engine)
+
+    # 기준: 저장 없이 끝까지
+    expected = new_world()
+    expected.run(args.frames)
+
+    # 스텝마다 저장하면서 진행하고, 중간에 되감았다가 다시 진행
+    world = new_world()
+    history = RewindBuffer(seconds=5)
+    save_time = load_time = 0.0
+    sizes = []
+    rewound = False
+    while world.frame < expected.frame:
+        if not world.step(headless.autopilot(world.frame + 1)):
+            break
+        start = time.perf_counter()
+        record = save_state(world)
+        save_time += time.perf_counter() - start
+        history.push(record)
+        sizes.append(len(record))
+        if not rewound and world.frame == expected.frame // 2:
+            # 3초 되감기 (스텝마다 한 번씩 복원)
+            for _ in range(min(180, len(history) - 1)):
+                history.pop()
+                start = time.perf_counter()
+                load_state(world, history.latest())
+                load_time += time.perf_counter() - start
+            rewound = True
+    loads = min(180, len(sizes))
+    print("frames=%d  save %.1fus  load %.1fus  record %d B avg / %d B max  buffer %d/%d" % (
+        world.frame, 1e6 * save_time / max(len(sizes), 1), 1e6 * load_time / max(loads, 1),
+        sum(sizes) // max(len(sizes), 1), max(sizes, default=0), len(history), history.frames))
+    print("digest %s (%s)" % (world.digest()[:16],
+                              "same" if world.digest() == expected.digest() else "DIFFERENT"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+강화학습용 배치 환경 (Gym 벡터 환경 형식, numpy 필요)
+독립된 월드 N개를 한 번의 step() 호출로 진행하고 관측/보상/종료 여부를
+NumPy 배열로 쌓아서 돌려준다. 창과 프레임 제한 없이 동작한다.
+
+관측 종류
+- "vector": 플레이어 위치 + 가까운 적 ENEMY_SLOTS기, 적 총알 BULLET_SLOTS발의
+            (상대 x, 상대 y, 하강 속도, 존재 여부) - float32
+- "pixels": 화면을 frame_size로 줄인 이미지 (grayscale이면 (H, W), 아니면 (H, W, 3)) - uint8
+
+행동은 입력 비트마스크 그대로 (0~31, headless.INPUT_* 조합).
+끝난 환경은 자동으로 새 시드로 초기화되고, 마지막 관측은 info["final_observation"]에 담긴다.
+
+    env = ShooterVecEnv(num_envs=16, obs_type="vector")
+    obs = env.reset(seed=0)
+    obs, rewards, dones, infos = env.step(np.random.randint(0, 32, size=16))
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+import headless
+from world import HEIGHT, WIDTH, World
+
+NUM_ACTIONS = 32  # 입력 비트마스크 5비트
+ENEMY_SLOTS = 8
+BULLET_SLOTS = 16
+FRAME_SIZE = (60, 75)  # pixels 관측 크기 (가로, 세로) - 화면의 1/8
+MAX_STEPS = 3600  # 에피소드 최대 길이 (이후 잘림)
+
+# 보상
+REWARD_KILL = 1.0
+REWARD_DEATH = -10.0
+REWARD_STEP = 0.0
+
+GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+class ShooterVecEnv:
+    """월드 N개를 묶은 벡터 환경"""
+
+    def __init__(self, num_envs: int = 8, obs_type: str = "vector",
+                 frame_size: Tuple[int, int] = FRAME_SIZE, grayscale: bool = True,
+                 max_steps: int = MAX_STEPS, frame_skip: int = 1,
+                 difficulty: Optional[dict] = None, bullet_engine: bool = False):
+        if obs_type not in ("vector", "pixels"):
+            raise ValueError("obs_type은 'vector' 또는 'pixels': %s" % obs_type)
+        self.num_envs = num_envs
+        self.obs_type = obs_type
+        self.frame_size = tuple(frame_size)
+        self.grayscale = grayscale
+        self.max_steps = max_steps
+        self.frame_skip = max(1, frame_skip)
+        self.difficulty = difficulty
+        self.bullet_engine = bullet_engine
+
+        if obs_type == "vector":
+            self.observation_shape: Tuple[int, ...] = (2 + 4 * (ENEMY_SLOTS + BULLET_SLOTS),)
+            self._obs = np.zeros((num_envs, *self.observation_shape), dtype=np.float32)
+        else:
+            width, height = self.frame_size
+            self.observation_shape = (height, width) if grayscale else (height, width, 3)
+            self._obs = np.zeros((num_envs, *self.observation_shape), dtype=np.uint8)
+            # 모든 월드가 같은 화면 버퍼를 차례로 사용
+            self._screen = pygame.Surface((WIDTH, HEIGHT))
+            self._small = pygame.Surface(self.frame_size)
+
+        self.worlds: List[Optional[World]] = [None] * num_envs
+        self._steps = np.zeros(num_envs, dtype=np.int64)
+        self._kills = np.zeros(num_envs, dtype=np.int64)
+        self._next_seed = 0
+
+    # ----- 초기화 -----
+
+    def _new_world(self, index: int):
+        self.worlds[index] = World(seed=self._next_seed, difficulty=self.difficulty,
+                                   bullet_engine=self.bullet_engine)
+        self._next_seed += 1
+        self._steps[index] = 0
+        self._kills[index] = 0
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """모든 환경 초기화 (seed를 주면 환경 i는 seed + i, 이후 에피소드는 이어지는 시드)"""
+        if seed is not None:
+            self._next_seed = seed
+        for i in range(self.num_envs):
+            self._new_world(i)
+            self._observe(i)
+        return self._obs.copy()
+
+    # ----- 진행 -----
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """환경마다 행동 하나씩 적용 -> (관측, 보상, 종료 여부, info 목록)"""
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.num_envs,):
+            raise ValueError("행동 배열 크기는 (%d,)이어야 합니다" % self.num_envs)
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        dones = np.zeros(self.num_envs, dtype=bool)
+        infos: List[Dict] = []
+
+        for i, world in enumerate(self.worlds):
+            keys = int(actions[i]) & (NUM_ACTIONS - 1)
+            for _ in range(self.frame_skip):
+                world.step(keys)
+                self._steps[i] += 1
+                if world.game_over:
+                    break
+            kills = world.kills - self._kills[i]
+            self._kills[i] = world.kills
+            reward = kills * REWARD_KILL + REWARD_STEP
+            if world.game_over:
+                reward += REWARD_DEATH
+            truncated = not world.game_over and self._steps[i] >= self.max_steps
+            rewards[i] = reward
+            info = {"steps": int(self._steps[i]), "kills": world.kills}
+            self._observe(i)
+            if world.game_over or truncated:
+                dones[i] = True
+                info["truncated"] = truncated
+                info["final_observation"] = self._obs[i].copy()
+                self._new_world(i)
+                self._observe(i)
+            infos.append(info)
+        return self._obs.copy(), rewards, dones, infos
+
+    # ----- 관측 -----
+
+    def _observe(self, index: int):
+        if self.obs_type == "vector":
+            self._observe_vector(index)
+        else:
+            self._observe_pixels(index)
+
+    def _observe_pixels(self, index: int):
+        world = self.worlds[index]
+        world.draw(self._screen)
+        pygame.transform.scale(self._screen, self.frame_size, self._small)
+        rgb = pygame.surfarray.pixels3d(self._small)  # (가로, 세로, 3)
+        if self.grayscale:
+            self._obs[index] = (rgb @ GRAY_WEIGHTS).T.astype(np.uint8)
+        else:
+            self._obs[index] = rgb.transpose(1, 0, 2)
+        del rgb  # Surface 잠금 해제
+
+    def _observe_vector(self, index: int):
+        world = self.worlds[index]
+        obs = self._obs[index]
+        obs[:] = 0.0
+        px, py = world.player.rect.center
+        obs[0] = px / WIDTH
+        obs[1] = py / HEIGHT
+        enemies = [(s.rect.centerx, s.rect.centery, s.speedy) for s in world.enemies]
+        enemies += [(s.rect.centerx, s.rect.centery, 0) for s in world.bosses]
+        # 스프라이트 총알 + 엔진 총알(총알 엔진 모드, 탄막 패턴)
+        bullets = [np.array([(s.rect.centerx, s.rect.centery, s.speedy)
+                             for s in world.enemy_bullets], dtype=np.float32).reshape(-1, 3)]
+        for engine in world.enemy_engines():
+            n = engine.count
+            bullets.append(np.stack([engine.x[:n] + engine.widths[engine.kind[:n]] / 2,
+                                     engine.y[:n] + engine.heights[engine.kind[:n]] / 2,
+                                     engine.vy[:n]], axis=1))
+        bullets = np.concatenate(bullets)
+        _fill_nearest(obs[2:2 + 4 * ENEMY_SLOTS], enemies, ENEMY_SLOTS, px, py)
+        _fill_nearest(obs[2 + 4 * ENEMY_SLOTS:], bullets, BULLET_SLOTS, px, py)
+
+    def close(self):
+        self.worlds = [None] * self.num_envs
+
+
+def _fill_nearest(out: np.ndarray, entities, slots: int, px: float, py: float):
+    """플레이어에 가까운 순서로 slots개를 (dx, dy, vy, 1)로 채움"""
+    if len(entities) == 0:
+        return
+    data = np.asarray(entities, dtype=np.float32)
+    dx = (data[:, 0] - px) / WIDTH
+    dy = (data[:, 1] - py) / HEIGHT
+    order = np.argsort(dx * dx + dy * dy)[:slots]
+    rows = out.reshape(slots, 4)
+    n = len(order)
+    rows[:n, 0] = dx[order]
+    rows[:n, 1] = dy[order]
+    rows[:n, 2] = data[order, 2] / 10.0
+    rows[:n, 3] = 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배치 환경 처리량 측정 (무작위 행동)")
+    parser.add_argument("--envs", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=1000, help="step() 호출 횟수")
+    parser.add_argument("--obs", choices=("vector", "pixels"), default="vector")
+    args = parser.parse_args()
+
+    headless.use_dummy_drivers()
+    env = ShooterVecEnv(num_envs=args.envs, obs_type=args.obs)
+    rng = np.random.default_rng(0)
+    obs = env.reset(seed=0)
+    episodes = 0
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        obs, rewards, dones, infos = env.step(rng.integers(0, NUM_ACTIONS, size=args.envs))
+        episodes += int(dones.sum())
+    elapsed = time.perf_counter() - start
+    print("obs %s  %d env-steps/s  episodes=%d" % (
+        obs.shape, args.envs * args.steps / elapsed, episodes))
+
+
+if __name__ == "__main__":
+    main()
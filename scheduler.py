@@ -0,0 +1,60 @@
+"""
+중앙 타이머 스케줄러
+적 발사, 폭발 프레임 전환, 적 생성 같은 시간 이벤트를 하나의 힙에 등록하고
+매 프레임 시각이 된 이벤트만 꺼내 실행한다. 프레임당 비용은 엔티티 수가 아니라
+실제로 발생한 이벤트 수에 비례한다.
+"""
+
+import heapq
+from typing import Callable, List, Optional
+
+
+class Scheduler:
+    """(실행 시각, 등록 순서) 순으로 정렬된 이벤트 힙"""
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._seq = 0  # 같은 시각이면 먼저 등록한 이벤트부터 실행
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, due: int, callback: Callable, *args) -> list:
+        """due(ms) 시각에 callback(*args) 실행 예약, 취소용 핸들 반환"""
+        entry = [due, self._seq, callback, args]
+        self._seq += 1
+        heapq.heappush(self._heap, entry)
+        return entry
+
+    def schedule_at(self, due: int, seq: int, callback: Callable, *args) -> list:
+        """등록 순서를 지정해서 예약 (저장해 둔 상태를 되살릴 때)"""
+        entry = [due, seq, callback, args]
+        heapq.heappush(self._heap, entry)
+        return entry
+
+    @property
+    def seq(self) -> int:
+        """다음 예약이 받을 등록 순서"""
+        return self._seq
+
+    def cancel(self, entry: list):
+        """예약 취소 (힙에서 바로 빼지 않고 실행 시점에 건너뜀)"""
+        if entry is not None:
+            entry[2] = None
+
+    def run_due(self, now: int) -> int:
+        """now 시각까지 도래한 이벤트 실행, 실행한 개수 반환"""
+        heap = self._heap
+        count = 0
+        while heap and heap[0][0] <= now:
+            _, _, callback, args = heapq.heappop(heap)
+            if callback is not None:
+                callback(*args)
+                count += 1
+        return count
+
+    def clear(self, seq: Optional[int] = None):
+        """모든 예약 제거 (seq를 주면 등록 순서도 그 값부터 다시 시작)"""
+        self._heap.clear()
+        if seq is not None:
+            self._seq = seq
@@ -0,0 +1,116 @@
+"""
+믹서 보이스 관리
+프레임 동안 들어온 재생 요청을 모아 두었다가 한 번에 처리한다.
+- 같은 효과음 요청은 볼륨을 키운 보이스 하나로 합침
+- 효과음별 동시 재생 수 제한 (넘으면 그 효과음의 가장 오래된 보이스 재사용)
+- 채널이 모자라면 우선순위가 가장 낮고 오래된 보이스를 빼앗음
+"""
+
+import math
+from typing import Dict, List, Optional
+
+import pygame
+
+DEFAULT_CHANNELS = 16
+MERGE_GAIN = 0.35  # 요청이 두 배가 될 때마다 늘어나는 볼륨 비율
+
+
+class SoundManager:
+    """효과음 요청 큐와 채널 할당기"""
+
+    def __init__(self, channels: int = DEFAULT_CHANNELS):
+        pygame.mixer.set_num_channels(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        # 채널별 현재 보이스 (효과음 이름, 우선순위, 시작 순번)
+        self.voices: List[Optional[tuple]] = [None] * channels
+        self.effects: Dict[str, dict] = {}
+        self.pending: Dict[str, int] = {}
+        self.serial = 0
+        self.stats = {"requested": 0, "played": 0, "merged": 0, "stolen": 0, "dropped": 0}
+
+    def register(self, name: str, sound: pygame.mixer.Sound, volume: float = 1.0,
+                 priority: int = 0, max_voices: int = 2):
+        """효과음 등록 (볼륨은 채널 볼륨으로 조절하므로 Sound 볼륨은 1로 둠)"""
+        sound.set_volume(1.0)
+        self.effects[name] = {"sound": sound, "volume": volume,
+                              "priority": priority, "max_voices": max_voices}
+
+    def play(self, name: str):
+        """재생 요청 (실제 재생은 flush()에서)"""
+        self.pending[name] = self.pending.get(name, 0) + 1
+        self.stats["requested"] += 1
+
+    def _busy(self, index: int) -> bool:
+        voice = self.voices[index]
+        if voice is None:
+            return False
+        if not self.channels[index].get_busy():
+            self.voices[index] = None
+            return False
+        return True
+
+    def _pick_channel(self, name: str, effect: dict) -> Optional[int]:
+        """재생할 채널 선택 (없으면 None)"""
+        busy = [i for i in range(len(self.channels)) if self._busy(i)]
+        # 효과음별 제한에 걸리면 같은 효과음의 가장 오래된 보이스 재사용
+        same = [i for i in busy if self.voices[i][0] == name]
+        if len(same) >= effect["max_voices"]:
+            return min(same, key=lambda i: self.voices[i][2])
+        if len(busy) < len(self.channels):
+            return next(i for i in range(len(self.channels)) if self.voices[i] is None)
+        # 채널이 꽉 찼으면 우선순위가 같거나 낮은 보이스 중 가장 낮고 오래된 것을 빼앗음
+        victims = [i for i in busy if self.voices[i][1] <= effect["priority"]]
+        if not victims:
+            return None
+        self.stats["stolen"] += 1
+        return min(victims, key=lambda i: (self.voices[i][1], self.voices[i][2]))
+
+    def flush(self):
+        """이번 프레임에 쌓인 요청 재생 (우선순위 높은 효과음부터)"""
+        if not self.pending:
+            return
+        pending = sorted(self.pending.items(),
+                         key=lambda item: -self.effects[item[0]]["priority"])
+        self.pending = {}
+        for name, count in pending:
+            effect = self.effects[name]
+            self.stats["merged"] += count - 1
+            index = self._pick_channel(name, effect)
+            if index is None:
+                self.stats["dropped"] += 1
+                continue
+            # 합쳐진 요청 수에 따라 볼륨 증가 (로그 스케일, 최대 1.0)
+            volume = min(1.0, effect["volume"] * (1.0 + MERGE_GAIN * math.log2(count)))
+            channel = self.channels[index]
+            channel.stop()
+            channel.set_volume(volume)
+            channel.play(effect["sound"])
+            self.voices[index] = (name, effect["priority"], self.serial)
+            self.serial += 1
+            self.stats["played"] += 1
+
+    def stop_all(self):
+        """모든 보이스 정지, 대기 중인 요청 취소"""
+        for channel in self.channels:
+            channel.stop()
+        self.voices = [None] * len(self.channels)
+        self.pending = {}
+
+
+class NullSoundManager:
+    """소리를 내지 않는 SoundManager (일괄 시뮬레이션용 월드)"""
+
+    def __init__(self):
+        self.stats = {"requested": 0}
+
+    def register(self, name: str, sound=None, **kwargs):
+        pass
+
+    def play(self, name: str):
+        self.stats["requested"] += 1
+
+    def flush(self):
+        pass
+
+    def stop_all(self):
+        pass
@@ -0,0 +1,49 @@
+"""
+미리 그려둔 스프라이트 이미지 캐시
+변형(적 색상, 총알 모양 등)마다 한 번만 그리고 화면 포맷으로 변환해
+모든 인스턴스가 같은 Surface를 공유한다.
+"""
+
+from typing import Callable, Dict, Hashable
+
+import pygame
+
+
+class SpriteCache:
+    """키별로 한 번만 그려지는 이미지 저장소"""
+
+    def __init__(self):
+        self._builders: Dict[Hashable, Callable[[], pygame.Surface]] = {}
+        self._images: Dict[Hashable, pygame.Surface] = {}
+
+    def register(self, key: Hashable, builder: Callable[[], pygame.Surface]):
+        """이미지를 그리는 함수 등록 (실제 그리기는 처음 사용할 때)"""
+        self._builders[key] = builder
+        self._images.pop(key, None)
+
+    def get(self, key: Hashable) -> pygame.Surface:
+        """캐시된 이미지 반환, 없으면 그려서 저장"""
+        image = self._images.get(key)
+        if image is None:
+            image = self._builders[key]()
+            # 화면이 있으면 디스플레이 포맷으로 변환해 빠른 blit 경로 사용
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            self._images[key] = image
+        return image
+
+    def preload(self):
+        """등록된 모든 이미지를 미리 그림"""
+        for key in self._builders:
+            self.get(key)
+
+    def clear(self):
+        """캐시 비우기 (화면 모드가 바뀐 경우 등)"""
+        self._images.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """등록된 키인지"""
+        return key in self._builders
+
+    def __len__(self) -> int:
+        return len(self._images)
@@ -0,0 +1,141 @@
+"""
+절차적 효과음 합성
+주파수 스윕, 노이즈, 엔벨로프로 효과음 파형을 NumPy 배열 연산으로 만들고
+믹서의 기본 포맷(샘플레이트, 비트, 채널)으로 변환한다. 만든 파형은
+파라미터를 키로 캐시 폴더에 저장해 다음 실행부터는 바로 불러온다.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+import numpy as np
+import pygame
+
+SYNTH_VERSION = 1  # 합성 방식이 바뀌면 올려서 캐시 무효화
+CACHE_DIR = os.environ.get(
+    "SHOOTER_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+# 게임 효과음 파라미터
+PRESETS: Dict[str, dict] = {
+    # 짧게 떨어지는 펄스음
+    "shoot": {"wave": "square", "duration": 0.12, "freq_start": 1200, "freq_end": 500,
+              "attack": 0.002, "decay": 0.04, "volume": 0.5},
+    # 저역 통과한 노이즈가 천천히 사라짐
+    "explosion": {"wave": "noise", "duration": 0.7, "lowpass": 24, "attack": 0.005,
+                  "decay": 0.18, "volume": 0.9, "seed": 1945},
+    # 적 총알: 낮은 삼각파 스윕
+    "enemy_shoot": {"wave": "triangle", "duration": 0.1, "freq_start": 700, "freq_end": 300,
+                    "attack": 0.002, "decay": 0.05, "volume": 0.6},
+    # 게임 오버: 떨림이 있는 하강음
+    "game_over": {"wave": "square", "duration": 1.4, "freq_start": 440, "freq_end": 80,
+                  "vibrato": 6.0, "attack": 0.01, "decay": 0.7, "volume": 0.6},
+}
+
+
+def mixer_format():
+    """(샘플레이트, 포맷, 채널) - 믹서가 초기화되지 않았으면 기본값"""
+    return pygame.mixer.get_init() or (44100, -16, 2)
+
+
+def render(params: dict, rate: int) -> np.ndarray:
+    """파라미터로 -1~1 범위 float32 모노 파형 생성"""
+    n = max(1, int(params["duration"] * rate))
+    t = np.arange(n, dtype=np.float64) / rate
+    wave = params["wave"]
+
+    if wave == "noise":
+        rng = np.random.default_rng(params.get("seed", 0))
+        samples = rng.uniform(-1.0, 1.0, n)
+        width = params.get("lowpass", 1)
+        if width > 1:
+            # 이동 평균으로 고역을 깎아 둔탁한 폭발음으로
+            samples = np.convolve(samples, np.ones(width) / width, mode="same")
+            samples /= max(np.abs(samples).max(), 1e-9)
+    else:
+        # 지수 주파수 스윕 (+ 선택적 비브라토)
+        f0, f1 = params["freq_start"], params["freq_end"]
+        freq = f0 * (f1 / f0) ** (t / params["duration"])
+        if params.get("vibrato"):
+            freq = freq * (1.0 + 0.04 * np.sin(2 * np.pi * params["vibrato"] * t))
+        phase = np.cumsum(freq) / rate  # 주기 단위 위상
+        if wave == "sine":
+            samples = np.sin(2 * np.pi * phase)
+        elif wave == "square":
+            samples = np.where(phase % 1.0 < 0.5, 1.0, -1.0)
+        elif wave == "triangle":
+            samples = 4.0 * np.abs(phase % 1.0 - 0.5) - 1.0
+        else:
+            raise ValueError("알 수 없는 파형: %s" % wave)
+
+    # 엔벨로프: 짧은 어택 후 지수 감쇠, 끝에서 클릭 방지용 페이드아웃
+    envelope = np.exp(-t / params.get("decay", params["duration"]))
+    attack = params.get("attack", 0.0)
+    if attack > 0:
+        envelope *= np.minimum(t / attack, 1.0)
+    fade = min(n, int(0.005 * rate))
+    if fade > 1:
+        envelope[-fade:] *= np.linspace(1.0, 0.0, fade)
+    return (samples * envelope * params.get("volume", 1.0)).astype(np.float32)
+
+
+def to_mixer_format(mono: np.ndarray, size: int, channels: int) -> np.ndarray:
+    """float 파형을 믹서 포맷 배열로 변환"""
+    if size == 32:  # float32
+        data = mono.astype(np.float32)
+    else:
+        bits = abs(size)
+        peak = 2 ** (bits - 1) - 1
+        data = np.round(mono * peak)
+        if size > 0:  # 부호 없는 포맷은 중앙값만큼 이동
+            data += peak + 1
+        dtype = {8: np.int8, 16: np.int16}[bits]
+        if size > 0:
+            dtype = {8: np.uint8, 16: np.uint16}[bits]
+        data = data.astype(dtype)
+    if channels > 1:
+        data = np.repeat(data[:, None], channels, axis=1)
+    return np.ascontiguousarray(data)
+
+
+def cache_key(params: dict, fmt) -> str:
+    """파라미터와 믹서 포맷으로 만든 캐시 키"""
+    blob = json.dumps({"v": SYNTH_VERSION, "params": params, "format": list(fmt)},
+                      sort_keys=True)
+    return hashlib.sha1(blob.encode()).hexdigest()[:16]
+
+
+def waveform(params: dict, cache_dir: Optional[str] = CACHE_DIR) -> np.ndarray:
+    """믹서 포맷 파형 (캐시에 있으면 불러오고 없으면 합성 후 저장)"""
+    rate, size, channels = fmt = mixer_format()
+    path = None
+    if cache_dir:
+        path = os.path.join(cache_dir, "sounds", cache_key(params, fmt) + ".npy")
+        if os.path.exists(path):
+            try:
+                return np.load(path)
+            except (OSError, ValueError):
+                pass  # 깨진 캐시 파일은 다시 합성
+    data = to_mixer_format(render(params, rate), size, channels)
+    if path:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp.npy"
+            np.save(tmp, data)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # 캐시를 못 써도 게임은 진행
+    return data
+
+
+def make_sound(params: dict, cache_dir: Optional[str] = CACHE_DIR) -> pygame.mixer.Sound:
+    """파라미터로 pygame Sound 생성"""
+    return pygame.sndarray.make_sound(waveform(params, cache_dir))
+
+
+def load_bank(presets: Dict[str, dict] = PRESETS,
+              cache_dir: Optional[str] = CACHE_DIR) -> Dict[str, pygame.mixer.Sound]:
+    """이름 -> Sound 효과음 묶음"""
+    return {name: make_sound(params, cache_dir) for name, params in presets.items()}
@@ -0,0 +1,77 @@
+"""
+고정 시간 간격(fixed timestep) 시뮬레이션
+실제 경과 시간을 누산기에 모아 1/60초 단위로 게임을 진행하고,
+남은 시간 비율(alpha)로 직전 상태와 현재 상태 사이를 보간해 그린다.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+SIM_HZ = 60
+MAX_FRAME_MS = 250  # 한 프레임에 따라잡을 최대 시간 (멈춤 후 폭주 방지)
+SNAP_DISTANCE = 64  # 이보다 멀리 움직이면 순간이동(재생성)으로 보고 보간하지 않음
+
+
+class FixedTimestep:
+    """누산기 기반 고정 간격 시계"""
+
+    def __init__(self, hz: int = SIM_HZ, max_frame_ms: int = MAX_FRAME_MS):
+        self.hz = hz
+        self.step_ms = 1000.0 / hz
+        self.max_frame_ms = max_frame_ms
+        self.accumulator = 0.0
+        self.steps = 0  # 진행한 시뮬레이션 스텝 수
+
+    def get_ticks(self) -> int:
+        """시뮬레이션 시간(ms) - 실제 시간과 무관"""
+        return self.steps * 1000 // self.hz
+
+    def tick(self):
+        """시뮬레이션 한 스텝 진행 기록"""
+        self.steps += 1
+
+    def advance(self, elapsed_ms: float) -> int:
+        """실제 경과 시간을 누적하고 이번 프레임에 진행할 스텝 수 반환"""
+        self.accumulator += min(elapsed_ms, self.max_frame_ms)
+        steps = int(self.accumulator // self.step_ms)
+        self.accumulator -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """마지막 스텝 이후 다음 스텝까지 진행 비율 (0~1)"""
+        return self.accumulator / self.step_ms
+
+
+class Interpolator:
+    """스텝 직전 위치를 기억해 두었다가 보간된 위치로 그림"""
+
+    def __init__(self):
+        self.prev: Dict[pygame.sprite.Sprite, Tuple[int, int]] = {}
+
+    def snapshot(self, sprites: Iterable[pygame.sprite.Sprite]):
+        """스텝 진행 전 위치 저장"""
+        self.prev = {sprite: sprite.rect.topleft for sprite in sprites}
+
+    def blit_list(self, sprites: Iterable[pygame.sprite.Sprite], alpha: float,
+                  bounds: Optional[pygame.Rect] = None) -> List[tuple]:
+        """(이미지, 보간 위치) 목록
+
+        bounds: 주면 보간 위치가 이 영역(화면)과 겹치지 않는 스프라이트는 뺌
+        """
+        prev = self.prev
+        result = []
+        for sprite in sprites:
+            rect = sprite.rect
+            x, y = rect.topleft
+            old = prev.get(sprite)
+            if old is not None and abs(x - old[0]) + abs(y - old[1]) < SNAP_DISTANCE:
+                x = old[0] + (x - old[0]) * alpha
+                y = old[1] + (y - old[1]) * alpha
+            x, y = int(x), int(y)
+            # 화면 밖 (위쪽에 대기 중인 적 등)
+            if bounds is not None and not bounds.colliderect((x, y, rect.width, rect.height)):
+                continue
+            result.append((sprite.image, (x, y)))
+        return result
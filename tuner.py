@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+난이도 튜닝 도구 (몬테카를로)
+적 수, 적 속도, 발사 간격, 적 총알 속도 조합마다 스크립트 봇으로 헤드리스 게임을
+여러 판 돌려 생존 시간, 격추 수, 화면 위 적 총알 수 분포를 모아 보고서로 만든다.
+게임은 프로세스 풀로 모든 코어에 나눠 실행한다.
+
+    python tuner.py                                   # 기본 조합 전체, 조합당 50판
+    python tuner.py --games 200 --policies dodge --target 30
+    python tuner.py --sweep enemies=6,8,10 --sweep shoot_delay=800-2000,1000-3000
+    python tuner.py --out report.json                 # .json 또는 .csv로 저장
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import headless
+import profiler
+
+MAX_FRAMES = 3600  # 한 판 최대 스텝 수 (60초), 끝까지 버티면 생존으로 기록
+FIRE_INTERVAL = 8  # 봇 발사 간격(스텝)
+
+# 기본 탐색 범위 (범위 값은 randrange 인자와 같이 끝값 제외)
+SWEEP = {
+    "enemies": [4, 8, 12, 16],
+    "enemy_speed": [(1, 3), (1, 4), (2, 5)],
+    "shoot_delay": [(500, 1500), (1000, 3000), (2000, 4000)],
+    "bullet_speed": [(2, 5), (3, 6), (4, 8)],
+}
+
+
+# ----- 봇 (월드, 프레임 번호, 판마다 새로 만드는 봇 상태 -> 입력 비트마스크) -----
+
+def _fire(frame: int) -> int:
+    return headless.INPUT_FIRE if frame % FIRE_INTERVAL == 0 else 0
+
+
+def policy_idle(world, frame: int, bot: dict) -> int:
+    """제자리에서 발사만"""
+    return _fire(frame)
+
+
+def policy_sweep(world, frame: int, bot: dict) -> int:
+    """좌우 왕복 (헤드리스 기본 입력과 같음)"""
+    return headless.autopilot(frame)
+
+
+def policy_random(world, frame: int, bot: dict) -> int:
+    """10스텝마다 방향을 무작위로 바꿈"""
+    if frame % 10 == 1:
+        bot["move"] = bot["rng"].choice((0, headless.INPUT_LEFT, headless.INPUT_RIGHT,
+                                         headless.INPUT_UP, headless.INPUT_DOWN))
+    return bot["move"] | _fire(frame)
+
+
+def policy_dodge(world, frame: int, bot: dict) -> int:
+    """가장 가까이 다가오는 적/적 총알 반대쪽으로 피하고, 없으면 가까운 적 아래로 이동"""
+    player = world.player.rect
+    danger = player.inflate(60, 160).move(0, -80)
+    threats = [sprite.rect for sprite in world.enemy_bullets if danger.colliderect(sprite.rect)]
+    threats += [sprite.rect for sprite in world.enemies if danger.colliderect(sprite.rect)]
+    mask = _fire(frame)
+    if threats:
+        nearest = max(threats, key=lambda rect: rect.bottom)
+        if nearest.centerx >= player.centerx and player.left > 0:
+            return mask | headless.INPUT_LEFT
+        return mask | headless.INPUT_RIGHT
+    targets = [sprite.rect for sprite in world.enemies if sprite.rect.bottom > 0]
+    if targets:
+        target = min(targets, key=lambda rect: abs(rect.centerx - player.centerx))
+        if target.centerx < player.centerx - 5:
+            return mask | headless.INPUT_LEFT
+        if target.centerx > player.centerx + 5:
+            return mask | headless.INPUT_RIGHT
+    return mask
+
+
+POLICIES: Dict[str, Callable] = {
+    "idle": policy_idle,
+    "sweep": policy_sweep,
+    "random": policy_random,
+    "dodge": policy_dodge,
+}
+
+
+# ----- 워커 프로세스 -----
+
+def _init_worker():
+    headless.use_dummy_drivers()
+
+
+def play_game(task: Tuple[dict, str, int, int]) -> Dict:
+    """한 판 실행 (task: 난이도, 봇 이름, 시드, 최대 스텝 수)"""
+    from world import World
+    difficulty, policy_name, seed, max_frames = task
+    world = World(seed=seed, difficulty=difficulty)
+    policy = POLICIES[policy_name]
+    bot = {"rng": random.Random(seed ^ 0x5EED), "move": 0}  # 게임 난수와 분리
+    bullets_total = bullets_peak = 0
+    for _ in range(max_frames):
+        if world.game_over:
+            break
+        world.step(policy(world, world.frame + 1, bot))
+        on_screen = len(world.enemy_bullets)
+        bullets_total += on_screen
+        bullets_peak = max(bullets_peak, on_screen)
+    # 생존 시간은 게임 오버 시각 (끝까지 버텼으면 최대 시간)
+    survived_ms = world.game_over_at if world.game_over else world.clock.get_ticks()
+    return {"survival": survived_ms / 1000.0, "survived": not world.game_over,
+            "kills": world.kills, "bullets_mean": bullets_total / max(world.frame, 1),
+            "bullets_peak": bullets_peak}
+
+
+# ----- 집계 / 보고서 -----
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def summarize(results: List[Dict]) -> Dict[str, float]:
+    """한 (난이도, 봇) 조합의 분포 요약"""
+    survival = sorted(r["survival"] for r in results)
+    kills = sorted(r["kills"] for r in results)
+    peaks = sorted(r["bullets_peak"] for r in results)
+    return {
+        "games": len(results),
+        "survival_mean": _mean(survival),
+        "survival_p10": profiler.percentile(survival, 10),
+        "survival_p50": profiler.percentile(survival, 50),
+        "survival_p90": profiler.percentile(survival, 90),
+        "survived_rate": sum(r["survived"] for r in results) / len(results),
+        "kills_mean": _mean(kills),
+        "kills_p50": profiler.percentile(kills, 50),
+        "bullets_mean": _mean([r["bullets_mean"] for r in results]),
+        "bullets_peak_p95": profiler.percentile(peaks, 95),
+    }
+
+
+def _format_value(value) -> str:
+    if isinstance(value, tuple):
+        return "%d-%d" % value
+    return str(value)
+
+
+def _parse_value(text: str):
+    if "-" in text:
+        low, high = text.split("-", 1)
+        return (int(low), int(high))
+    return int(text)
+
+
+def parse_sweep(items: List[str]) -> Dict[str, list]:
+    """--sweep 이름=값,값 (범위는 낮은값-높은값) 목록을 SWEEP에 덮어씀"""
+    sweep = dict(SWEEP)
+    for item in items:
+        name, _, values = item.partition("=")
+        if name not in SWEEP or not values:
+            raise SystemExit("알 수 없는 탐색 항목: %s (가능: %s)" % (item, ", ".join(SWEEP)))
+        sweep[name] = [_parse_value(value) for value in values.split(",")]
+    return sweep
+
+
+def run_sweep(sweep: Dict[str, list], policies: List[str], games: int,
+              max_frames: int = MAX_FRAMES, workers: int = 0, seed: int = 0) -> List[Dict]:
+    """모든 조합 x 봇 x games판을 프로세스 풀에서 실행하고 조합별 요약 반환"""
+    names = list(sweep)
+    configs = [dict(zip(names, values)) for values in itertools.product(*sweep.values())]
+    # 같은 판 번호는 모든 조합에서 같은 시드 (조합 간 비교의 분산을 줄임)
+    tasks = [(config, policy, seed + game, max_frames)
+             for config in configs for policy in policies for game in range(games)]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        results = list(executor.map(play_game, tasks, chunksize=chunksize))
+
+    rows = []
+    for i, (config, policy) in enumerate(itertools.product(configs, policies)):
+        row = {name: _format_value(config[name]) for name in names}
+        row["policy"] = policy
+        row.update(summarize(results[i * games:(i + 1) * games]))
+        rows.append(row)
+    return rows
+
+
+def print_report(rows: List[Dict], target: float = 0.0, top: int = 0):
+    """조합별 요약 표 (target을 주면 생존 중앙값이 target초에 가까운 순서)"""
+    if target:
+        rows = sorted(rows, key=lambda row: abs(row["survival_p50"] - target))
+    if top:
+        rows = rows[:top]
+    print("%-7s %-6s %-10s %-6s %-7s %6s %6s %6s %6s %5s %6s %7s %7s" % (
+        "enemies", "speed", "delay", "bullet", "policy", "mean_s", "p10_s", "p50_s", "p90_s",
+        "alive", "kills", "bullets", "peak95"))
+    for row in rows:
+        print("%-7s %-6s %-10s %-6s %-7s %6.1f %6.1f %6.1f %6.1f %4.0f%% %6.1f %7.1f %7.0f" % (
+            row["enemies"], row["enemy_speed"], row["shoot_delay"], row["bullet_speed"],
+            row["policy"], row["survival_mean"], row["survival_p10"], row["survival_p50"],
+            row["survival_p90"], row["survived_rate"] * 100, row["kills_mean"],
+            row["bullets_mean"], row["bullets_peak_p95"]))
+
+
+def save_report(rows: List[Dict], path: str):
+    """보고서 저장 (.json이면 JSON, 그 외에는 CSV)"""
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=1)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="슈팅 게임 난이도 몬테카를로 튜닝")
+    parser.add_argument("--games", type=int, default=50, help="조합/봇마다 실행할 판 수")
+    parser.add_argument("--frames", type=int, default=MAX_FRAMES, help="한 판 최대 스텝 수")
+    parser.add_argument("--policies", nargs="*", default=list(POLICIES), choices=list(POLICIES))
+    parser.add_argument("--sweep", action="append", default=[], metavar="NAME=V1,V2",
+                        help="탐색 범위 변경 (예: enemies=6,8 shoot_delay=800-2000)")
+    parser.add_argument("--workers", type=int, default=0, help="프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--seed", type=int, default=0, help="첫 판 시드")
+    parser.add_argument("--target", type=float, default=0.0,
+                        help="목표 생존 시간(초), 주면 가까운 조합부터 출력")
+    parser.add_argument("--top", type=int, default=0, help="출력할 조합 수 (0이면 전체)")
+    parser.add_argument("--out", default=None, help="보고서 파일 (.json 또는 .csv)")
+    args = parser.parse_args()
+
+    sweep = parse_sweep(args.sweep)
+    combos = math.prod(len(values) for values in sweep.values()) * len(args.policies)
+    print("%d개 조합 x %d판 = %d판 실행 (프로세스 %d개)" % (
+        combos, args.games, combos * args.games, args.workers or os.cpu_count() or 1),
+        file=sys.stderr)
+    start = time.perf_counter()
+    rows = run_sweep(sweep, args.policies, args.games, args.frames, args.workers, args.seed)
+    print("%.1f초 소요" % (time.perf_counter() - start), file=sys.stderr)
+
+    print_report(rows, args.target, args.top)
+    if args.out:
+        save_report(rows, args.out)
+        print("보고서 저장: %s" % args.out, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
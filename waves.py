@@ -0,0 +1,157 @@
+"""
+데이터 기반 적 출현 타임라인
+레벨 파일(JSON)의 출현 목록을 읽어 시각순으로 정렬된 배열로 컴파일하고,
+게임은 커서 위치부터 시각이 된 항목만 꺼내 간다. 아직 때가 안 됐으면
+비교 한 번으로 끝나므로 항목이 수천 개인 레벨도 프레임당 비용은
+실제로 나오는 적 수에만 비례한다.
+
+레벨 파일 예:
+
+    {"name": "Stage 1",
+     "waves": [
+       {"time": 1000, "enemy": "fighter", "x": 240},
+       {"time": 3000, "enemy": "scout", "x": 80, "count": 5, "interval": 250, "dx": 80,
+        "move": "sine", "amplitude": 50, "period": 1500, "fire": "none"}
+     ]}
+
+항목 필드
+- time: 레벨 시작 후 출현 시각(ms)
+- enemy: ENEMY_TYPES 이름 (색, 속도, 발사 간격, 이동/발사 패턴 기본값)
+- x, y: 출현 위치 (중심 x, 아래쪽 y - 기본은 화면 바로 위)
+- move: MOVES 이름, fire: FIRE_PATTERNS 중 하나 (적 종류 기본값을 덮어씀)
+- speed, shoot_delay, amplitude, period: 종류 기본값 덮어쓰기
+- count, interval, dx, dy: 편대 - count기를 interval(ms) 간격, (dx, dy)씩 옮겨서 출현
+- pattern: 탄막 패턴 이름 (patterns.PATTERNS, 정예 적 - 기본 발사와 함께 씀)
+
+보스 항목은 enemy 대신 boss에 patterns.BOSSES 이름을 쓴다 (x는 생략 가능):
+
+    {"time": 45000, "boss": "battleship"}
+"""
+
+import bisect
+import json
+import math
+from typing import Callable, Dict, List
+
+# 적 종류별 기본값
+ENEMY_TYPES: Dict[str, dict] = {
+    "scout": {"color": "green", "speed": 3, "shoot_delay": 2000, "move": "sine", "fire": "none"},
+    "fighter": {"color": "red", "speed": 2, "shoot_delay": 1500, "move": "straight",
+                "fire": "straight"},
+    "gunship": {"color": "yellow", "speed": 1, "shoot_delay": 1200, "move": "zigzag",
+                "fire": "aimed"},
+    "bomber": {"color": "purple", "speed": 1, "shoot_delay": 800, "move": "straight",
+               "fire": "straight"},
+}
+
+DEFAULTS = {"y": 0, "amplitude": 60, "period": 2000}
+FIRE_PATTERNS = ("none", "straight", "aimed")
+
+
+# 이동 패턴: (출현 후 경과 시간 ms, 항목) -> 출현 x 기준 가로 이동량
+def move_straight(t: int, spec: dict) -> float:
+    return 0.0
+
+
+def move_sine(t: int, spec: dict) -> float:
+    return spec["amplitude"] * math.sin(2.0 * math.pi * t / spec["period"])
+
+
+def move_zigzag(t: int, spec: dict) -> float:
+    phase = (t / spec["period"]) % 1.0
+    return spec["amplitude"] * (4.0 * abs(phase - 0.5) - 1.0)
+
+
+MOVES: Dict[str, Callable[[int, dict], float]] = {
+    "straight": move_straight,
+    "sine": move_sine,
+    "zigzag": move_zigzag,
+}
+
+
+def _expand(index: int, entry: dict) -> List[dict]:
+    """항목 하나를 기본값을 채운 출현 목록으로 (편대는 여러 개)"""
+    if "boss" in entry:
+        return [_boss(index, entry)]
+    kind = entry.get("enemy")
+    if kind not in ENEMY_TYPES:
+        raise ValueError("%d번 항목: 알 수 없는 적 종류 %r" % (index, kind))
+    if "time" not in entry or "x" not in entry:
+        raise ValueError("%d번 항목: time과 x는 필수입니다" % index)
+    spec = dict(DEFAULTS, **ENEMY_TYPES[kind])
+    spec.update(entry)
+    if spec["move"] not in MOVES:
+        raise ValueError("%d번 항목: 알 수 없는 이동 패턴 %r" % (index, spec["move"]))
+    if spec["fire"] not in FIRE_PATTERNS:
+        raise ValueError("%d번 항목: 알 수 없는 발사 패턴 %r" % (index, spec["fire"]))
+    if spec.get("pattern"):
+        import patterns
+        if spec["pattern"] not in patterns.PATTERNS:
+            raise ValueError("%d번 항목: 알 수 없는 탄막 패턴 %r" % (index, spec["pattern"]))
+
+    count = spec.pop("count", 1)
+    interval = spec.pop("interval", 0)
+    dx, dy = spec.pop("dx", 0), spec.pop("dy", 0)
+    spawns = []
+    for i in range(count):
+        spawn = dict(spec)
+        spawn["time"] = spec["time"] + i * interval
+        spawn["x"] = spec["x"] + i * dx
+        spawn["y"] = spec["y"] + i * dy
+        spawns.append(spawn)
+    return spawns
+
+
+def _boss(index: int, entry: dict) -> dict:
+    """보스 항목 검사 (보스 정의는 numpy가 필요한 patterns 모듈에 있으므로 필요할 때만 읽음)"""
+    import patterns
+    if entry["boss"] not in patterns.BOSSES:
+        raise ValueError("%d번 항목: 알 수 없는 보스 %r" % (index, entry["boss"]))
+    if "time" not in entry:
+        raise ValueError("%d번 항목: time은 필수입니다" % index)
+    return dict(entry)
+
+
+class Level:
+    """컴파일된 레벨 (시각순 출현 목록, 여러 월드가 같이 써도 됨)
+
+    진행 위치(커서)는 레벨이 아니라 각 월드가 가진다.
+    """
+
+    def __init__(self, entries: List[dict], name: str = "", path: str = ""):
+        spawns = []
+        for index, entry in enumerate(entries):
+            spawns.extend(_expand(index, entry))
+        # 같은 시각이면 파일에 적힌 순서 유지 (안정 정렬)
+        spawns.sort(key=lambda spawn: spawn["time"])
+        self.spawns = spawns
+        self.times = [spawn["time"] for spawn in spawns]
+        self.index_of = {id(spawn): index for index, spawn in enumerate(spawns)}  # 상태 저장용
+        self.name = name
+        self.path = path
+
+    def __len__(self) -> int:
+        return len(self.spawns)
+
+    def due(self, cursor: int, now: int) -> int:
+        """cursor부터 now까지 출현할 항목의 끝 위치 (없으면 cursor 그대로)"""
+        times = self.times
+        if cursor >= len(times) or times[cursor] > now:
+            return cursor
+        return bisect.bisect_right(times, now, cursor)
+
+    def seek(self, now: int) -> int:
+        """now 시각 직후의 커서 위치 (중간부터 시작할 때)"""
+        return bisect.bisect_right(self.times, now)
+
+    @property
+    def duration(self) -> int:
+        """마지막 출현 시각(ms)"""
+        return self.times[-1] if self.times else 0
+
+
+def load(path: str) -> Level:
+    """레벨 파일 읽어서 컴파일"""
+    with open(path) as f:
+        data = json.load(f)
+    return Level(data["waves"], data.get("name", ""), path)
@@ -0,0 +1,746 @@
+"""
+슈팅 게임 월드
+스프라이트 그룹, 난수, 시뮬레이션 시계, 이벤트 스케줄러, 오브젝트 풀을
+World 객체 하나가 모두 가지고 있어서 한 프로세스 안에서 여러 게임을
+서로 영향 없이 돌릴 수 있다. 화면 없이 동작하며, 그리기와 실제 소리 재생은
+실행 스크립트(game_with_sound_simplified.py)가 맡는다.
+
+    worlds = [World(seed=i) for i in range(32)]
+    for w in worlds:
+        w.run(3600)  # 기본 입력(headless.autopilot)으로 게임이 끝날 때까지
+"""
+
+import functools
+import math
+import random
+import struct
+from typing import Callable, Dict, Optional
+
+import pygame
+
+import animation
+import collision
+import headless
+import pools
+import scheduler
+import sound_manager
+import sprite_cache
+import timestep
+import waves
+
+# 화면 크기
+WIDTH, HEIGHT = 480, 600
+
+# 색상 정의
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+GREEN = (0, 255, 0)
+YELLOW = (255, 255, 0)
+PURPLE = (128, 0, 128)
+ORANGE = (255, 140, 0)
+GRAY = (130, 135, 140)
+DARK_GRAY = (60, 65, 70)
+
+# 난이도 기본값 (범위는 randrange 인자와 같이 끝값 제외)
+DIFFICULTY = {
+    "enemies": 8,                 # 시작할 때 적 수
+    "enemy_speed": (1, 4),        # 적 하강 속도
+    "shoot_delay": (1000, 3000),  # 적 발사 간격(ms)
+    "bullet_speed": (3, 6),       # 적 총알 속도
+}
+SCORES = {"enemy": 100, "boss": 5000}  # 격추 점수
+GAME_OVER_DELAY = 1000  # 게임 오버 후 종료까지 시간(ms) - 그동안 폭발 애니메이션 계속 진행
+
+# 스프라이트 이미지 (변형마다 한 번만 그려서 모든 월드가 공유)
+ENEMY_COLORS = [RED, GREEN, YELLOW, PURPLE]
+COLOR_NAMES = {"red": RED, "green": GREEN, "yellow": YELLOW, "purple": PURPLE}  # 레벨 파일용
+PLAYER_COLORS = [BLUE, ORANGE]  # 협동 모드 플레이어별 색 (최대 인원 수)
+
+
+def draw_player(color=BLUE):
+    # 비행기 모양 그리기
+    image = pygame.Surface((50, 40), pygame.SRCALPHA)
+    # 비행기 몸체
+    pygame.draw.rect(image, color, (10, 10, 30, 20))
+    # 비행기 날개
+    pygame.draw.polygon(image, color, [(0, 20), (10, 20), (10, 10), (20, 10)])
+    pygame.draw.polygon(image, color, [(40, 10), (40, 20), (50, 20), (40, 10)])
+    # 비행기 꼬리
+    pygame.draw.polygon(image, color, [(20, 0), (30, 0), (25, 10)])
+    # 비행기 엔진 불꽃
+    pygame.draw.polygon(image, RED, [(20, 30), (30, 30), (25, 40)])
+    return image
+
+
+def draw_enemy(color):
+    image = pygame.Surface((30, 30), pygame.SRCALPHA)
+    pygame.draw.rect(image, color, (0, 0, 30, 30))
+
+    # 적 비행기 디테일 추가
+    pygame.draw.rect(image, BLACK, (5, 15, 20, 5))
+    pygame.draw.rect(image, BLACK, (13, 5, 4, 20))
+    return image
+
+
+def draw_bullet():
+    image = pygame.Surface((5, 10), pygame.SRCALPHA)
+    pygame.draw.rect(image, WHITE, (0, 0, 5, 10))
+    return image
+
+
+def draw_enemy_bullet(bullet_type):
+    image = pygame.Surface((10, 10), pygame.SRCALPHA)
+    if bullet_type == 0:  # 원형
+        pygame.draw.circle(image, YELLOW, (5, 5), 5)
+    elif bullet_type == 1:  # 삼각형
+        pygame.draw.polygon(image, GREEN, [(5, 0), (0, 10), (10, 10)])
+    elif bullet_type == 2:  # 사각형
+        pygame.draw.rect(image, RED, (0, 0, 10, 10))
+    else:  # 다이아몬드
+        pygame.draw.polygon(image, PURPLE, [(5, 0), (10, 5), (5, 10), (0, 5)])
+    return image
+
+
+def draw_boss(size):
+    # 전함 모양: 선체 + 포탑 세 개
+    width, height = size
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.polygon(image, GRAY, [(0, height // 3), (width // 6, 0), (width * 5 // 6, 0),
+                                      (width, height // 3), (width * 5 // 6, height),
+                                      (width // 6, height)])
+    for i in range(3):
+        center = (width * (i + 1) // 4, height // 2)
+        pygame.draw.circle(image, DARK_GRAY, center, height // 5)
+        pygame.draw.rect(image, DARK_GRAY, (center[0] - 2, center[1], 4, height // 2 - 4))
+    return image
+
+
+# 화면을 만든 뒤 images.preload()를 호출하면 디스플레이 포맷으로 변환됨
+images = sprite_cache.SpriteCache()
+images.register("player", draw_player)
+for index, color in enumerate(PLAYER_COLORS[1:], 1):
+    images.register(("player", index), lambda color=color: draw_player(color))
+images.register("bullet", draw_bullet)
+for color in ENEMY_COLORS:
+    images.register(("enemy", color), lambda color=color: draw_enemy(color))
+for bullet_type in range(4):
+    images.register(("enemy_bullet", bullet_type),
+                    lambda bullet_type=bullet_type: draw_enemy_bullet(bullet_type))
+
+
+# 게임 클래스 (모든 스프라이트는 자신이 속한 월드를 통해서만 상태에 접근)
+class Player(pygame.sprite.Sprite):
+    def __init__(self, world, index: int = 0, count: int = 1):
+        super().__init__()
+        self.world = world
+        self.index = index  # 협동 모드 플레이어 번호
+        self.image = images.get("player" if index == 0 else ("player", index))
+        self.rect = self.image.get_rect()
+        # 여러 명이면 화면 아래를 같은 간격으로 나눠 배치
+        self.rect.centerx = WIDTH * (index + 1) // (count + 1)
+        self.rect.bottom = HEIGHT - 10
+        self.speed = 5
+        self.keys = 0  # 입력 비트마스크
+
+    def update(self):
+        keys = self.keys
+        if keys & headless.INPUT_LEFT and self.rect.left > 0:
+            self.rect.x -= self.speed
+        if keys & headless.INPUT_RIGHT and self.rect.right < WIDTH:
+            self.rect.x += self.speed
+        if keys & headless.INPUT_UP and self.rect.top > 0:
+            self.rect.y -= self.speed
+        if keys & headless.INPUT_DOWN and self.rect.bottom < HEIGHT:
+            self.rect.y += self.speed
+
+    def shoot(self):
+        world = self.world
+        if world.player_shots is not None:
+            # 총알 엔진: 5x10 총알의 왼쪽 위 좌표로 추가
+            world.player_shots.spawn(self.rect.centerx - 2, self.rect.top - 10, 0, -10)
+        else:
+            bullet = world.bullet_pool.acquire(self.rect.centerx, self.rect.top)
+            world.all_sprites.add(bullet)
+            world.bullets.add(bullet)
+        world.sounds.play("shoot")  # 총알 발사 소리 재생
+
+
+class Enemy(pools.PooledSprite):
+    def __init__(self, world):
+        super().__init__()
+        self.world = world
+        self.rect = pygame.Rect(0, 0, 30, 30)
+        self.shot_event = None
+        self.reset()
+
+    def reset(self):
+        rng = self.world.rng
+        difficulty = self.world.difficulty
+        self.color = rng.choice(ENEMY_COLORS)
+        self.image = images.get(("enemy", self.color))
+        self.rect.x = rng.randrange(WIDTH - self.rect.width)
+        self.rect.y = rng.randrange(-100, -40)
+        self.speedy = rng.randrange(*difficulty["enemy_speed"])
+        self.shoot_delay = rng.randrange(*difficulty["shoot_delay"])
+        self.last_shot = self.world.clock.get_ticks()
+        # 레벨 출현 정보 (무한 모드 적은 None)
+        self.spec = None
+        self.move = None
+        self.fire_pattern = "straight"
+        self.emitters = []  # 정예 적 탄막 패턴
+        self.schedule_shot()
+
+    def configure(self, spec: dict):
+        """레벨 출현 항목대로 설정 (reset 후 호출)"""
+        now = self.world.clock.get_ticks()
+        self.spec = spec
+        self.color = COLOR_NAMES[spec["color"]]
+        self.image = images.get(("enemy", self.color))
+        self.rect.centerx = spec["x"]
+        self.rect.bottom = spec["y"]
+        self.speedy = spec["speed"]
+        self.shoot_delay = spec["shoot_delay"]
+        self.move = waves.MOVES[spec["move"]]
+        self.fire_pattern = spec["fire"]
+        self.spawned_at = self.last_shot = now
+        if spec.get("pattern"):
+            import patterns
+            self.emitters = patterns.emitters([spec["pattern"]], now + spec["shoot_delay"])
+        self.schedule_shot()
+
+    def update(self):
+        self.rect.y += self.speedy
+        if self.move is not None:
+            # 레벨 적: 이동 패턴을 따르고 화면 아래로 나가면 사라짐
+            t = self.world.clock.get_ticks() - self.spawned_at
+            self.rect.centerx = self.spec["x"] + int(self.move(t, self.spec))
+            if self.rect.top > HEIGHT:
+                self.kill()
+            elif self.emitters and self.rect.top >= 0:
+                self.world.fire_patterns(self.emitters, self.rect.center)
+        elif self.rect.top > HEIGHT:
+            rng = self.world.rng
+            self.rect.x = rng.randrange(WIDTH - self.rect.width)
+            self.rect.y = rng.randrange(-100, -40)
+            self.speedy = rng.randrange(*self.world.difficulty["enemy_speed"])
+
+    # 다음 발사를 스케줄러에 예약 (shoot_delay가 지난 첫 프레임)
+    def schedule_shot(self):
+        events = self.world.events
+        events.cancel(self.shot_event)
+        self.shot_event = None
+        if self.fire_pattern != "none":
+            self.shot_event = events.schedule(self.last_shot + self.shoot_delay + 1, self.fire)
+
+    # 적 총알 발사 (예약 시각에 스케줄러가 호출)
+    def fire(self):
+        self.last_shot = self.world.clock.get_ticks()
+        self.shoot()
+        self.schedule_shot()
+
+    def kill(self):
+        self.world.events.cancel(self.shot_event)
+        self.shot_event = None
+        super().kill()
+
+    def shoot(self):
+        world = self.world
+        bullet_type = world.rng.randint(0, 3)  # 0: 원형, 1: 삼각형, 2: 사각형, 3: 다이아몬드
+        speed = world.rng.randrange(*world.difficulty["bullet_speed"])
+        speedx, speedy = 0, speed
+        target = world.target(self.rect.center) if self.fire_pattern == "aimed" else None
+        if target is not None:
+            # 플레이어 쪽으로 (정수 속도, 아래 방향은 최소 1)
+            dx = target[0] - self.rect.centerx
+            dy = target[1] - self.rect.bottom
+            distance = max(1.0, (dx * dx + dy * dy) ** 0.5)
+            speedx = round(speed * dx / distance)
+            speedy = max(1, round(speed * dy / distance))
+        if world.enemy_shots is not None:
+            world.enemy_shots.spawn(self.rect.centerx - 5, self.rect.bottom, speedx, speedy,
+                                    bullet_type)
+        else:
+            enemy_bullet = world.enemy_bullet_pool.acquire(self.rect.centerx, self.rect.bottom,
+                                                           bullet_type, speedy, speedx)
+            world.all_sprites.add(enemy_bullet)
+            world.enemy_bullets.add(enemy_bullet)
+        world.sounds.play("enemy_shoot")  # 적 총알 발사 소리 재생
+
+
+class Bullet(pools.PooledSprite):
+    def __init__(self, world, x, y):
+        super().__init__()
+        self.world = world
+        self.image = images.get("bullet")
+        self.rect = self.image.get_rect()
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.rect.centerx = x
+        self.rect.bottom = y
+        self.speedy = -10
+
+    def update(self):
+        self.rect.y += self.speedy
+        if self.rect.bottom < 0:
+            self.kill()
+
+
+class EnemyBullet(pools.PooledSprite):
+    def __init__(self, world, x, y, bullet_type, speedy=None, speedx=0):
+        super().__init__()
+        self.world = world
+        self.rect = pygame.Rect(0, 0, 10, 10)
+        self.reset(x, y, bullet_type, speedy, speedx)
+
+    def reset(self, x, y, bullet_type, speedy=None, speedx=0):
+        self.image = images.get(("enemy_bullet", bullet_type))
+        self.bullet_type = bullet_type
+        self.rect.centerx = x
+        self.rect.top = y
+        if speedy is None:
+            speedy = self.world.rng.randrange(*self.world.difficulty["bullet_speed"])
+        self.speedy = speedy
+        self.speedx = speedx
+
+    def update(self):
+        self.rect.y += self.speedy
+        if self.speedx:
+            self.rect.x += self.speedx
+            if self.rect.right < 0 or self.rect.left > WIDTH:
+                self.kill()
+                return
+        if self.rect.top > HEIGHT:
+            self.kill()
+
+
+# 폭발 효과 클래스
+EXPLOSION_COLORS = [RED, YELLOW, (255, 165, 0), WHITE]  # 빨강 -> 노랑 -> 주황 -> 흰색
+
+
+class Explosion(pools.PooledSprite):
+    def __init__(self, world, center, size):
+        super().__init__()
+        self.world = world
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.frame_event = None
+        self.reset(center, size)
+
+    def reset(self, center, size):
+        self.size = size
+        # 크기별로 한 번만 그려둔 프레임 공유
+        self.frames = animation.circle_frames(size, EXPLOSION_COLORS)
+        self.image = self.frames[0]
+        self.rect.size = (size, size)
+        self.rect.center = center
+        self.frame = 0
+        self.start = self.world.clock.get_ticks()
+        self.frame_rate = 50  # 프레임 속도 조절
+        self.schedule_frame()
+
+    # 다음 프레임 전환 예약 (시작 시각 기준이라 오차가 쌓이지 않음)
+    def schedule_frame(self):
+        events = self.world.events
+        events.cancel(self.frame_event)
+        due = self.start + (self.frame + 1) * self.frame_rate
+        self.frame_event = events.schedule(due, self.next_frame)
+
+    def next_frame(self):
+        # 풀에 보관 중인 폭발은 무시
+        if not self.alive():
+            return
+        self.frame += 1
+        if self.frame >= len(self.frames):
+            self.kill()  # 애니메이션 종료
+            return
+        self.image = self.frames[self.frame]
+        self.schedule_frame()
+
+
+def boss_image(name: str) -> pygame.Surface:
+    """보스 이미지 (보스 종류마다 처음 쓸 때 등록)"""
+    import patterns
+    key = ("boss", name)
+    if key not in images:
+        images.register(key, lambda size=patterns.BOSSES[name]["size"]: draw_boss(size))
+    return images.get(key)
+
+
+class Boss(pygame.sprite.Sprite):
+    """여러 발 맞아야 격추되는 보스 (patterns.BOSSES 정의를 따름, numpy 필요)
+
+    체력이 단계 기준 이하로 떨어질 때마다 다음 단계의 탄막 패턴으로 바뀐다.
+    """
+
+    def __init__(self, world, name: str, x: Optional[int] = None):
+        super().__init__()
+        import patterns
+        self.world = world
+        self.name = name
+        self.spec = patterns.BOSSES[name]
+        self.image = boss_image(name)
+        self.rect = self.image.get_rect()
+        self.home_x = x if x is not None else WIDTH // 2
+        self.rect.centerx = self.home_x
+        self.rect.bottom = 0
+        self.hp = self.max_hp = self.spec["hp"]
+        self.arrived_at = None  # 등장 위치에 도착한 시각
+        self.phase = -1
+        self.emitters = []
+        self.next_phase()
+
+    def next_phase(self):
+        import patterns
+        self.phase += 1
+        names = self.spec["phases"][self.phase]["patterns"]
+        self.emitters = patterns.emitters(names, self.world.clock.get_ticks())
+
+    def update(self):
+        spec = self.spec
+        # 위에서 내려오는 동안은 쏘지 않음
+        if self.rect.centery < spec["y"]:
+            self.rect.y += spec["enter_speed"]
+            return
+        now = self.world.clock.get_ticks()
+        if self.arrived_at is None:
+            self.arrived_at = now
+        # 좌우로 천천히 왕복
+        sway = max(0, min(self.home_x, WIDTH - self.home_x) - self.rect.width // 2 - 10)
+        t = now - self.arrived_at
+        self.rect.centerx = self.home_x + int(sway * math.sin(2.0 * math.pi * t / spec["period"]))
+        self.world.fire_patterns(self.emitters, self.rect.center)
+
+    def hit(self, damage: int = 1):
+        """피격 처리 (체력이 다하면 격추)"""
+        self.hp -= damage
+        if self.hp <= 0:
+            self.world.boss_destroyed(self)
+            return
+        phases = self.spec["phases"]
+        while (self.phase + 1 < len(phases)
+               and self.hp <= self.max_hp * phases[self.phase]["until"]):
+            self.next_phase()
+
+
+def _no_mark(phase):
+    pass
+
+
+class World:
+    """게임 하나의 전체 상태
+
+    seed: 난수 시드 (같은 시드와 입력이면 항상 같은 결과)
+    difficulty: DIFFICULTY 중 바꿀 항목 (예: {"enemies": 12})
+    pixel_collision: 플레이어 피격을 투명 픽셀을 뺀 모양으로 판정 (False면 사각형)
+    level: waves.Level - 주면 처음 적 배치/격추 후 재출현 대신 레벨 타임라인대로 출현
+    players: 플레이어 수 (협동 모드, 최대 len(PLAYER_COLORS)) - 모두 격추되면 게임 오버
+    sounds: 효과음 재생 요청을 받을 SoundManager (None이면 소리 없음)
+    profiler: 단계별 시간을 기록할 FrameProfiler (None이면 측정 안 함)
+    """
+
+    def __init__(self, seed: Optional[int] = None, bullet_engine: bool = False,
+                 pool_size: int = pools.DEFAULT_POOL_SIZE, sounds=None, profiler=None,
+                 difficulty: Optional[dict] = None, pixel_collision: bool = True,
+                 level: Optional[waves.Level] = None, players: int = 1):
+        self.seed = seed
+        self.level = level
+        self.level_cursor = 0  # 다음에 출현할 레벨 항목 위치
+        self.pixel_collision = pixel_collision
+        self.difficulty = dict(DIFFICULTY, **(difficulty or {}))
+        self.rng = random.Random(seed)
+        self.clock = timestep.FixedTimestep()  # 게임 로직은 이 시계의 시뮬레이션 시간 사용
+        self.events = scheduler.Scheduler()  # 적 발사, 폭발 프레임 등 시간 이벤트
+        self.sounds = sounds if sounds is not None else sound_manager.NullSoundManager()
+        self.mark = profiler.mark if profiler is not None else _no_mark
+        self.frame = 0  # 진행한 스텝 수
+        self.kills = 0  # 격추한 적 수
+        self.score = 0
+
+        # 오브젝트 풀 (kill된 스프라이트 재사용)
+        self.bullet_pool = pools.SpritePool(functools.partial(Bullet, self), pool_size)
+        self.enemy_bullet_pool = pools.SpritePool(functools.partial(EnemyBullet, self), pool_size)
+        self.enemy_pool = pools.SpritePool(functools.partial(Enemy, self), pool_size)
+        self.explosion_pool = pools.SpritePool(functools.partial(Explosion, self), pool_size)
+        # 난수를 쓰지 않는 풀만 미리 채움 (시드별 결과가 풀 크기와 무관하도록)
+        self.bullet_pool.prefill(32, 0, 0)
+        self.explosion_pool.prefill(16, (0, 0), 30)
+
+        # NumPy 총알 엔진 (선택 사항, numpy 필요)
+        self.player_shots = self.enemy_shots = None
+        self.pattern_shots = None  # 탄막 패턴 총알 (총알 엔진이 없을 때 처음 쓸 때 생성)
+        if bullet_engine:
+            import bullet_engine as engine
+            bounds = pygame.Rect(0, 0, WIDTH, HEIGHT)
+            self.player_shots = engine.BulletEngine([images.get("bullet")], bounds)
+            self.enemy_shots = engine.BulletEngine(
+                [images.get(("enemy_bullet", bullet_type)) for bullet_type in range(4)], bounds)
+
+        # 스프라이트 그룹 생성
+        self.all_sprites = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.bullets = pygame.sprite.Group()
+        self.enemy_bullets = pygame.sprite.Group()
+        self.bosses = pygame.sprite.Group()
+
+        # 플레이어 생성 (self.player는 1번 플레이어)
+        if not 1 <= players <= len(PLAYER_COLORS):
+            raise ValueError("플레이어 수는 1~%d: %d" % (len(PLAYER_COLORS), players))
+        self.players = [Player(self, index, players) for index in range(players)]
+        self.player = self.players[0]
+        self.all_sprites.add(*self.players)
+
+        # 적 생성 (레벨이 있으면 타임라인에서)
+        if level is None:
+            for _ in range(self.difficulty["enemies"]):
+                self.spawn_enemy()
+
+        # 게임 오버 상태 (게임 오버된 시뮬레이션 시각, 진행 중이면 None)
+        self.game_over_at: Optional[int] = None
+        self.cleared_at: Optional[int] = None  # 레벨을 끝낸 시각
+
+    def spawn_enemy(self) -> Enemy:
+        """풀에서 적을 꺼내 추가"""
+        enemy = self.enemy_pool.acquire()
+        self.all_sprites.add(enemy)
+        self.enemies.add(enemy)
+        return enemy
+
+    def spawn_due(self, now: int):
+        """레벨 타임라인에서 now까지 출현할 적 추가"""
+        level = self.level
+        end = level.due(self.level_cursor, now)
+        for spec in level.spawns[self.level_cursor:end]:
+            if "boss" in spec:
+                self.spawn_boss(spec["boss"], spec.get("x"))
+            else:
+                self.spawn_enemy().configure(spec)
+        self.level_cursor = end
+
+    def spawn_boss(self, name: str, x: Optional[int] = None) -> Boss:
+        """보스 추가 (화면 위에서 내려옴)"""
+        boss = Boss(self, name, x)
+        self.all_sprites.add(boss)
+        self.bosses.add(boss)
+        return boss
+
+    def boss_destroyed(self, boss: Boss):
+        """보스 격추: 큰 폭발 여러 개"""
+        rect = boss.rect
+        for dx, dy in ((0, 0), (-rect.width // 3, -8), (rect.width // 3, 8)):
+            self.explode((rect.centerx + dx, rect.centery + dy), 60)
+        self.sounds.play("explosion")
+        self.kills += 1
+        self.score += SCORES["boss"]
+        boss.kill()
+
+    def pattern_engine(self):
+        """탄막 패턴 총알을 넣을 엔진 (총알 엔진 모드면 적 총알 엔진과 공유)"""
+        if self.enemy_shots is not None:
+            return self.enemy_shots
+        if self.pattern_shots is None:
+            import bullet_engine as engine
+            self.pattern_shots = engine.BulletEngine(
+                [images.get(("enemy_bullet", bullet_type)) for bullet_type in range(4)],
+                pygame.Rect(0, 0, WIDTH, HEIGHT))
+        return self.pattern_shots
+
+    def fire_patterns(self, emitters, origin):
+        """발사기들을 origin 위치에서 진행 (플레이어를 겨냥하는 패턴은 플레이어 중심으로)"""
+        engine = self.pattern_engine()
+        now = self.clock.get_ticks()
+        target = self.target(origin)
+        for emitter in emitters:
+            emitter.update(engine, now, origin, target)
+
+    def bullet_engines(self) -> list:
+        """사용 중인 총알 엔진 전체 (그리기용)"""
+        return [engine for engine in (self.player_shots, self.enemy_shots, self.pattern_shots)
+                if engine is not None]
+
+    def enemy_engines(self) -> list:
+        """적 총알이 들어 있는 엔진들 (피격 판정/관측용)"""
+        return [engine for engine in (self.enemy_shots, self.pattern_shots) if engine is not None]
+
+    @property
+    def level_done(self) -> bool:
+        """레벨의 모든 적이 나왔고 남은 적(보스 포함)이 없는지"""
+        return (self.level is not None and self.level_cursor >= len(self.level)
+                and not self.enemies and not self.bosses)
+
+    def explode(self, center, size: int):
+        """폭발 효과 생성"""
+        self.all_sprites.add(self.explosion_pool.acquire(center, size))
+
+    def target(self, origin) -> Optional[tuple]:
+        """origin에서 가장 가까운 살아 있는 플레이어 중심 (모두 격추됐으면 None)"""
+        alive = [player.rect.center for player in self.players if player.alive()]
+        if len(alive) > 1:
+            return min(alive, key=lambda center: (center[0] - origin[0]) ** 2
+                       + (center[1] - origin[1]) ** 2)
+        return alive[0] if alive else None
+
+    # 플레이어 사망 처리 (협동 모드는 마지막 플레이어가 격추되면 게임 오버)
+    def player_died(self, player: Optional[Player] = None):
+        player = player or self.player
+        self.sounds.play("game_over")  # 게임 오버 소리 재생
+        self.explode(player.rect.center, 50)
+        player.kill()
+        if not any(member.alive() for member in self.players):
+            self.game_over_at = self.clock.get_ticks()
+
+    def step(self, keys) -> bool:
+        """시뮬레이션 한 스텝 진행, 게임 오버 후 종료 시점이면 False
+
+        keys: 입력 비트마스크 (협동 모드는 플레이어별 비트마스크 시퀀스)
+        """
+        self.clock.tick()
+        self.frame += 1
+        if self.game_over_at is None:
+            inputs = (keys,) if isinstance(keys, int) else keys
+            for player, player_keys in zip(self.players, inputs):
+                if not player.alive():
+                    continue
+                if player_keys & headless.INPUT_FIRE:
+                    player.shoot()
+                player.keys = player_keys
+
+        # 업데이트 (엔진 총알은 스프라이트보다 먼저 이동 -> 이번 프레임에 쏜 적 총알은 다음 프레임부터 이동)
+        for engine in self.bullet_engines():
+            engine.update()
+        self.all_sprites.update()
+
+        # 시각이 된 이벤트 실행 (적 발사, 폭발 프레임 전환), 레벨 적 출현
+        now = self.clock.get_ticks()
+        self.events.run_due(now)
+        if self.level is not None:
+            self.spawn_due(now)
+        self.mark("update")
+
+        # 충돌 체크 (총알과 적)
+        if self.player_shots is not None:
+            hit_centers = [center for center, _ in self.player_shots.collide_group(self.enemies)]
+        else:
+            hits = collision.groupcollide(self.bullets, self.enemies, True, True)
+            hit_centers = [hit.rect.center for hit in hits]
+        self.kills += len(hit_centers)
+        self.score += len(hit_centers) * SCORES["enemy"]
+        for center in hit_centers:
+            self.sounds.play("explosion")  # 폭발 소리 재생
+            self.explode(center, 30)
+            # 무한 모드: 새로운 적 생성
+            if self.level is None:
+                self.spawn_enemy()
+
+        # 충돌 체크 (총알과 보스)
+        if self.bosses:
+            self.shoot_bosses()
+
+        # 게임 오버 후에는 화면만 계속 진행
+        if self.game_over_at is not None:
+            self.mark("collide")
+            return self.clock.get_ticks() - self.game_over_at < GAME_OVER_DELAY
+
+        for player in self.players:
+            if player.alive() and self.player_hit(player):
+                self.player_died(player)
+        self.mark("collide")
+
+        # 레벨 클리어 후에도 잠시 화면 진행
+        if self.cleared_at is None and self.game_over_at is None and self.level_done:
+            self.cleared_at = now
+        if self.cleared_at is not None:
+            return now - self.cleared_at < GAME_OVER_DELAY
+        return True
+
+    def shoot_bosses(self):
+        """플레이어 총알과 보스 충돌 - 보스에 겹친 총알은 모두 제거되고 한 발마다 체력 감소"""
+        if self.player_shots is not None:
+            boss_hits = [boss for _, hit in self.player_shots.collide_group(self.bosses, False)
+                         for boss in hit]
+        else:
+            boss_hits = [boss for hit in collision.groupcollide(
+                self.bullets, self.bosses, True, False).values() for boss in hit]
+        for boss in boss_hits:
+            if boss.alive():
+                boss.hit()
+
+    def player_hit(self, player: Player) -> bool:
+        """플레이어가 적, 보스, 적 총알에 맞았는지 (맞은 총알은 제거)"""
+        # 충돌 체크 (플레이어와 적) - 사각형으로 후보를 고른 뒤 픽셀 마스크로 확인
+        masks = self.pixel_collision
+        hits = collision.spritecollide(player, self.enemies, False, masks)
+        if self.bosses:
+            hits = collision.spritecollide(player, self.bosses, False, masks) or hits
+
+        # 충돌 체크 (플레이어와 적 총알)
+        for engine in self.enemy_engines():
+            if masks:
+                hits = engine.collide_mask(player.rect, collision.sprite_mask(player), True) or hits
+            else:
+                hits = engine.collide_rect(player.rect, True) or hits
+        if self.enemy_shots is None:
+            hits = collision.spritecollide(player, self.enemy_bullets, True, masks) or hits
+        return bool(hits)
+
+    def run(self, frames: int, inputs: Callable[[int], int] = headless.autopilot) -> int:
+        """inputs(프레임 번호)를 입력으로 최대 frames 스텝 진행, 진행한 스텝 수 반환
+
+        프레임 번호는 1부터 시작 (headless.run_headless와 같은 입력 순서)
+        """
+        for _ in range(frames):
+            if not self.step(inputs(self.frame + 1)):
+                break
+        return self.frame
+
+    @property
+    def lives(self) -> int:
+        """남은 기체 수 (지금은 살아 있는 플레이어 수)"""
+        return sum(1 for player in self.players if player.alive())
+
+    @property
+    def game_over(self) -> bool:
+        return self.game_over_at is not None
+
+    def entity_counts(self) -> Dict[str, int]:
+        """그룹별 엔티티 수 (엔진 총알 포함)"""
+        counts = {"sprites": len(self.all_sprites), "enemies": len(self.enemies),
+                  "bullets": len(self.bullets), "enemy_bullets": len(self.enemy_bullets)}
+        if self.player_shots is not None:
+            counts["bullets"] += len(self.player_shots)
+        for engine in self.enemy_engines():
+            counts["enemy_bullets"] += len(engine)
+        return counts
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """풀별 재사용/생성 횟수"""
+        return {"bullet": self.bullet_pool.stats(),
+                "enemy_bullet": self.enemy_bullet_pool.stats(),
+                "enemy": self.enemy_pool.stats(),
+                "explosion": self.explosion_pool.stats()}
+
+    def draw(self, surface: pygame.Surface):
+        """월드 전체를 surface에 그림 (보간 없이, 화면 밖 렌더링용)"""
+        surface.fill(BLACK)
+        self.all_sprites.draw(surface)
+        for engine in self.bullet_engines():
+            engine.draw(surface)
+
+    def digest(self) -> str:
+        """현재 상태 해시 (재현성 확인용)
+
+        스프라이트 위치에 더해 점수, 남은 기체, 난수 상태, 엔진 총알 배열까지 포함한다.
+        """
+        _, internal, gauss = self.rng.getstate()
+        extra = [b"score:%d,%d,%d;" % (self.score, self.kills, self.lives),
+                 struct.pack("<625I", *internal), repr(gauss).encode()]
+        for name, engine in (("player", self.player_shots), ("enemy", self.enemy_shots),
+                             ("pattern", self.pattern_shots)):
+            if engine is None:
+                continue
+            n = engine.count
+            extra.append(b"%s:%d;" % (name.encode(), n))
+            extra.extend(getattr(engine, field)[:n].tobytes()
+                         for field in ("x", "y", "vx", "vy", "kind"))
+        return headless.state_digest(self.all_sprites, extra)